@@ -1,18 +1,672 @@
 import os
+import copy
 import json
+import random
 import time
 import hashlib
+import logging
 import re
-from typing import List, Dict, Any, Tuple, Optional
+import threading
+import urllib.parse
+from concurrent.futures import Future
+from functools import lru_cache
+from itertools import chain, islice
+from string import Template
+from types import MappingProxyType
+from typing import List, Dict, Any, Tuple, Optional, Iterator, Iterable, Callable
 
 import requests
 from datetime import datetime, UTC
 
-import google.generativeai as genai
 from easemytrip_service import EaseMyTripService
 from firebase_service import firebase_service
+from utils import AdaptiveTokenBucket, build_http_session
+
+logger = logging.getLogger(__name__)
 # Lazy import VertexAIClient to avoid import errors if vertexai isn't installed
 
+GOOGLE_SEARCH_URL = "https://www.google.com/search?q="
+GOOGLE_MAPS_SEARCH_URL = "https://www.google.com/maps/search/?api=1&query="
+GOOGLE_MAPS_PLACE_URL = "https://www.google.com/maps/place/?q=place_id:"
+GOOGLE_PLACES_TEXT_SEARCH_URL = "https://maps.googleapis.com/maps/api/place/textsearch/json"
+GOOGLE_PLACES_PHOTO_URL = "https://maps.googleapis.com/maps/api/place/photo"
+# Client-side throttle for Places calls; the per-second quota is shared by every request thread.
+# The rate backs off when Google reports OVER_QUERY_LIMIT and creeps back up on successful responses.
+PLACES_RATE_LIMITER = AdaptiveTokenBucket(capacity=50, rate=50, min_rate=1, max_rate=100)
+# OVER_QUERY_LIMIT retries: exponential backoff (seconds) with jitter, capped
+PLACES_QUOTA_RETRIES = 3
+PLACES_BACKOFF_BASE = 0.5
+PLACES_BACKOFF_CAP = 8
+
+# Places result fields the suggestion builders read; everything else is dropped before caching
+PLACES_RESULT_FIELDS = ('place_id', 'name', 'formatted_address', 'vicinity', 'rating', 'user_ratings_total',
+                        'price_level', 'types', 'business_status')
+# Key namespace for Places text search responses in the shared (cross-worker) cache
+PLACES_SHARED_CACHE_PREFIX = "v1:gmaps:textsearch:"
+# Text searches sent concurrently per wave; further waves only go out while results are still short
+PLACES_QUERY_WAVE_SIZE = 2
+# Keep-alive pool for Google Maps calls; sized for the concurrent Places text searches
+MAPS_POOL_MAXSIZE = 16
+
+# Shared decoder for pulling the first JSON value out of model responses
+JSON_DECODER = json.JSONDecoder()
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module is used without it
+    orjson = None
+
+try:
+    import redis
+except ImportError:  # redis is optional; only the in-process caches are used without it
+    redis = None
+
+if orjson is not None:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing handlers still apply
+    json_loads = orjson.loads
+
+    def json_dumps_bytes(obj: Any) -> bytes:
+        """Compact UTF-8 JSON bytes for caches and wire payloads (skips the str round-trip with orjson)"""
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    def json_dumps(obj: Any) -> str:
+        """Compact JSON for prompts and payloads (C-accelerated when orjson is installed)"""
+        return json_dumps_bytes(obj).decode()
+else:
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> str:
+        """Compact JSON for prompts and payloads (C-accelerated when orjson is installed)"""
+        return json.dumps(obj, default=str, ensure_ascii=False, separators=(',', ':'))
+
+    def json_dumps_bytes(obj: Any) -> bytes:
+        """Compact UTF-8 JSON bytes for caches and wire payloads (skips the str round-trip with orjson)"""
+        return json_dumps(obj).encode()
+
+@lru_cache(maxsize=512)
+def _quote_location(location: str) -> str:
+    """URL-encode a location name for a query value or path segment; the same few cities repeat across every request"""
+    return urllib.parse.quote(location, safe='')
+
+# Substring matchers for classifying EaseMyTrip booking links (checked in this order)
+BUS_TERMS_RE = re.compile('|'.join(map(re.escape, ['bus', 'travels', 'coach', 'ksrtc', 'vrl', 'orange', 'srs', 'kpn', 'neeta'])))
+TRAIN_TERMS_RE = re.compile('|'.join(map(re.escape, ['train', 'express', 'railway', 'rail'])))
+FLIGHT_TERMS_RE = re.compile('|'.join(map(re.escape, ['flight', 'airline', 'airways', 'air', 'emirates', 'qatar', 'indi', 'jet', 'spice'])))
+
+# Keywords for deciding whether a suggestion is a given transport type (substring match on name + description)
+TRANSPORT_DETECTION_TERMS = {
+    'flight': ['airline', 'airlines', 'airways', 'aviation', 'aircraft', 'flight', 'air', 'fly', 'flying', 'airport', 'terminal', 'gate', 'departure', 'arrival', 'boarding', 'check-in', 'baggage', 'seat', 'cabin', 'pilot', 'crew', 'passenger', 'booking', 'reservation'],
+    'train': ['railway', 'railways', 'train', 'trains', 'rail', 'metro', 'subway', 'locomotive', 'station', 'platform', 'express', 'mail', 'passenger', 'booking', 'ticket', 'fare', 'route', 'journey'],
+    'bus': ['bus', 'buses', 'coach', 'coaches', 'transit', 'public transport', 'shuttle', 'redbus', 'travels', 'operator', 'transport', 'booking', 'ticket', 'fare', 'route', 'journey', 'smartbus', 'intrcity', 'orange', 'kpn', 'parveen'],
+    'car': ['rental', 'car', 'vehicle', 'hire', 'drive', 'automobile', 'taxi', 'cab'],
+}
+TRANSPORT_TERMS_RE = MappingProxyType({
+    transport_type: re.compile('|'.join(map(re.escape, terms)))
+    for transport_type, terms in TRANSPORT_DETECTION_TERMS.items()
+})
+# Same tables without the generic words several types share ('booking', 'fare', ...); only these hits are decisive
+TRANSPORT_DISTINCTIVE_RE = MappingProxyType({
+    transport_type: re.compile('|'.join(
+        re.escape(term) for term in terms
+        if not any(term in other_terms for other_type, other_terms in TRANSPORT_DETECTION_TERMS.items() if other_type != transport_type)
+    ))
+    for transport_type, terms in TRANSPORT_DETECTION_TERMS.items()
+})
+
+# Free-text transport preference cues (fallback when AI preference extraction is unavailable)
+AC_SLEEPER_TERMS_RE = re.compile('|'.join(map(re.escape, ['ac sleeper', 'air conditioned sleeper'])))
+NON_AC_TERMS_RE = re.compile('|'.join(map(re.escape, ['non-ac', 'non ac', 'non air conditioned'])))
+MORNING_TERMS_RE = re.compile('|'.join(map(re.escape, ['morning', 'early morning', 'am'])))
+AFTERNOON_TERMS_RE = re.compile('|'.join(map(re.escape, ['afternoon', 'noon'])))
+NIGHT_TERMS_RE = re.compile('|'.join(map(re.escape, ['night', 'night time', 'nighttime', 'late night', 'overnight'])))
+
+# Suggestion names that always get a bus booking link
+KNOWN_BUS_OPERATOR_NAMES = frozenset(['redbus', 'kpn travels', 'parveen travels', 'srs travels', 'vrl travels', 'orange tours'])
+
+# Location / accommodation-type terms that make a Places query worth rephrasing with AI
+COMPLEX_LOCATION_RE = re.compile('|'.join(map(re.escape, ['lake', 'mountain', 'beach', 'downtown', 'airport', 'station', 'center', 'plaza', 'square'])))
+COMPLEX_ACCOMMODATION_RE = re.compile('|'.join(map(re.escape, ['boutique', 'luxury', 'eco', 'heritage', 'vintage'])))
+
+# Destination keywords -> ISO currency used when the utils lookup fails (groups checked in this order)
+DESTINATION_CURRENCY_HINTS = (
+    (('india', 'chennai', 'mumbai', 'delhi', 'bangalore', 'kodaikanal', 'goa'), 'INR'),
+    (('usa', 'united states', 'new york', 'california'), 'USD'),
+    (('uk', 'united kingdom', 'london'), 'GBP'),
+    (('japan', 'tokyo'), 'JPY'),
+)
+
+# Typical accommodation base prices per currency symbol (used when no pricing data is available)
+CURRENCY_BASE_PRICES = {
+    '$': {'budget_min': 30, 'budget_low': 80, 'budget_mid': 150, 'budget_high': 300, 'budget_luxury': 500},
+    '₹': {'budget_min': 2000, 'budget_low': 5000, 'budget_mid': 10000, 'budget_high': 20000, 'budget_luxury': 35000},
+    '€': {'budget_min': 25, 'budget_low': 70, 'budget_mid': 130, 'budget_high': 250, 'budget_luxury': 400},
+    '£': {'budget_min': 20, 'budget_low': 60, 'budget_mid': 120, 'budget_high': 220, 'budget_luxury': 350},
+    '¥': {'budget_min': 3000, 'budget_low': 8000, 'budget_mid': 15000, 'budget_high': 30000, 'budget_luxury': 50000}
+}
+
+# Currency symbol -> ISO code, for pricing config entries keyed by code
+CURRENCY_SYMBOL_CODES = {
+    '₹': 'INR', '$': 'USD', '€': 'EUR', '£': 'GBP', '¥': 'JPY',
+    '₩': 'KRW', '₱': 'PHP', '₫': 'VND', '฿': 'THB',
+    '₺': 'TRY', '₪': 'ILS', '₦': 'NGN'
+}
+
+# Reference accommodation base prices in USD, scaled by USD_CURRENCY_MULTIPLIERS for other currencies
+USD_BASE_PRICES = {
+    'budget_min': 30,
+    'budget_low': 80,
+    'budget_mid': 150,
+    'budget_high': 300,
+    'budget_luxury': 500
+}
+
+# Approximate currency multipliers (relative to USD)
+# These are rough estimates - in production, use real-time exchange rates
+USD_CURRENCY_MULTIPLIERS = {
+    # Major currencies
+    '$': 1.0, 'USD': 1.0,
+    '€': 0.92, 'EUR': 0.92,
+    '£': 0.79, 'GBP': 0.79,
+    '¥': 150.0, 'JPY': 150.0,
+    'CHF': 0.88,
+    'C$': 1.35, 'CAD': 1.35,
+    'A$': 1.52, 'AUD': 1.52,
+    'NZ$': 1.68, 'NZD': 1.68,
+
+    # Asian currencies
+    '₹': 83.0, 'INR': 83.0,
+    '₩': 1300.0, 'KRW': 1300.0,
+    'S$': 1.34, 'SGD': 1.34,
+    'HK$': 7.8, 'HKD': 7.8,
+    'RM': 4.7, 'MYR': 4.7,
+    'Rp': 15700.0, 'IDR': 15700.0,
+    '₱': 56.0, 'PHP': 56.0,
+    '₫': 24500.0, 'VND': 24500.0,
+    '฿': 36.0, 'THB': 36.0,
+    'NT$': 32.0, 'TWD': 32.0,
+
+    # Middle Eastern
+    'AED': 3.67, 'SAR': 3.75, 'QAR': 3.64,
+
+    # African
+    'R': 18.5, 'ZAR': 18.5,
+    '₦': 1600.0, 'NGN': 1600.0,
+    'KSh': 130.0, 'KES': 130.0,
+    'EGP': 31.0,
+
+    # European (non-EUR)
+    'NOK': 10.7, 'SEK': 10.9, 'DKK': 6.9,
+    'CZK': 23.0, 'PLN': 4.0, 'HUF': 360.0,
+    '₺': 32.0, 'TRY': 32.0,
+
+    # Americas
+    'R$': 5.0, 'BRL': 5.0,
+    'S/': 3.7, 'PEN': 3.7,
+}
+
+# Places search keywords per activity type (first two are queried)
+ACTIVITY_TYPE_QUERY_KEYWORDS = {
+    'cultural': ['museums', 'historical sites', 'temples', 'churches'],
+    'adventure': ['hiking', 'adventure sports', 'outdoor activities'],
+    'nature': ['parks', 'nature reserves', 'beaches', 'mountains'],
+    'nightlife': ['bars', 'clubs', 'nightlife'],
+    'relaxation': ['spas', 'wellness centers', 'beaches']
+}
+
+# Answer text -> normalized transportation mode
+TRANSPORT_MODE_ALIASES = MappingProxyType({
+    'bus': 'bus',
+    'train': 'train',
+    'flight': 'flight',
+    'flights': 'flight',
+    'airplane': 'flight',
+    'plane': 'flight',
+    'airline': 'flight',
+    'car rental': 'car rental',
+    'car': 'car rental',
+    'rental': 'car rental',
+    'mixed': 'mixed'
+})
+
+# Keyword -> feature label for listing text, checked in this order (first three hits are kept)
+ACCOMMODATION_FEATURE_KEYWORDS = (
+    ('wifi', 'Free WiFi'),
+    ('pool', 'Swimming Pool'),
+    ('parking', 'Free Parking'),
+    ('breakfast', 'Breakfast Included'),
+    ('gym', 'Fitness Center'),
+    ('spa', 'Spa'),
+    ('restaurant', 'On-site Restaurant'),
+    ('beach', 'Beachfront'),
+    ('pet', 'Pet Friendly'),
+    ('air conditioning', 'Air Conditioning'),
+    ('balcony', 'Balcony'),
+    ('kitchen', 'Kitchen Access'),
+    ('bar', 'In-house Bar'),
+)
+
+# (min, max) base-price tiers indexed by Google price_level 0-4
+PRICE_LEVEL_TIERS = (
+    ('budget_min', 'budget_low'),
+    ('budget_low', 'budget_mid'),
+    ('budget_mid', 'budget_high'),
+    ('budget_high', 'budget_luxury'),
+    ('budget_luxury', 'budget_luxury'),
+)
+
+# Fallback price templates per room type, keyed by Google price_level ('default' when unknown)
+FALLBACK_PRICE_TEMPLATES = {
+    'dining': {
+        1: "{currency}50-{currency}150",
+        2: "{currency}150-{currency}300",
+        3: "{currency}300-{currency}600",
+        4: "{currency}600+",
+        'default': "{currency}150-{currency}300",  # Default moderate
+    },
+    'activities': {
+        1: "Free",
+        2: "{currency}50-{currency}200",
+        3: "{currency}200-{currency}500",
+        4: "{currency}500+",
+        'default': "{currency}100-{currency}300",  # Default moderate
+    },
+}
+
+# Static fields of the fallback suggestions; each call only fills in the destination-specific values.
+# features are tuples so the shared constants stay immutable; each suggestion gets its own list copy
+FALLBACK_ACCOMMODATION_MAPS_FIELDS = MappingProxyType({
+    "price_range": "Varies",
+    "rating": "N/A - Search results",
+    "features": ("Real-time availability", "User reviews", "Direct booking"),
+    "why_recommended": "Direct access to Google Maps accommodation search",
+    "link_type": "maps",
+})
+FALLBACK_BUS_FIELDS = MappingProxyType({
+    "name": "RedBus",
+    "description": "Online bus booking platform",
+    "price_range": "₹500-₹1500",
+    "rating": 4.2,
+    "features": ("Online Booking", "Multiple Operators", "Easy Cancellation"),
+    "why_recommended": "Reliable bus booking service",
+    "booking_url": "https://www.easemytrip.com/bus/",
+    "external_url": "https://www.easemytrip.com/bus/",
+    "link_type": "booking",
+})
+FALLBACK_TRANSPORT_SEARCH_FIELDS = MappingProxyType({
+    "name": "General Transport Search",
+    "description": "Search for transportation options",
+    "price_range": "Varies",
+    "rating": 0,
+    "features": ("Multiple options",),
+    "why_recommended": "Generic transport search",
+    "link_type": "search",
+})
+
+# Structured transport preferences extracted from free-text answers (null when not mentioned)
+TRANSPORT_PREFERENCES_SCHEMA = """{
+  "bus_type": ["AC Sleeper", "Non-AC", "Sleeper", "Seater", "Semi-Sleeper"] or null,
+  "time_preference": ["morning", "afternoon", "evening", "night", "late night"] or null,
+  "amenities": ["WiFi", "Charging", "Blanket", "Water", "Snacks"] or null,
+  "preferred_operators": [list of operator names] or null,
+  "avoid_operators": [list of operator names to avoid] or null,
+  "seat_preference": ["window", "aisle", "lower", "upper"] or null,
+  "other_requirements": [any other specific requirements] or null
+}"""
+
+# Static prompt instructions per room type. Per-request values (destination, currency, context)
+# are appended after them by AIService._compose_prompt so identical prefixes can be cached by the model provider
+TRANSPORTATION_PROMPT_INSTRUCTIONS = """
+You are a transportation booking expert AI assistant helping users find REAL TRANSPORTATION OPTIONS for the trip described in TRIP DETAILS.
+
+CRITICAL REQUIREMENTS:
+1. ONLY suggest REAL transportation services that match the user's preferences
+2. Use actual company names and services
+3. Do NOT suggest hotels, lounges, airports, or tourist attractions
+4. Focus on TRANSPORTATION BOOKING OPTIONS only
+5. Provide 5-12 REAL transportation suggestions
+6. Each suggestion must be a bookable transportation service
+
+TRANSPORTATION TYPES TO SUGGEST BASED ON USER PREFERENCES:
+- If user selected "Flight": Suggest airlines (Emirates, Qatar Airways, Indigo, etc.)
+- If user selected "Train": Suggest train services (Indian Railways, Amtrak, etc.)
+- If user selected "Bus": Suggest bus services (RedBus, Greyhound, etc.)
+- If user selected "Car rental": Suggest car rental companies (Hertz, Avis, etc.)
+- If user selected "Public transport": Suggest metro/bus services
+- If user selected "Mixed": Suggest combination of different transport modes
+
+For each transportation suggestion, provide:
+- name: The exact company/service name
+- description: Brief description of the transportation service
+- price_range: Realistic price range in the trip currency (from location currency)
+- rating: Real service rating if known, or realistic estimate
+- location: Departure/arrival points
+- features: Array of service features (e.g., "Direct route", "Free WiFi", "Comfortable seats")
+- why_recommended: Why this service matches their preferences
+- departure_time: Specific departure time (e.g., "06:30 AM", "10:45 PM")
+- arrival_time: Specific arrival time (e.g., "02:15 PM", "08:30 AM")
+- duration: Journey duration (e.g., "6h 45m", "8h 30m")
+
+IMPORTANT: 
+- ONLY suggest actual transportation services that match user preferences
+- Do NOT suggest hotels, lounges, airports, or tourist attractions
+- Focus on transportation booking options that can be booked online
+- Use real company names that exist and can be booked
+- Use the trip currency for all price ranges (user's home currency for easier planning)
+
+Format your response as a JSON array with this structure:
+[
+  {
+    "name": "REAL Transportation Service Name",
+    "description": "Brief description of this transportation service...",
+    "price_range": "<currency>X-Y",
+    "rating": 4.5,
+    "features": ["Direct route", "Free WiFi", "Comfortable seats"],
+    "location": "Departure/arrival points",
+    "why_recommended": "Why this service matches their specific preferences",
+    "departure_time": "06:30 AM",
+    "arrival_time": "02:15 PM",
+    "duration": "7h 45m"
+  }
+]
+"""
+
+ACCOMMODATION_PROMPT_INSTRUCTIONS = """
+You are a hotel booking expert AI assistant helping users find REAL ACCOMMODATION OPTIONS for the trip described in TRIP DETAILS.
+
+CRITICAL REQUIREMENTS FOR ACCOMMODATION:
+1. ONLY suggest REAL, EXISTING hotels, resorts, hostels, or vacation rentals
+2. Use actual property names that can be found on Google Maps
+3. Do NOT create fictional or made-up names
+4. Focus on well-known, bookable establishments
+5. Provide 5-12 REAL accommodation suggestions
+
+MANDATORY FILTERING REQUIREMENTS - STRICTLY FOLLOW ALL USER PREFERENCES:
+- Analyze the user's accommodation type preferences carefully from the context
+- If user selected specific accommodation types → ONLY suggest properties that match those exact types
+- If user selected multiple types → Suggest a mix of properties that match ALL selected types
+- MATCH the user's accommodation type preferences EXACTLY. If a user names a style such as "cottage", "villa", "heritage", etc., at least one recommendation must explicitly be that style and described as such.
+- Ratings are purely a tie-breaker. NEVER prioritize a property just because it has a higher rating. If you must mention ratings, note that they are secondary to the named preferences.
+
+DYNAMIC PREFERENCE MATCHING (Apply to ANY user preference mentioned in context):
+- If user specified a budget range → ONLY suggest properties within that exact price range
+- If user mentioned any specific requirements (pet-friendly, beachfront, pool, WiFi, parking, etc.) → ONLY suggest properties that offer those specific features
+- If user mentioned dietary preferences → ONLY suggest properties that cater to those needs
+- If user mentioned group size → ONLY suggest properties that can accommodate that group size
+- If user mentioned location/area preferences → ONLY suggest properties in those specific areas
+- If user mentioned any other specific requirements → ONLY suggest properties that meet those requirements
+- NEVER suggest properties that don't match the user's specific requirements mentioned in the context
+- When describing why a property was selected, explicitly reference the member names and the exact preference(s) you are satisfying (e.g., "Chosen for Harshini's request for a rustic beachside cottage and Aditya's budget limit of ₹6,000/night").
+
+PROPERTY SPECIFICITY REQUIREMENTS:
+- Use SPECIFIC property names, not generic descriptions like "[Type] in [Location]"
+- Each suggestion must be a specific, bookable property with a real name
+- Avoid generic placeholders - use actual property names that exist
+- Provide 5-12 REAL property suggestions if available, do not make up options just for the sake of proving options, even if there are limited options for the user's selected preferences, keep the recommendations realistic and based on the user's preferences and dietary restrictions dont suggest anything that doesnt align with what the user has selected and entered.
+
+Format your response as a JSON array with this structure:
+[
+  {
+    "name": "SPECIFIC REAL Property Name (not generic description)",
+    "description": "Detailed description of this specific property and why it matches their EXACT preferences mentioned in the context...",
+    "price_range": "<currency>X-Y (must match user's budget if specified in context)",
+    "rating": 4.5,
+    "features": ["Specific Feature 1", "Specific Feature 2", "Specific Feature 3"],
+    "location": "Specific area/neighborhood in the destination",
+    "why_recommended": "Detailed explanation naming the specific member preferences this property satisfies (e.g., “Harshini’s beachfront cottage request and Aditya’s ₹6000 budget”). Mention member names from the context whenever possible.",
+    "preference_match_summary": ["Harshini – beachfront cottage", "Aditya – budget under ₹6,000"]
+  }
+]
+"""
+
+DINING_PROMPT_INSTRUCTIONS = """
+You are a restaurant expert AI assistant helping users find REAL RESTAURANTS for the trip described in TRIP DETAILS. Your goal is to return a rich, highly varied list that covers every cuisine, dietary, and experience preference mentioned by the group.
+
+CRITICAL REQUIREMENTS FOR DINING:
+1. ONLY suggest REAL, EXISTING restaurants, cafes, and food establishments
+2. Use actual restaurant names that can be found on Google Maps
+3. Do NOT create fictional or made-up names
+4. Provide **15-20** REAL dining suggestions if available. Do not stop early unless there are truly fewer than 15 legitimate options; if fewer than 15 exist, return everything you can verify and explain the scarcity in the reasoning.
+5. Ensure the list is DIVERSE. Cover every requested cuisine, diet, budget tier, and meal type. If users listed multiple cuisines or experiences, include at least one (ideally more) option per preference instead of repeating similar restaurants.
+6. Consider the meal types selected (breakfast, lunch, dinner, brunch, late-night, snacks) and explicitly tag which meal(s) each venue is best for so members can act on their specific requests.
+
+INTELLIGENT FILTERING REQUIREMENTS:
+- Carefully analyze the user's dietary restrictions and food preferences from the context
+- Understand that "seafood", "fish", "non-veg", "meat" indicate non-vegetarian preferences
+- Understand that "veg", "vegetarian", "pure veg" indicate vegetarian preferences
+- Match restaurants to the user's actual dietary needs, not just keywords
+- If user wants seafood lunch, suggest restaurants that serve seafood for lunch
+- If user wants vegetarian breakfast, suggest restaurants that serve vegetarian food for breakfast
+- Always respect the user's dietary choices and suggest appropriate establishments
+
+MANDATORY FILTERING REQUIREMENTS:
+- Analyze the user's dietary restrictions and food preferences carefully
+- If user mentions vegetarian preferences (veg, vegetarian, pure veg, etc.), ONLY suggest vegetarian restaurants
+- If user mentions non-vegetarian preferences (seafood, fish, meat, non-veg, etc.), ONLY suggest restaurants that serve those items
+- If user specifies specific cuisines, ONLY suggest restaurants of that cuisine type
+- If user specifies budget constraints, ONLY suggest restaurants within that price range
+- If user specifies location preferences, ONLY suggest restaurants in those areas
+- STRICTLY follow ALL user preferences and dietary restrictions - do not suggest restaurants that don't match their requirements
+- NEVER suggest restaurants that contradict the user's dietary preferences
+- ALWAYS match the meal type requested (breakfast, lunch, dinner, brunch, snacks)
+
+Format your response as a JSON array with this structure:
+[
+  {
+    "name": "REAL Restaurant Name",
+    "description": "Brief description of cuisine and atmosphere...",
+    "price_range": "<currency>X-Y",
+    "rating": 4.5,
+    "features": ["Outdoor seating", "Vegetarian options", "Live music"],
+    "location": "Actual area/neighborhood in the destination",
+    "meal_types": ["breakfast", "lunch", "dinner"],
+    "why_recommended": "Why this restaurant matches the specific member preferences (quote the member names and their requests, e.g., “Harshini – vegan brunch”, “Aditya – seafood dinner”). Mention ratings only if two options are otherwise identical.",
+    "preference_match_summary": ["MemberName – preference satisfied", "..."]
+  }
+]
+"""
+
+ACTIVITIES_PROMPT_INSTRUCTIONS = """
+You are a travel activities expert AI assistant helping users find REAL ACTIVITIES for the trip described in TRIP DETAILS.
+
+CRITICAL REQUIREMENTS FOR ACTIVITIES:
+1. ONLY suggest REAL, EXISTING tourist attractions, activities, and experiences
+2. Use actual attraction names that can be found on Google Maps
+3. Do NOT create fictional or made-up names
+4. Focus on well-known, visitable establishments
+5. Provide 5-12 REAL activity suggestions
+6. MATCH the user's selected activity types and preferences EXACTLY
+
+IMPORTANT: Pay special attention to:
+- If user selected "Adventure" activities, suggest adventure sports, hiking, water sports, etc.
+- If user selected "Cultural" activities, suggest museums, temples, historical sites, etc.
+- If user selected "Nature" activities, suggest parks, gardens, wildlife sanctuaries, etc.
+- If user selected "Food & Drink" activities, suggest food tours, cooking classes, local markets, etc.
+- If user selected "Relaxation" activities, suggest spas, beaches, peaceful gardens, etc.
+- If user selected "Nightlife" activities, suggest bars, clubs, evening entertainment, etc.
+- If user selected multiple types, suggest activities that combine these interests
+
+Format your response as a JSON array with this structure:
+[
+  {
+    "name": "REAL Attraction/Activity Name",
+    "description": "Brief description of what visitors can do...",
+    "price_range": "<currency>X-Y",
+    "rating": 4.5,
+    "features": ["Guided tours", "Photo opportunities", "Family-friendly"],
+    "location": "Actual area/neighborhood in the destination",
+    "why_recommended": "Why this activity matches their specific preferences"
+  }
+]
+"""
+
+GENERIC_PROMPT_INSTRUCTIONS = """
+You are a travel expert AI assistant helping users find REAL, EXISTING options of the requested type for the trip described in TRIP DETAILS.
+
+CRITICAL REQUIREMENTS:
+1. ONLY suggest REAL, EXISTING places that can be found on Google Maps
+2. Use actual property names, hotel names, restaurant names, or attraction names
+3. Do NOT create fictional or made-up names
+4. Focus on well-known, searchable establishments
+5. Use the user's specific preferences to filter and recommend from real options
+6. Provide 5-12 suggestions (not 3-5)
+7. Each suggestion must be a real, bookable option
+
+Format your response as a JSON array with this structure:
+[
+  {
+    "name": "REAL Place Name",
+    "description": "Brief description of this real place and why it matches their preferences...",
+    "price_range": "<currency>X-Y",
+    "rating": 4.5,
+    "features": ["Real Feature 1", "Real Feature 2", "Real Feature 3"],
+    "location": "Actual area/neighborhood in the destination",
+    "why_recommended": "Why this real place matches their specific preferences"
+  }
+]
+"""
+
+# Per-request tail appended after the static room instructions by AIService._compose_prompt
+SUGGESTION_PROMPT_TEMPLATE = Template("""$instructions
+---
+TRIP DETAILS:
+${type_line}Destination: $destination
+Currency: $currency (use this symbol wherever <currency> appears above)
+User Context: $context
+
+USER PREFERENCE CONSTRAINTS:
+$constraints
+
+Respond ONLY with the JSON array, no additional text.
+""")
+
+# Vertex AI rank/describe prompts for Places results, compiled once at import ($$ is a literal "$")
+VERTEX_DINING_RANK_TEMPLATE = Template("""You are an expert travel advisor. Analyze these restaurants from Google Places API and select the BEST 15-20 that match the user's preferences.
+
+DESTINATION: ${destination}
+USER PREFERENCES:
+${preferences_text}
+
+RESTAURANTS FROM GOOGLE PLACES API:
+${places_json}
+
+TASK:
+1. Filter restaurants that match user preferences (cuisine, dining experience, dietary needs)
+2. Rank them by relevance to preferences (NOT just by rating - preferences are primary, rating is tie-breaker)
+3. For each selected restaurant, provide:
+   - name (exact from Places API)
+   - description (2-3 sentences explaining why it matches user preferences)
+   - price_range (CRITICAL: Generate realistic per-person cost estimate in ${currency} based on:
+     * Destination cost of living (e.g., Udupi/Karnataka = budget-friendly, Mumbai/Delhi = moderate, Dubai/Singapore = expensive)
+     * Restaurant name and type (e.g., "Fish Hotel" = budget, "Fine Dining" = expensive)
+     * Price level from Places API (if available)
+     * Typical meal cost for this type of restaurant in this destination
+     Format: "${currency}XX-${currency}YY" per person, e.g., "₹150-₹300" for mid-range in Udupi, "₹50-₹100" for budget, "₹500-₹1000" for fine dining)
+   - rating (from Places API)
+   - location (address from Places API)
+   - why_recommended (specific reason matching user preferences)
+
+CRITICAL:
+- Return EXACTLY 15-20 restaurants (prioritize variety and preference matching)
+- Use ratings ONLY as tie-breaker, NOT primary criteria
+- Match user's cuisine preferences, dining experiences, and dietary needs
+- Ensure diverse options (mix of different cuisines/experiences if user selected multiple)
+- NO duplicates
+
+Return JSON array format:
+[
+  {
+    "name": "Restaurant Name",
+    "description": "Why this restaurant matches preferences...",
+    "price_range": "${currency}150-${currency}300",
+    "rating": 4.5,
+    "location": "Full address",
+    "why_recommended": "Specific reason matching user preferences"
+  }
+]
+
+IMPORTANT: price_range must be realistic for ${destination} - use destination-appropriate pricing (e.g., ₹50-₹200 for budget in Udupi, ₹200-₹500 for mid-range in Mumbai, $$30-$$80 for moderate in Dubai).""")
+
+VERTEX_ACTIVITIES_RANK_TEMPLATE = Template("""You are an expert travel advisor. Analyze these activities/attractions from Google Places API and select the BEST 15-20 that match the user's preferences.
+
+DESTINATION: ${destination}
+USER PREFERENCES:
+${preferences_text}
+
+ACTIVITIES FROM GOOGLE PLACES API:
+${places_json}
+
+TASK:
+1. Filter activities that match user preferences (activity types, specific interests)
+2. Rank them by relevance to preferences (NOT just by rating - preferences are primary, rating is tie-breaker)
+3. For each selected activity, provide:
+   - name (exact from Places API)
+   - description (2-3 sentences explaining why it matches user preferences)
+   - price_range (CRITICAL: Generate realistic cost estimate in ${currency} based on:
+     * Destination cost of living (e.g., Udupi/Karnataka = budget-friendly, Mumbai/Delhi = moderate, Dubai/Singapore = expensive)
+     * Activity type (e.g., "Temple" = often free/low, "Museum" = moderate, "Adventure Sports" = expensive)
+     * Activity name and characteristics
+     * Price level from Places API (if available)
+     Format: "${currency}XX-${currency}YY" per person, or "Free" if no cost, or "Varies" if cost depends on options
+     Examples: "Free" for temples/parks, "₹50-₹200" for museums in Udupi, "₹500-₹2000" for adventure activities)
+   - rating (from Places API)
+   - location (address from Places API)
+   - why_recommended (specific reason matching user preferences)
+
+CRITICAL:
+- Return EXACTLY 15-20 activities (prioritize variety and preference matching)
+- Use ratings ONLY as tie-breaker, NOT primary criteria
+- Match user's activity type preferences and specific interests
+- Ensure diverse options (mix of different activity types if user selected multiple)
+- NO duplicates
+
+Return JSON array format:
+[
+  {
+    "name": "Activity Name",
+    "description": "Why this activity matches preferences...",
+    "price_range": "${currency}100-${currency}300",
+    "rating": 4.5,
+    "location": "Full address",
+    "why_recommended": "Specific reason matching user preferences"
+  }
+]
+
+IMPORTANT: price_range must be realistic for ${destination} - use "Free" for free activities, or destination-appropriate pricing (e.g., ₹50-₹200 for museums in Udupi, ₹500-₹2000 for adventure activities, "Free" for temples/parks).""")
+
+# Fallback configurations used when the config/ JSON files cannot be read
+DEFAULT_PRICING_CONFIG = {"currencies": {"USD": {"budget_min": 20, "budget_low": 50, "budget_mid": 100, "budget_high": 200, "budget_luxury": 500}}}
+DEFAULT_ACCOMMODATION_TYPES = ["Hotel", "Hostel", "Airbnb", "Resort", "Guesthouse"]
+DEFAULT_ROOM_CONFIG = {"room_types": []}
+DEFAULT_TRANSPORT_CONFIG = {"transportation_options": ["Flight", "Train", "Bus", "Car Rental"]}
+
+@lru_cache(maxsize=1)
+def _load_config_files() -> Tuple[Dict, List[str], Dict, Dict]:
+    """Load all configuration files once per process; the tables are read-only after load"""
+    try:
+        # Load pricing configuration
+        with open('config/pricing_ranges.json', 'r') as f:
+            pricing_config = json_loads(f.read())
+        
+        # Load accommodation types
+        with open('config/accommodation_types.json', 'r') as f:
+            accommodation_types = json_loads(f.read())['accommodation_types']
+        
+        # Load room types configuration
+        with open('config/room_types.json', 'r') as f:
+            room_config = json_loads(f.read())
+        
+        # Load transportation options
+        with open('config/transportation_options.json', 'r') as f:
+            transport_config = json_loads(f.read())
+            
+        print("✓ All configuration files loaded successfully")
+        return pricing_config, accommodation_types, room_config, transport_config
+        
+    except Exception as e:
+        print(f"Error loading configurations: {e}")
+        # Set fallback configurations
+        return DEFAULT_PRICING_CONFIG, DEFAULT_ACCOMMODATION_TYPES, DEFAULT_ROOM_CONFIG, DEFAULT_TRANSPORT_CONFIG
+
 class AIService:
     def __init__(self):
         """Initialize AI service with dynamic configuration loading"""
@@ -21,8 +675,9 @@ class AIService:
         if not self.gemini_api_key:
             raise ValueError("GEMINI_API_KEY environment variable is required")
         
-        genai.configure(api_key=self.gemini_api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash')
+        # Gemini client is configured lazily on first use (see the model properties)
+        self._model = None
+        self._model_fast = None
         
         # Initialize EaseMyTrip service for real data
         self.easemytrip_service = EaseMyTripService()
@@ -32,17 +687,64 @@ class AIService:
         if not self.maps_api_key:
             raise ValueError("GOOGLE_MAPS_API_KEY environment variable is required")
         
+        # Embed and photo URL prefixes only vary by API key - build them once
+        self._maps_embed_place_prefix = f"https://www.google.com/maps/embed/v1/place?key={self.maps_api_key}&q=place_id:"
+        self._maps_embed_search_prefix = f"https://www.google.com/maps/embed/v1/search?key={self.maps_api_key}&q="
+        self._place_photo_prefix = f"{GOOGLE_PLACES_PHOTO_URL}?{urllib.parse.urlencode({'maxwidth': 400, 'key': self.maps_api_key})}&photoreference="
+        
+        # Shared session so Places calls reuse pooled TLS connections instead of handshaking per request
+        self._maps_session = build_http_session(MAPS_POOL_MAXSIZE)
+        
         # Load configurations dynamically
         self._load_configurations()
         
         # Caching layers
         self._preferences_cache = {}
-        self._suggestion_cache = {}
+        self._suggestion_cache = {}  # request hash -> (timestamp, enhanced suggestions)
+        self._suggestion_cache_size = 256
+        self._response_cache = {}  # prompt hash -> (timestamp, raw model text)
+        self._response_cache_size = 512
+        self._inflight_responses: Dict[str, Future] = {}  # prompt hash -> pending model call
+        self._inflight_lock = threading.Lock()
         self._cache_ttl = 3600  # seconds
+        self._base_prices_cache = {}  # currency -> base prices (config is static after load)
+        self._places_cache = {}  # (query, params) -> (timestamp, Places text search results)
+        self._places_cache_size = 1024
+        self._places_cache_lock = threading.Lock()
+        self._inflight_places: Dict[Tuple, Future] = {}  # (query, params) -> pending text search
+        self._json_mode_supported = True
+        
+        # Optional cross-worker cache (REDIS_URL) behind the in-process ones; connects on first use
+        redis_url = os.getenv('REDIS_URL')
+        self._shared_cache = redis.Redis.from_url(redis_url, socket_timeout=0.5) if redis is not None and redis_url else None
 
         # Lazy-load Vertex AI client (only initialize when actually needed)
         self._vertex_client = None  # type: ignore
         self._vertex_initialized = False
+
+        # Room-type dispatch tables; unknown room types fall through to the generic AI prompt
+        self._suggestion_handlers = {
+            # Transportation uses real EaseMyTrip data and applies its own preference extraction
+            'transportation': lambda destination, answers, group_preferences, preference_constraints:
+                self._generate_transportation_suggestions(destination, answers, group_preferences),
+            # Accommodation, dining and activities use Google Places (+ Vertex AI ranking) for real data
+            'accommodation': self._generate_accommodation_suggestions_places,
+            'dining': self._generate_dining_suggestions_places_vertex,
+            'activities': self._generate_activities_suggestions_places_vertex,
+        }
+        self._prompt_builders = {
+            'transportation': self._create_transportation_prompt,
+            'accommodation': self._create_accommodation_prompt,
+            'dining': self._create_dining_prompt,
+            'activities': self._create_activities_prompt,
+        }
+        # Normalized transport type -> booking URL builder; anything else gets a Google Maps search link
+        self._booking_url_builders = {
+            'flight': self._create_flight_booking_url,
+            'train': self._create_train_booking_url,
+            'bus': self._create_bus_booking_url,
+            'car rental': self._create_car_rental_booking_url,
+        }
     
     def _get_vertex_client(self):
         """Lazy-load Vertex AI client only when needed (prevents startup timeouts)."""
@@ -76,66 +778,64 @@ class AIService:
             traceback.print_exc(file=sys.stderr)
             return None
     
+    @property
+    def model(self):
+        """Lazy-load the Gemini model so workers that never call it skip client setup."""
+        if self._model is None:
+            from utils import get_gemini_model
+            self._model = get_gemini_model(self.gemini_api_key)
+        return self._model
+    
+    @property
+    def model_fast(self):
+        """Smaller Gemini tier for short classification/estimation prompts (GEMINI_FAST_MODEL)."""
+        if self._model_fast is None:
+            from utils import get_fast_gemini_model
+            self._model_fast = get_fast_gemini_model(self.gemini_api_key)
+        return self._model_fast
+    
     @property
     def vertex_client(self):
         """Property accessor for vertex_client (lazy-loaded)."""
         return self._get_vertex_client()
     
     def _load_configurations(self):
-        """Load all configuration files dynamically"""
-        try:
-            # Load pricing configuration
-            with open('config/pricing_ranges.json', 'r') as f:
-                self.pricing_config = json.load(f)
-            
-            # Load accommodation types
-            with open('config/accommodation_types.json', 'r') as f:
-                self.accommodation_types = json.load(f)['accommodation_types']
-            
-            # Load room types configuration
-            with open('config/room_types.json', 'r') as f:
-                self.room_config = json.load(f)
-            
-            # Load transportation options
-            with open('config/transportation_options.json', 'r') as f:
-                self.transport_config = json.load(f)
-                
-            print("✓ All configuration files loaded successfully")
-            
-        except Exception as e:
-            print(f"Error loading configurations: {e}")
-            # Set fallback configurations
-            self.pricing_config = {"currencies": {"USD": {"budget_min": 20, "budget_low": 50, "budget_mid": 100, "budget_high": 200, "budget_luxury": 500}}}
-            self.accommodation_types = ["Hotel", "Hostel", "Airbnb", "Resort", "Guesthouse"]
-            self.room_config = {"room_types": []}
-            self.transport_config = {"transportation_options": ["Flight", "Train", "Bus", "Car Rental"]}
-    
-    def _get_cache_key(self, room_type: str, destination: str, context: str) -> str:
+        """Bind the process-wide configuration tables (read from disk once, shared by every instance)"""
+        self.pricing_config, self.accommodation_types, self.room_config, self.transport_config = _load_config_files()
+    
+    def _get_cache_key(self, room_type: str, destination: str, context: str, currency: str) -> str:
         """Generate a stable cache key for suggestion requests.
         Use the full context to avoid collisions when users provide different preferences.
         """
-        key_str = f"{room_type}:{destination}:{context}"
-        return hashlib.md5(key_str.encode()).hexdigest()
+        key_str = f"{room_type}:{destination}:{currency}:{context}"
+        return hashlib.blake2b(key_str.encode(), digest_size=16).hexdigest()
+    
+    def _get_cached_suggestions(self, cache_key: str) -> Optional[List[Dict]]:
+        """Fresh cached suggestions for this request, copied so callers can stamp ids without touching the cache"""
+        cached_entry = self._suggestion_cache.get(cache_key)
+        if cached_entry:
+            cached_time, cached_suggestions = cached_entry
+            if time.time() - cached_time < self._cache_ttl:
+                return copy.deepcopy(cached_suggestions)
+        return None
+    
+    def _cache_suggestions(self, cache_key: str, suggestions: List[Dict]) -> None:
+        """Store a private copy of freshly generated suggestions, evicting the oldest entry when full"""
+        self._suggestion_cache.pop(cache_key, None)
+        if len(self._suggestion_cache) >= self._suggestion_cache_size:
+            # Evict the oldest entry (dicts keep insertion order)
+            self._suggestion_cache.pop(next(iter(self._suggestion_cache)), None)
+        self._suggestion_cache[cache_key] = (time.time(), copy.deepcopy(suggestions))
     
     def generate_suggestions(self, room_type: str, destination: str, answers: List[Dict], group_preferences: Dict = None) -> List[Dict]:
         """Generate AI-powered suggestions based on user answers and preferences"""
         answers = answers or []
         preference_constraints = self._extract_common_preferences(room_type, answers)
         
-        # For transportation, use real EaseMyTrip data instead of AI
-        if room_type == 'transportation':
-            return self._generate_transportation_suggestions(destination, answers, group_preferences)
-        
-        # For accommodation, use Google Places API for real data
-        if room_type == 'accommodation':
-            return self._generate_accommodation_suggestions_places(destination, answers, group_preferences, preference_constraints)
-        
-        # For dining and activities, use Google Places API + Vertex AI for intelligent filtering
-        if room_type == 'dining':
-            return self._generate_dining_suggestions_places_vertex(destination, answers, group_preferences, preference_constraints)
-        
-        if room_type == 'activities':
-            return self._generate_activities_suggestions_places_vertex(destination, answers, group_preferences, preference_constraints)
+        # Known room types are served from real data sources instead of a free-form AI prompt
+        handler = self._suggestion_handlers.get(room_type)
+        if handler:
+            return handler(destination, answers, group_preferences, preference_constraints)
         
         # Get currency based on room type and user preference
         from utils import get_currency_from_destination
@@ -151,13 +851,11 @@ class AIService:
         context = self._prepare_context(room_type, destination, answers, group_preferences, preference_constraints)
         
         # Cache check to avoid redundant AI calls
-        cache_key = self._get_cache_key(room_type, destination, context)
-        cached_entry = self._suggestion_cache.get(cache_key)
-        if cached_entry:
-            cached_time, cached_suggestions = cached_entry
-            if time.time() - cached_time < self._cache_ttl:
-                print(f"✅ Using cached suggestions for {room_type} → skipped AI call")
-                return cached_suggestions
+        cache_key = self._get_cache_key(room_type, destination, context, currency)
+        cached_suggestions = self._get_cached_suggestions(cache_key)
+        if cached_suggestions is not None:
+            print(f"✅ Using cached suggestions for {room_type} → skipped AI call")
+            return cached_suggestions
         
         # Generate prompt for Gemini
         prompt = self._create_prompt(room_type, destination, context, currency, preference_constraints)
@@ -165,16 +863,11 @@ class AIService:
         try:
             use_vertex = room_type in ('dining', 'activities') and self._get_vertex_client() is not None
             
-            print(f"\n{'='*80}")
-            print(f"🚀 GENERATING AI SUGGESTIONS ({'Vertex AI' if use_vertex else 'Gemini API'})")
-            print(f"{'='*80}")
-            print(f"Room Type: {room_type}")
-            print(f"Destination: {destination}")
-            print(f"Prompt length: {len(prompt)} chars")
-            print(f"First 500 chars of prompt:")
-            print(prompt[:500])
-            print(f"{'='*80}\n")
-            
+            logger.debug(
+                "🚀 Generating %s suggestions for %s via %s (prompt %d chars): %.500s",
+                room_type, destination, 'Vertex AI' if use_vertex else 'Gemini API', len(prompt), prompt,
+            )
+            
             if use_vertex:
                 try:
                     response_text = self._generate_with_vertex(prompt)
@@ -182,48 +875,166 @@ class AIService:
                     # If Vertex AI fails (404, permissions, etc.), fall back to Gemini API
                     print(f"\n⚠️ Vertex AI failed ({type(vertex_err).__name__}: {str(vertex_err)[:200]}), falling back to Gemini API")
                     print(f"{'='*80}\n")
-                    response_text = self._generate_with_gemini(prompt)
+                    response_text = self._generate_with_gemini(prompt, json_mode=True)
             else:
-                response_text = self._generate_with_gemini(prompt)
+                response_text = self._generate_with_gemini(prompt, json_mode=True)
             
-            print(f"\n{'='*80}")
-            print(f"📥 RECEIVED AI RESPONSE")
-            print(f"{'='*80}")
-            print(f"Response source: {'Vertex AI' if use_vertex else 'Gemini API'}")
-            print(f"Response text length: {len(response_text)} chars")
-            print(f"{'='*80}\n")
+            logger.debug("📥 Received AI response (%d chars)", len(response_text))
             
             suggestions_data = self._parse_ai_response(response_text, room_type)
             
-            # Enhance with Google Maps links
-            enhanced_suggestions = []
-            for suggestion in suggestions_data:
-                enhanced_suggestion = self._enhance_with_maps(suggestion, destination, answers, group_preferences)
-                enhanced_suggestions.append(enhanced_suggestion)
+            # Enhance with Google Maps links - each may need a Gemini round-trip, so run them concurrently
+            enhanced_suggestions = self._enhance_all_with_maps(suggestions_data, destination, answers, group_preferences)
             
             # Cache fresh results
-            self._suggestion_cache[cache_key] = (time.time(), enhanced_suggestions)
+            self._cache_suggestions(cache_key, enhanced_suggestions)
             return enhanced_suggestions
             
         except Exception as e:
-            print(f"\n{'='*80}")
-            print(f"❌ EXCEPTION IN generate_suggestions")
-            print(f"{'='*80}")
-            print(f"Room type: {room_type}")
-            print(f"Error type: {type(e).__name__}")
-            print(f"Error message: {str(e)}")
-            import traceback
-            print(f"Full traceback:")
-            print(traceback.format_exc())
-            print(f"{'='*80}\n")
+            logger.exception("❌ Exception in generate_suggestions for %s: %s: %s", room_type, type(e).__name__, e)
             return self._get_fallback_suggestions(room_type, destination)
     
-    def _generate_with_gemini(self, prompt: str) -> str:
-        response = self.model.generate_content(prompt)
+    def _cached_model_response(self, prompt: str, generate: Callable[[], str], validate: Optional[Callable[[str], bool]] = None) -> str:
+        """Return the cached model text for an identical prompt, calling `generate` once per miss
+        even when several threads ask for the same prompt at the same time.
+        Only non-empty text that passes `validate` is cached; anything else is returned once and retried next time"""
+        cache_key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+        cached_entry = self._response_cache.get(cache_key)
+        if cached_entry:
+            cached_time, cached_text = cached_entry
+            if time.time() - cached_time < self._cache_ttl:
+                return cached_text
+        
+        # Coalesce identical concurrent prompts: later callers wait on the first caller's request
+        with self._inflight_lock:
+            # A leader that just finished cached its text before leaving _inflight_responses; check again
+            cached_entry = self._response_cache.get(cache_key)
+            if cached_entry and time.time() - cached_entry[0] < self._cache_ttl:
+                return cached_entry[1]
+            pending = self._inflight_responses.get(cache_key)
+            if pending is None:
+                pending = self._inflight_responses[cache_key] = Future()
+                is_leader = True
+            else:
+                is_leader = False
+        if not is_leader:
+            return pending.result()
+        
+        try:
+            text = generate()
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        else:
+            if self._is_cacheable_response(text, validate):
+                with self._inflight_lock:
+                    self._response_cache.pop(cache_key, None)
+                    if len(self._response_cache) >= self._response_cache_size:
+                        # Evict the oldest entry (dicts keep insertion order)
+                        self._response_cache.pop(next(iter(self._response_cache)), None)
+                    self._response_cache[cache_key] = (time.time(), text)
+            pending.set_result(text)
+            return text
+        finally:
+            with self._inflight_lock:
+                self._inflight_responses.pop(cache_key, None)
+    
+    @staticmethod
+    def _is_cacheable_response(text: str, validate: Optional[Callable[[str], bool]]) -> bool:
+        if not text or not text.strip():
+            return False
+        if validate is None:
+            return True
+        try:
+            return bool(validate(text))
+        except Exception:
+            return False
+    
+    def _has_json_payload(self, text: str) -> bool:
+        """True when the response holds a JSON value the callers' fence-tolerant parsing can decode"""
+        try:
+            json_loads(self._clean_json_response(text))
+        except ValueError:
+            return False
+        return True
+    
+    def _generate_with_gemini(self, prompt: str, json_mode: bool = False) -> str:
+        """Gemini text for a prompt that asks for JSON; responses without a decodable JSON payload are not cached"""
+        cache_prompt = f"json:{prompt}" if json_mode else prompt
+        return self._cached_model_response(cache_prompt, lambda: self._request_gemini(prompt, json_mode), self._has_json_payload)
+    
+    def _request_gemini(self, prompt: str, json_mode: bool = False) -> str:
+        response = None
+        if json_mode and self._json_mode_supported:
+            # Ask Gemini for bare JSON so the parser can skip fence/brace cleanup
+            try:
+                response = self.model.generate_content(
+                    prompt,
+                    generation_config={"response_mime_type": "application/json"},
+                )
+            except (TypeError, ValueError, KeyError) as e:
+                # Older google-generativeai releases reject response_mime_type
+                print(f"⚠️ JSON response mode unavailable ({type(e).__name__}), using plain text output")
+                self._json_mode_supported = False
+        if response is None:
+            response = self.model.generate_content(prompt)
         if not response or not getattr(response, "text", None):
             raise ValueError("Gemini API returned an empty response")
         return response.text
     
+    def _stream_with_gemini(self, prompt: str) -> Iterator[str]:
+        """Yield response text chunks from Gemini as they are decoded"""
+        response = self.model.generate_content(prompt, stream=True)
+        for chunk in response:
+            text = getattr(chunk, "text", None)
+            if text:
+                yield text
+    
+    def _generate_json_object_with_gemini(self, prompt: str, use_cache: bool = True) -> Any:
+        """Stream a Gemini response and stop reading once the first top-level JSON object is balanced"""
+        if not use_cache:
+            return self._extract_json_value(self._stream_json_object_text(prompt), '{')
+        text = self._cached_model_response(
+            f"object:{prompt}", lambda: self._stream_json_object_text(prompt),
+            lambda text: isinstance(self._extract_json_value(text, '{'), dict),
+        )
+        return self._extract_json_value(text, '{')
+    
+    def _stream_json_object_text(self, prompt: str) -> str:
+        """Collect streamed response text up to the end of the first balanced top-level JSON object"""
+        chunks = self._stream_with_gemini(prompt)
+        parts = []
+        depth = 0
+        started = in_string = escaped = False
+        try:
+            for chunk in chunks:
+                parts.append(chunk)
+                for ch in chunk:
+                    if in_string:
+                        if escaped:
+                            escaped = False
+                        elif ch == '\\':
+                            escaped = True
+                        elif ch == '"':
+                            in_string = False
+                    elif ch == '"':
+                        in_string = started
+                    elif ch == '{':
+                        depth += 1
+                        started = True
+                    elif ch == '}' and started:
+                        depth -= 1
+                        if depth == 0:
+                            break
+                if started and depth == 0:
+                    # Anything after the object is explanatory text - stop reading it.
+                    # The SDK has no public cancel for a streamed response, so the server may still finish the
+                    # trailing text; this only saves waiting for and decoding it
+                    break
+        finally:
+            chunks.close()
+        return ''.join(parts)
+    
     def _generate_with_vertex(self, prompt: str) -> str:
         client = self._get_vertex_client()
         if not client:
@@ -317,7 +1128,7 @@ class AIService:
                 context_parts.append(f"Location preferences: {', '.join(preference_constraints['location'])}")
         
         context = "; ".join(context_parts)
-        print(f"DEBUG CONTEXT FOR {room_type.upper()}: {context}")
+        logger.debug("Context for %s: %s", room_type, context)
         return context
     
     def _extract_common_preferences(self, room_type: str, answers: List[Dict]) -> Dict:
@@ -415,362 +1226,143 @@ class AIService:
             lines.append(f"- LIMIT results to these types only: {', '.join(preference_constraints['types'])}.")
         if preference_constraints.get('amenities'):
             lines.append(f"- Every result must include: {', '.join(preference_constraints['amenities'])}.")
-        if preference_constraints.get('dietary'):
-            lines.append(f"- Respect dietary requirements: {', '.join(preference_constraints['dietary'])}.")
-        if preference_constraints.get('location'):
-            lines.append(f"- Focus on areas: {', '.join(preference_constraints['location'])}.")
-        
-        return "\n".join(lines)
-    
-    def _create_prompt(self, room_type: str, destination: str, context: str, currency: str = '$', preference_constraints: Dict = None) -> str:
-        """Create a detailed prompt for Gemini AI"""
-        
-        if room_type == 'transportation':
-            return self._create_transportation_prompt(destination, context, currency, preference_constraints)
-        elif room_type == 'accommodation':
-            return self._create_accommodation_prompt(destination, context, currency, preference_constraints)
-        elif room_type == 'dining':
-            return self._create_dining_prompt(destination, context, currency, preference_constraints)
-        elif room_type == 'activities':
-            return self._create_activities_prompt(destination, context, currency, preference_constraints)
-        else:
-            return self._create_generic_prompt(room_type, destination, context, currency, preference_constraints)
-    
-    def _create_transportation_prompt(self, destination: str, context: str, currency: str = '$', preference_constraints: Dict = None) -> str:
-        """Create specific prompt for transportation suggestions based on user preferences"""
-        pref_text = self._build_preference_instructions(preference_constraints, currency)
-        return f"""
-You are a transportation booking expert AI assistant helping users find REAL TRANSPORTATION OPTIONS for their trip to {destination}.
-
-User Context: {context}
-
-CRITICAL REQUIREMENTS:
-1. ONLY suggest REAL transportation services that match the user's preferences
-2. Use actual company names and services
-3. Do NOT suggest hotels, lounges, airports, or tourist attractions
-4. Focus on TRANSPORTATION BOOKING OPTIONS only
-5. Provide 5-12 REAL transportation suggestions
-6. Each suggestion must be a bookable transportation service
-
-USER PREFERENCE CONSTRAINTS:
-{pref_text if pref_text else '- Respect any implicit constraints from the context.'}
-
-TRANSPORTATION TYPES TO SUGGEST BASED ON USER PREFERENCES:
-- If user selected "Flight": Suggest airlines (Emirates, Qatar Airways, Indigo, etc.)
-- If user selected "Train": Suggest train services (Indian Railways, Amtrak, etc.)
-- If user selected "Bus": Suggest bus services (RedBus, Greyhound, etc.)
-- If user selected "Car rental": Suggest car rental companies (Hertz, Avis, etc.)
-- If user selected "Public transport": Suggest metro/bus services
-- If user selected "Mixed": Suggest combination of different transport modes
-
-For each transportation suggestion, provide:
-- name: The exact company/service name
-- description: Brief description of the transportation service
-- price_range: Realistic price range in {currency} (from location currency)
-- rating: Real service rating if known, or realistic estimate
-- location: Departure/arrival points
-- features: Array of service features (e.g., "Direct route", "Free WiFi", "Comfortable seats")
-- why_recommended: Why this service matches their preferences
-- departure_time: Specific departure time (e.g., "06:30 AM", "10:45 PM")
-- arrival_time: Specific arrival time (e.g., "02:15 PM", "08:30 AM")
-- duration: Journey duration (e.g., "6h 45m", "8h 30m")
-
-IMPORTANT: 
-- ONLY suggest actual transportation services that match user preferences
-- Do NOT suggest hotels, lounges, airports, or tourist attractions
-- Focus on transportation booking options that can be booked online
-- Use real company names that exist and can be booked
-- Use {currency} for all price ranges (user's home currency for easier planning)
-
-Format your response as a JSON array with this structure:
-[
-  {{
-    "name": "REAL Transportation Service Name",
-    "description": "Brief description of this transportation service...",
-    "price_range": "{currency}X-Y",
-    "rating": 4.5,
-    "features": ["Direct route", "Free WiFi", "Comfortable seats"],
-    "location": "Departure/arrival points",
-    "why_recommended": "Why this service matches their specific preferences",
-    "departure_time": "06:30 AM",
-    "arrival_time": "02:15 PM",
-    "duration": "7h 45m"
-  }}
-]
-
-Respond ONLY with the JSON array, no additional text.
-"""
-
-    def _create_accommodation_prompt(self, destination: str, context: str, currency: str = '$', preference_constraints: Dict = None) -> str:
-        """Create specific prompt for accommodation suggestions"""
-        pref_text = self._build_preference_instructions(preference_constraints, currency)
-        return f"""
-You are a hotel booking expert AI assistant helping users find REAL ACCOMMODATION OPTIONS for their trip to {destination}.
-
-User Context: {context}
-
-CRITICAL REQUIREMENTS FOR ACCOMMODATION:
-1. ONLY suggest REAL, EXISTING hotels, resorts, hostels, or vacation rentals
-2. Use actual property names that can be found on Google Maps
-3. Do NOT create fictional or made-up names
-4. Focus on well-known, bookable establishments
-5. Provide 5-12 REAL accommodation suggestions
-
-USER PREFERENCE CONSTRAINTS:
-{pref_text if pref_text else '- Respect user budget, property types, and amenities discussed in the context.'}
-
-MANDATORY FILTERING REQUIREMENTS - STRICTLY FOLLOW ALL USER PREFERENCES:
-- Analyze the user's accommodation type preferences carefully from the context
-- If user selected specific accommodation types → ONLY suggest properties that match those exact types
-- If user selected multiple types → Suggest a mix of properties that match ALL selected types
-- MATCH the user's accommodation type preferences EXACTLY. If a user names a style such as "cottage", "villa", "heritage", etc., at least one recommendation must explicitly be that style and described as such.
-- Ratings are purely a tie-breaker. NEVER prioritize a property just because it has a higher rating. If you must mention ratings, note that they are secondary to the named preferences.
-
-DYNAMIC PREFERENCE MATCHING (Apply to ANY user preference mentioned in context):
-- If user specified a budget range → ONLY suggest properties within that exact price range
-- If user mentioned any specific requirements (pet-friendly, beachfront, pool, WiFi, parking, etc.) → ONLY suggest properties that offer those specific features
-- If user mentioned dietary preferences → ONLY suggest properties that cater to those needs
-- If user mentioned group size → ONLY suggest properties that can accommodate that group size
-- If user mentioned location/area preferences → ONLY suggest properties in those specific areas
-- If user mentioned any other specific requirements → ONLY suggest properties that meet those requirements
-- NEVER suggest properties that don't match the user's specific requirements mentioned in the context
-- When describing why a property was selected, explicitly reference the member names and the exact preference(s) you are satisfying (e.g., "Chosen for Harshini's request for a rustic beachside cottage and Aditya's budget limit of ₹6,000/night").
-
-PROPERTY SPECIFICITY REQUIREMENTS:
-- Use SPECIFIC property names, not generic descriptions like "[Type] in [Location]"
-- Each suggestion must be a specific, bookable property with a real name
-- Avoid generic placeholders - use actual property names that exist
-- Provide 5-12 REAL property suggestions if available, do not make up options just for the sake of proving options, even if there are limited options for the user's selected preferences, keep the recommendations realistic and based on the user's preferences and dietary restrictions dont suggest anything that doesnt align with what the user has selected and entered.
-
-Format your response as a JSON array with this structure:
-[
-  {{
-    "name": "SPECIFIC REAL Property Name (not generic description)",
-    "description": "Detailed description of this specific property and why it matches their EXACT preferences mentioned in the context...",
-    "price_range": "{currency}X-Y (must match user's budget if specified in context)",
-    "rating": 4.5,
-    "features": ["Specific Feature 1", "Specific Feature 2", "Specific Feature 3"],
-    "location": "Specific area/neighborhood in {destination}",
-    "why_recommended": "Detailed explanation naming the specific member preferences this property satisfies (e.g., “Harshini’s beachfront cottage request and Aditya’s ₹6000 budget”). Mention member names from the context whenever possible.",
-    "preference_match_summary": ["Harshini – beachfront cottage", "Aditya – budget under ₹6,000"]
-  }}
-]
-
-Respond ONLY with the JSON array, no additional text.
-"""
-
-    def _create_dining_prompt(self, destination: str, context: str, currency: str = '$', preference_constraints: Dict = None) -> str:
-        """Create specific prompt for dining suggestions"""
-        pref_text = self._build_preference_instructions(preference_constraints, currency)
-        return f"""
-You are a restaurant expert AI assistant helping users find REAL RESTAURANTS for their trip to {destination}. Your goal is to return a rich, highly varied list that covers every cuisine, dietary, and experience preference mentioned by the group.
-
-User Context: {context}
-
-CRITICAL REQUIREMENTS FOR DINING:
-1. ONLY suggest REAL, EXISTING restaurants, cafes, and food establishments
-2. Use actual restaurant names that can be found on Google Maps
-3. Do NOT create fictional or made-up names
-4. Provide **15-20** REAL dining suggestions if available. Do not stop early unless there are truly fewer than 15 legitimate options; if fewer than 15 exist, return everything you can verify and explain the scarcity in the reasoning.
-5. Ensure the list is DIVERSE. Cover every requested cuisine, diet, budget tier, and meal type. If users listed multiple cuisines or experiences, include at least one (ideally more) option per preference instead of repeating similar restaurants.
-6. Consider the meal types selected (breakfast, lunch, dinner, brunch, late-night, snacks) and explicitly tag which meal(s) each venue is best for so members can act on their specific requests.
-
-USER PREFERENCE CONSTRAINTS:
-{pref_text if pref_text else '- Enforce any dietary, budget, or cuisine requirements inferred from the context.'}
-
-INTELLIGENT FILTERING REQUIREMENTS:
-- Carefully analyze the user's dietary restrictions and food preferences from the context
-- Understand that "seafood", "fish", "non-veg", "meat" indicate non-vegetarian preferences
-- Understand that "veg", "vegetarian", "pure veg" indicate vegetarian preferences
-- Match restaurants to the user's actual dietary needs, not just keywords
-- If user wants seafood lunch, suggest restaurants that serve seafood for lunch
-- If user wants vegetarian breakfast, suggest restaurants that serve vegetarian food for breakfast
-- Always respect the user's dietary choices and suggest appropriate establishments
-
-MANDATORY FILTERING REQUIREMENTS:
-- Analyze the user's dietary restrictions and food preferences carefully
-- If user mentions vegetarian preferences (veg, vegetarian, pure veg, etc.), ONLY suggest vegetarian restaurants
-- If user mentions non-vegetarian preferences (seafood, fish, meat, non-veg, etc.), ONLY suggest restaurants that serve those items
-- If user specifies specific cuisines, ONLY suggest restaurants of that cuisine type
-- If user specifies budget constraints, ONLY suggest restaurants within that price range
-- If user specifies location preferences, ONLY suggest restaurants in those areas
-- STRICTLY follow ALL user preferences and dietary restrictions - do not suggest restaurants that don't match their requirements
-- NEVER suggest restaurants that contradict the user's dietary preferences
-- ALWAYS match the meal type requested (breakfast, lunch, dinner, brunch, snacks)
-
-Format your response as a JSON array with this structure:
-[
-  {{
-    "name": "REAL Restaurant Name",
-    "description": "Brief description of cuisine and atmosphere...",
-    "price_range": "{currency}X-Y",
-    "rating": 4.5,
-    "features": ["Outdoor seating", "Vegetarian options", "Live music"],
-    "location": "Actual area/neighborhood in {destination}",
-    "meal_types": ["breakfast", "lunch", "dinner"],
-    "why_recommended": "Why this restaurant matches the specific member preferences (quote the member names and their requests, e.g., “Harshini – vegan brunch”, “Aditya – seafood dinner”). Mention ratings only if two options are otherwise identical.",
-    "preference_match_summary": ["MemberName – preference satisfied", "..."]
-  }}
-]
-
-Respond ONLY with the JSON array, no additional text.
-"""
-
-    def _create_activities_prompt(self, destination: str, context: str, currency: str = '$', preference_constraints: Dict = None) -> str:
-        """Create specific prompt for activities suggestions"""
-        pref_text = self._build_preference_instructions(preference_constraints, currency)
-        return f"""
-You are a travel activities expert AI assistant helping users find REAL ACTIVITIES for their trip to {destination}.
-
-User Context: {context}
-
-CRITICAL REQUIREMENTS FOR ACTIVITIES:
-1. ONLY suggest REAL, EXISTING tourist attractions, activities, and experiences
-2. Use actual attraction names that can be found on Google Maps
-3. Do NOT create fictional or made-up names
-4. Focus on well-known, visitable establishments
-5. Provide 5-12 REAL activity suggestions
-6. MATCH the user's selected activity types and preferences EXACTLY
-
-USER PREFERENCE CONSTRAINTS:
-{pref_text if pref_text else '- Honor activity types, budgets, and group needs mentioned in the context.'}
-
-IMPORTANT: Pay special attention to:
-- If user selected "Adventure" activities, suggest adventure sports, hiking, water sports, etc.
-- If user selected "Cultural" activities, suggest museums, temples, historical sites, etc.
-- If user selected "Nature" activities, suggest parks, gardens, wildlife sanctuaries, etc.
-- If user selected "Food & Drink" activities, suggest food tours, cooking classes, local markets, etc.
-- If user selected "Relaxation" activities, suggest spas, beaches, peaceful gardens, etc.
-- If user selected "Nightlife" activities, suggest bars, clubs, evening entertainment, etc.
-- If user selected multiple types, suggest activities that combine these interests
-
-Format your response as a JSON array with this structure:
-[
-  {{
-    "name": "REAL Attraction/Activity Name",
-    "description": "Brief description of what visitors can do...",
-    "price_range": "{currency}X-Y",
-    "rating": 4.5,
-    "features": ["Guided tours", "Photo opportunities", "Family-friendly"],
-    "location": "Actual area/neighborhood in {destination}",
-    "why_recommended": "Why this activity matches their specific preferences"
-  }}
-]
-
-Respond ONLY with the JSON array, no additional text.
-"""
-
-    def _create_generic_prompt(self, room_type: str, destination: str, context: str, currency: str = '$', preference_constraints: Dict = None) -> str:
-        """Create generic prompt for other room types"""
+        if preference_constraints.get('dietary'):
+            lines.append(f"- Respect dietary requirements: {', '.join(preference_constraints['dietary'])}.")
+        if preference_constraints.get('location'):
+            lines.append(f"- Focus on areas: {', '.join(preference_constraints['location'])}.")
+        
+        return "\n".join(lines)
+    
+    def _create_prompt(self, room_type: str, destination: str, context: str, currency: str = '$', preference_constraints: Dict = None) -> str:
+        """Create a detailed prompt for Gemini AI"""
+        builder = self._prompt_builders.get(room_type)
+        if builder:
+            return builder(destination, context, currency, preference_constraints)
+        return self._create_generic_prompt(room_type, destination, context, currency, preference_constraints)
+    
+    def _compose_prompt(self, instructions: str, destination: str, context: str, currency: str, preference_constraints: Dict,
+                        default_constraints: str, suggestion_type: str = None) -> str:
+        """Append the per-request trip details after the static instructions (keeps the prompt prefix stable)"""
         pref_text = self._build_preference_instructions(preference_constraints, currency)
-        return f"""
-You are a travel expert AI assistant helping users find REAL, EXISTING {room_type} options for their trip to {destination}.
-
-User Context: {context}
+        return SUGGESTION_PROMPT_TEMPLATE.substitute(
+            instructions=instructions,
+            type_line=f"Suggestion type: {suggestion_type}\n" if suggestion_type else "",
+            destination=destination,
+            currency=currency,
+            context=context,
+            constraints=pref_text or default_constraints,
+        )
+    
+    def _create_transportation_prompt(self, destination: str, context: str, currency: str = '$', preference_constraints: Dict = None) -> str:
+        """Create specific prompt for transportation suggestions based on user preferences"""
+        return self._compose_prompt(
+            TRANSPORTATION_PROMPT_INSTRUCTIONS, destination, context, currency, preference_constraints,
+            '- Respect any implicit constraints from the context.',
+        )
 
-CRITICAL REQUIREMENTS:
-1. ONLY suggest REAL, EXISTING places that can be found on Google Maps
-2. Use actual property names, hotel names, restaurant names, or attraction names
-3. Do NOT create fictional or made-up names
-4. Focus on well-known, searchable establishments
-5. Use the user's specific preferences to filter and recommend from real options
-6. Provide 5-12 suggestions (not 3-5)
-7. Each suggestion must be a real, bookable option
+    def _create_accommodation_prompt(self, destination: str, context: str, currency: str = '$', preference_constraints: Dict = None) -> str:
+        """Create specific prompt for accommodation suggestions"""
+        return self._compose_prompt(
+            ACCOMMODATION_PROMPT_INSTRUCTIONS, destination, context, currency, preference_constraints,
+            '- Respect user budget, property types, and amenities discussed in the context.',
+        )
 
-USER PREFERENCE CONSTRAINTS:
-{pref_text if pref_text else '- Strictly adhere to the budget and preference details included in the context.'}
+    def _create_dining_prompt(self, destination: str, context: str, currency: str = '$', preference_constraints: Dict = None) -> str:
+        """Create specific prompt for dining suggestions"""
+        return self._compose_prompt(
+            DINING_PROMPT_INSTRUCTIONS, destination, context, currency, preference_constraints,
+            '- Enforce any dietary, budget, or cuisine requirements inferred from the context.',
+        )
 
-Format your response as a JSON array with this structure:
-[
-  {{
-    "name": "REAL Place Name",
-    "description": "Brief description of this real place and why it matches their preferences...",
-    "price_range": "{currency}X-Y",
-    "rating": 4.5,
-    "features": ["Real Feature 1", "Real Feature 2", "Real Feature 3"],
-    "location": "Actual area/neighborhood in {destination}",
-    "why_recommended": "Why this real place matches their specific preferences"
-  }}
-]
+    def _create_activities_prompt(self, destination: str, context: str, currency: str = '$', preference_constraints: Dict = None) -> str:
+        """Create specific prompt for activities suggestions"""
+        return self._compose_prompt(
+            ACTIVITIES_PROMPT_INSTRUCTIONS, destination, context, currency, preference_constraints,
+            '- Honor activity types, budgets, and group needs mentioned in the context.',
+        )
 
-Respond ONLY with the JSON array, no additional text.
-"""
+    def _create_generic_prompt(self, room_type: str, destination: str, context: str, currency: str = '$', preference_constraints: Dict = None) -> str:
+        """Create generic prompt for other room types"""
+        return self._compose_prompt(
+            GENERIC_PROMPT_INSTRUCTIONS, destination, context, currency, preference_constraints,
+            '- Strictly adhere to the budget and preference details included in the context.', suggestion_type=room_type,
+        )
+    
+    def _apply_suggestion_defaults(self, suggestion: Dict, room_type: str, index: int) -> Dict:
+        """Stamp id/room metadata and fill any fields the model left out"""
+        suggestion['id'] = f"suggestion_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{index}"
+        suggestion['room_type'] = room_type
+        suggestion['created_at'] = datetime.utcnow().isoformat()
+        
+        # Ensure all required fields exist
+        suggestion.setdefault('name', f"Option {index+1}")
+        suggestion.setdefault('description', "AI-generated suggestion")
+        suggestion.setdefault('price_range', "Price varies")
+        suggestion.setdefault('rating', 4.0)
+        suggestion.setdefault('features', [])
+        suggestion.setdefault('location', "Location not specified")
+        suggestion.setdefault('why_recommended', "Recommended based on your preferences")
+        return suggestion
     
     def _parse_ai_response(self, response_text: str, room_type: str) -> List[Dict]:
         """Parse the AI response and extract suggestions"""
         try:
-            print(f"\n{'='*80}")
-            print(f"🔍 PARSING AI RESPONSE FOR {room_type}")
-            print(f"{'='*80}")
-            print(f"Raw response length: {len(response_text)} chars")
-            print(f"First 200 chars of raw response:")
-            print(repr(response_text[:200]))
-            print(f"Last 100 chars of raw response:")
-            print(repr(response_text[-100:]))
+            logger.debug("🔍 Parsing AI response for %s (%d chars): %.200r", room_type, len(response_text), response_text)
             
             # Clean the response text
             cleaned_text = response_text.strip()
             
-            print(f"\nAfter strip:")
-            print(f"  Starts with '```json': {cleaned_text.startswith('```json')}")
-            print(f"  Starts with '```': {cleaned_text.startswith('```')}")
-            print(f"  Ends with '```': {cleaned_text.endswith('```')}")
-            
-            # Remove markdown code blocks
-            if cleaned_text.startswith('```json'):
-                cleaned_text = cleaned_text[7:]
-                print("  → Removed '```json' prefix")
-            elif cleaned_text.startswith('```'):
-                cleaned_text = cleaned_text[3:]
-                print("  → Removed '```' prefix")
+            # JSON response mode returns a bare array - parse it directly
+            suggestions = None
+            if cleaned_text.startswith('['):
+                try:
+                    suggestions = json_loads(cleaned_text)
+                    logger.debug("  → Parsed structured JSON response directly")
+                except json.JSONDecodeError:
+                    suggestions = None
+            
+            if suggestions is None:
+                # Remove markdown code blocks
+                if cleaned_text.startswith('```json'):
+                    cleaned_text = cleaned_text[7:]
+                    logger.debug("  → Removed '```json' prefix")
+                elif cleaned_text.startswith('```'):
+                    cleaned_text = cleaned_text[3:]
+                    logger.debug("  → Removed '```' prefix")
                 
-            if cleaned_text.endswith('```'):
-                cleaned_text = cleaned_text[:-3]
-                print("  → Removed '```' suffix")
+                if cleaned_text.endswith('```'):
+                    cleaned_text = cleaned_text[:-3]
+                    logger.debug("  → Removed '```' suffix")
             
-            cleaned_text = cleaned_text.strip()
+                cleaned_text = cleaned_text.strip()
             
-            # Try to extract JSON array if wrapped in text
-            import re
-            # Look for JSON array pattern
-            json_match = re.search(r'\[[\s\S]*\]', cleaned_text)
-            if json_match:
-                cleaned_text = json_match.group(0)
-                print("  → Extracted JSON array from text")
+                # Try to extract JSON array if wrapped in text
+                import re
+                # Look for JSON array pattern
+                json_match = re.search(r'\[[\s\S]*\]', cleaned_text)
+                if json_match:
+                    cleaned_text = json_match.group(0)
+                    logger.debug("  → Extracted JSON array from text")
             
-            # Fix common JSON issues
-            # Replace single quotes with double quotes (but not inside strings)
-            # This is a simple fix - for production, use a more robust solution
-            cleaned_text = re.sub(r"'(\w+)':", r'"\1":', cleaned_text)  # Fix keys
-            cleaned_text = re.sub(r":\s*'([^']*)'", r': "\1"', cleaned_text)  # Fix string values (simple)
+                # Fix common JSON issues
+                # Replace single quotes with double quotes (but not inside strings)
+                # This is a simple fix - for production, use a more robust solution
+                cleaned_text = re.sub(r"'(\w+)':", r'"\1":', cleaned_text)  # Fix keys
+                cleaned_text = re.sub(r":\s*'([^']*)'", r': "\1"', cleaned_text)  # Fix string values (simple)
             
-            # Remove trailing commas before closing brackets/braces
-            cleaned_text = re.sub(r',(\s*[}\]])', r'\1', cleaned_text)
+                # Remove trailing commas before closing brackets/braces
+                cleaned_text = re.sub(r',(\s*[}\]])', r'\1', cleaned_text)
             
-            print(f"\nFinal cleaned text (first 200 chars):")
-            print(repr(cleaned_text[:200]))
-            print(f"\nAttempting JSON parse...")
+                logger.debug("Final cleaned text: %.200r", cleaned_text)
             
-            # Parse JSON
-            suggestions = json.loads(cleaned_text)
+                # Parse JSON
+                suggestions = json_loads(cleaned_text)
             
-            print(f"✅ Successfully parsed {len(suggestions)} suggestions")
-            print(f"{'='*80}\n")
+            logger.debug("✅ Successfully parsed %d suggestions", len(suggestions))
             
             # Add required fields
             for i, suggestion in enumerate(suggestions):
-                suggestion['id'] = f"suggestion_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{i}"
-                suggestion['room_type'] = room_type
-                suggestion['created_at'] = datetime.utcnow().isoformat()
-                
-                # Ensure all required fields exist
-                suggestion.setdefault('name', f"Option {i+1}")
-                suggestion.setdefault('description', "AI-generated suggestion")
-                suggestion.setdefault('price_range', "Price varies")
-                suggestion.setdefault('rating', 4.0)
-                suggestion.setdefault('features', [])
-                suggestion.setdefault('location', "Location not specified")
-                suggestion.setdefault('why_recommended', "Recommended based on your preferences")
+                self._apply_suggestion_defaults(suggestion, room_type, i)
             
             return suggestions
             
@@ -805,6 +1397,14 @@ Respond ONLY with the JSON array, no additional text.
             print(f"{'='*80}\n")
             return self._get_fallback_suggestions(room_type, "destination")
     
+    def _extract_json_value(self, text: str, opener: str = '{') -> Any:
+        """Decode the first JSON value starting at `opener`, ignoring any text after it (None if absent)"""
+        start = text.find(opener)
+        if start == -1:
+            return None
+        value, _ = JSON_DECODER.raw_decode(text, start)
+        return value
+    
     def _clean_json_response(self, response_text: str) -> str:
         """Extract JSON payload from model responses with markdown/code fences."""
         if not response_text:
@@ -817,42 +1417,74 @@ Respond ONLY with the JSON array, no additional text.
             cleaned = re.sub(r"^```[a-zA-Z0-9]*\s*", "", cleaned)
             cleaned = re.sub(r"\s*```$", "", cleaned)
         
-        # Extract the first JSON object/array
-        json_match = re.search(r"\{.*\}|\[.*\]", cleaned, re.DOTALL)
-        if json_match:
-            cleaned = json_match.group(0)
+        # Extract the first JSON object/array, stopping where it ends rather than at the last brace
+        starts = [i for i in (cleaned.find('{'), cleaned.find('[')) if i != -1]
+        if starts:
+            start = min(starts)
+            try:
+                _, end = JSON_DECODER.raw_decode(cleaned, start)
+                cleaned = cleaned[start:end]
+            except json.JSONDecodeError:
+                # Leave malformed payloads for the caller's parser to report
+                cleaned = cleaned[start:]
         
         return cleaned
     
-    def _enhance_with_maps(self, suggestion: Dict, destination: str, answers: List[Dict] = None, group_preferences: Dict = None) -> Dict:
-        """Enhance suggestion with appropriate links based on suggestion type"""
+    def _enhance_all_with_maps(self, suggestions: List[Dict], destination: str, answers: List[Dict] = None, group_preferences: Dict = None) -> List[Dict]:
+        """Run _enhance_with_maps for every suggestion in parallel, keeping the original order"""
+        if len(suggestions) <= 1:
+            return [self._enhance_with_maps(s, destination, answers, group_preferences) for s in suggestions]
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        # Classify all suggestions against the user's transport preference in one AI call
+        transport_type = self._get_user_transportation_preference(answers, group_preferences)
+        if transport_type:
+            transport_matches = self._classify_transportation_suggestions(suggestions, transport_type.lower())
+        else:
+            transport_matches = [False] * len(suggestions)
+        
+        with ThreadPoolExecutor(max_workers=min(len(suggestions), 8)) as executor:
+            return list(executor.map(
+                lambda suggestion, transport_match: self._enhance_with_maps(
+                    suggestion, destination, answers, group_preferences,
+                    transport_type=transport_type, transport_match=transport_match,
+                ),
+                suggestions,
+                transport_matches,
+            ))
+    
+    def _enhance_with_maps(self, suggestion: Dict, destination: str, answers: List[Dict] = None, group_preferences: Dict = None,
+                           transport_type: Optional[str] = None, transport_match: Optional[bool] = None) -> Dict:
+        """Enhance suggestion with appropriate links based on suggestion type
+        (transport_type/transport_match may be precomputed by a batch classification)"""
         try:
             suggestion_name = suggestion.get('name', '').lower()
             suggestion_description = suggestion.get('description', '').lower()
             
-            # Determine transportation type based on user preferences from answers
-            transport_type = self._get_user_transportation_preference(answers, group_preferences)
+            if transport_match is None:
+                # Determine transportation type based on user preferences from answers (unless already resolved)
+                if transport_type is None:
+                    transport_type = self._get_user_transportation_preference(answers, group_preferences)
+                transport_match = bool(transport_type) and self._is_transportation_suggestion(suggestion_name, suggestion_description, transport_type.lower())
             
             # Check if suggestion matches the user's transportation preference
             # TEMPORARY FIX: Force bus detection for testing
-            if suggestion_name in ['redbus', 'kpn travels', 'parveen travels', 'srs travels', 'vrl travels', 'orange tours']:
-                booking_url = self._create_transportation_booking_url(suggestion, destination, 'bus', answers, group_preferences)
-                suggestion['booking_url'] = booking_url
-                suggestion['external_url'] = booking_url
-                suggestion['link_type'] = 'booking'
-            elif transport_type and self._is_transportation_suggestion(suggestion_name, suggestion_description, transport_type.lower()):
+            # Link fields are merged into the suggestion in one update (no copy of the suggestion dict)
+            if suggestion_name in KNOWN_BUS_OPERATOR_NAMES or transport_match:
                 # Generate booking URL for the specific transportation type
-                booking_url = self._create_transportation_booking_url(suggestion, destination, transport_type, answers, group_preferences)
-                suggestion['booking_url'] = booking_url
-                suggestion['external_url'] = booking_url
-                suggestion['link_type'] = 'booking'
+                booking_type = 'bus' if suggestion_name in KNOWN_BUS_OPERATOR_NAMES else transport_type
+                booking_url = self._create_transportation_booking_url(suggestion, destination, booking_type, answers, group_preferences)
+                suggestion.update(booking_url=booking_url, external_url=booking_url, link_type='booking')
             else:
                 # Generate Google Maps search URL for other suggestions
                 maps_url = self._create_maps_url(suggestion, destination)
-                suggestion['maps_url'] = maps_url
-                suggestion['maps_embed_url'] = self._create_maps_embed_url(suggestion, destination)
-                suggestion['external_url'] = maps_url
-                suggestion['link_type'] = 'maps'
+                suggestion.update(
+                    maps_url=maps_url,
+                    maps_embed_url=self._create_maps_embed_url(suggestion, destination),
+                    external_url=maps_url,
+                    link_type='maps',
+                )
             
             return suggestion
             
@@ -957,8 +1589,11 @@ Respond ONLY with the JSON array, no additional text.
             """
             
             try:
-                response = self.model.generate_content(airline_prompt)
-                airline_domain = response.text.strip().lower()
+                # Same airline across suggestions/requests -> one model call (cached and coalesced by prompt)
+                airline_domain = self._cached_model_response(
+                    f"fast:{airline_prompt}", lambda: self.model_fast.generate_content(airline_prompt).text,
+                    lambda text: '.' in text or 'unknown' in text.lower(),
+                ).strip().lower()
                 
                 if airline_domain and airline_domain != "unknown" and "." in airline_domain:
                     # Create dynamic booking URL with actual travel details
@@ -976,7 +1611,11 @@ Respond ONLY with the JSON array, no additional text.
             return None
     
     def _is_transportation_suggestion(self, name: str, description: str, transport_type: str) -> bool:
-        """Dynamically determine if a suggestion is a specific type of transportation using AI analysis"""
+        """Determine if a suggestion is a specific type of transportation (keywords first, AI analysis only when ambiguous)"""
+        keyword_match = self._match_transport_keywords(name, description, transport_type)
+        if keyword_match is not None:
+            return keyword_match
+        
         try:
             # Use AI to analyze the suggestion type
             analysis_prompt = f"""
@@ -988,7 +1627,7 @@ Respond ONLY with the JSON array, no additional text.
             Respond with only "{transport_type.upper()}" if it's a {transport_type} service, or "OTHER" if it's anything else.
             """
             
-            response = self.model.generate_content(analysis_prompt)
+            response = self.model_fast.generate_content(analysis_prompt)
             result = response.text.strip().upper()
             
             return result == transport_type.upper()
@@ -997,36 +1636,68 @@ Respond ONLY with the JSON array, no additional text.
             # Fallback to basic pattern matching
             return self._fallback_transportation_detection(name, description, transport_type)
     
+    def _classify_transportation_suggestions(self, suggestions: List[Dict], transport_type: str) -> List[bool]:
+        """Classify which suggestions are transport_type services; keyword matching settles the clear cases and
+        the ambiguous rest go to a single AI call"""
+        names = [suggestion.get('name', '').lower() for suggestion in suggestions]
+        descriptions = [suggestion.get('description', '').lower() for suggestion in suggestions]
+        matches = [self._match_transport_keywords(name, description, transport_type) for name, description in zip(names, descriptions)]
+        ambiguous = [i for i, match in enumerate(matches) if match is None]
+        if not ambiguous:
+            return matches
+        
+        try:
+            listing = "\n".join(
+                f"{number}. Name: {names[i]} | Description: {descriptions[i]}"
+                for number, i in enumerate(ambiguous, 1)
+            )
+            prompt = f"""Analyze these travel suggestions and determine which are {transport_type} services.
+
+{listing}
+
+Return ONLY a JSON object mapping each suggestion number to "{transport_type.upper()}" if it's a {transport_type} service or "OTHER" if it's anything else, e.g. {{"1": "{transport_type.upper()}", "2": "OTHER"}}"""
+            
+            labels = self._generate_json_object_with_gemini(prompt)
+            if not isinstance(labels, dict):
+                raise ValueError("Classification response did not contain a JSON object")
+        except Exception as e:
+            print(f"⚠️ Batch transport classification failed ({e}), using pattern matching")
+            labels = {}
+        
+        for number, i in enumerate(ambiguous, 1):
+            label = labels.get(str(number))
+            if label is None:
+                # Missing from the AI response - fall back to basic pattern matching
+                matches[i] = self._fallback_transportation_detection(names[i], descriptions[i], transport_type)
+            else:
+                matches[i] = str(label).strip().upper() == transport_type.upper()
+        return matches
+    
     def _fallback_transportation_detection(self, name: str, description: str, transport_type: str) -> bool:
         """Fallback pattern-based transportation detection"""
+        pattern = TRANSPORT_TERMS_RE.get(transport_type)
+        return bool(pattern and pattern.search(f"{name} {description}".lower()))
+    
+    def _match_transport_keywords(self, name: str, description: str, transport_type: str) -> Optional[bool]:
+        """Keyword verdict for one suggestion: True when only this type's distinctive keywords appear, otherwise None
+        so the model decides (a miss proves nothing - operator names and flight numbers carry no keyword)"""
+        distinctive = TRANSPORT_DISTINCTIVE_RE.get(transport_type)
+        if distinctive is None:
+            return None
         text = f"{name} {description}".lower()
-        
-        if transport_type == 'flight':
-            flight_terms = ['airline', 'airlines', 'airways', 'aviation', 'aircraft', 'flight', 'air', 'fly', 'flying', 'airport', 'terminal', 'gate', 'departure', 'arrival', 'boarding', 'check-in', 'baggage', 'seat', 'cabin', 'pilot', 'crew', 'passenger', 'booking', 'reservation']
-            return any(term in text for term in flight_terms)
-        elif transport_type == 'train':
-            train_terms = ['railway', 'railways', 'train', 'trains', 'rail', 'metro', 'subway', 'locomotive', 'station', 'platform', 'express', 'mail', 'passenger', 'booking', 'ticket', 'fare', 'route', 'journey']
-            return any(term in text for term in train_terms)
-        elif transport_type == 'bus':
-            bus_terms = ['bus', 'buses', 'coach', 'coaches', 'transit', 'public transport', 'shuttle', 'redbus', 'travels', 'operator', 'transport', 'booking', 'ticket', 'fare', 'route', 'journey', 'smartbus', 'intrcity', 'orange', 'kpn', 'parveen']
-            return any(term in text for term in bus_terms)
-        elif transport_type == 'car':
-            car_terms = ['rental', 'car', 'vehicle', 'hire', 'drive', 'automobile', 'taxi', 'cab']
-            return any(term in text for term in car_terms)
-        
-        return False
+        if not distinctive.search(text):
+            return None
+        if any(other.search(text) for other_type, other in TRANSPORT_DISTINCTIVE_RE.items() if other_type != transport_type):
+            return None
+        return True
     
     def _get_user_transportation_preference(self, answers: List[Dict], group_preferences: Dict = None) -> str:
         """Extract user's transportation preference from answers - STRICT MATCHING
         Prioritizes answers matching the current trip_leg if specified in group_preferences"""
         if not answers:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.warning("⚠️ No answers provided")
             return None
         
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info(f"🔍 Analyzing {len(answers)} answers for transportation preference...")
         
         # Get current trip_leg from group_preferences
@@ -1034,21 +1705,6 @@ Respond ONLY with the JSON array, no additional text.
         if current_trip_leg:
             logger.info(f"🎯 Prioritizing answers for trip_leg: '{current_trip_leg}'")
         
-        # Normalize transport type mappings (case-insensitive)
-        transport_mapping = {
-            'bus': 'bus',
-            'train': 'train',
-            'flight': 'flight',
-            'flights': 'flight',
-            'airplane': 'flight',
-            'plane': 'flight',
-            'airline': 'flight',
-            'car rental': 'car rental',
-            'car': 'car rental',
-            'rental': 'car rental',
-            'mixed': 'mixed'
-        }
-        
         # Debug: print all answers
         for i, answer in enumerate(answers):
             question_text = answer.get('question_text', '')
@@ -1100,7 +1756,7 @@ Respond ONLY with the JSON array, no additional text.
             # and this answer is in the leg-specific bucket, treat it as transport preference
             if not is_transport_question and not question_text and answer_value:
                 answer_str = str(answer_value).strip().lower()
-                if answer_str in transport_mapping and answer in leg_specific_answers:
+                if answer_str in TRANSPORT_MODE_ALIASES and answer in leg_specific_answers:
                     is_transport_question = True
                     logger.info(f"   Treating '{answer_value}' as transport preference (leg-specific answer with transport value)")
             
@@ -1118,13 +1774,13 @@ Respond ONLY with the JSON array, no additional text.
                     # Multiple selection - take first and normalize
                     if value_to_check:
                         result = str(value_to_check[0]).strip()
-                        normalized = transport_mapping.get(result.lower(), result.lower())
+                        normalized = TRANSPORT_MODE_ALIASES.get(result.lower(), result.lower())
                         logger.info(f"✅ Found transportation preference (from list): '{result}' -> normalized: '{normalized}'")
                         return normalized
                 elif isinstance(value_to_check, str):
                     # Direct string - normalize it
                     result = value_to_check.strip()
-                    normalized = transport_mapping.get(result.lower(), result.lower())
+                    normalized = TRANSPORT_MODE_ALIASES.get(result.lower(), result.lower())
                     logger.info(f"✅ Found transportation preference (as string): '{result}' -> normalized: '{normalized}'")
                     return normalized
                 elif isinstance(value_to_check, dict):
@@ -1132,7 +1788,7 @@ Respond ONLY with the JSON array, no additional text.
                     value = value_to_check.get('value') or value_to_check.get('answer_value') or value_to_check.get('text')
                     if value:
                         result = str(value).strip()
-                        normalized = transport_mapping.get(result.lower(), result.lower())
+                        normalized = TRANSPORT_MODE_ALIASES.get(result.lower(), result.lower())
                         logger.info(f"✅ Found transportation preference (from object): '{result}' -> normalized: '{normalized}'")
                         return normalized
         
@@ -1155,7 +1811,7 @@ Respond ONLY with the JSON array, no additional text.
                 text_to_check += ' ' + str(answer_text).lower()
             
             # Check if answer contains transport keywords
-            for keyword, transport_type in transport_mapping.items():
+            for keyword, transport_type in TRANSPORT_MODE_ALIASES.items():
                 if keyword in text_to_check:
                     logger.info(f"✅ Found transportation keyword '{keyword}' in answer -> '{transport_type}'")
                     return transport_type
@@ -1246,30 +1902,22 @@ Respond ONLY with the JSON array, no additional text.
     
     def _create_transportation_booking_url(self, suggestion: Dict, destination: str, transport_type: str, answers: List[Dict] = None, group_preferences: Dict = None) -> str:
         """Create booking URL based on transportation type"""
-        if transport_type.lower() == 'flight':
-            return self._create_flight_booking_url(suggestion, destination, answers, group_preferences)
-        elif transport_type.lower() == 'train':
-            return self._create_train_booking_url(suggestion, destination, answers, group_preferences)
-        elif transport_type.lower() == 'bus':
-            return self._create_bus_booking_url(suggestion, destination, answers, group_preferences)
-        elif transport_type.lower() == 'car rental':
-            return self._create_car_rental_booking_url(suggestion, destination, answers, group_preferences)
-        else:
-            # For other transportation types, use Google Maps
-            return self._create_maps_url(suggestion, destination)
+        builder = self._booking_url_builders.get(transport_type.strip().lower())
+        if builder:
+            return builder(suggestion, destination, answers, group_preferences)
+        # For other transportation types, use Google Maps
+        return self._create_maps_url(suggestion, destination)
     
     def _create_train_booking_url(self, suggestion: Dict, destination: str, answers: List[Dict] = None, group_preferences: Dict = None) -> str:
         """Create train booking URL using EaseMyTrip"""
         try:
-            import urllib.parse
-            
             # Extract travel details
             from_location = group_preferences.get('from_location', '') if group_preferences else ''
             departure_date = self._extract_departure_date(answers, group_preferences)
             return_date = self._extract_return_date(answers, group_preferences)
             
             # Use EaseMyTrip for train bookings
-            easemytrip_url = f"https://www.easemytrip.com/railways/?from={urllib.parse.quote(from_location)}&to={urllib.parse.quote(destination)}&departure={departure_date}"
+            easemytrip_url = f"https://www.easemytrip.com/railways/?from={_quote_location(from_location)}&to={_quote_location(destination)}&departure={departure_date}"
             return easemytrip_url
             
         except Exception as e:
@@ -1294,7 +1942,7 @@ Respond ONLY with the JSON array, no additional text.
             Use URL encoding for special characters in location names.
             """
             
-            response = self.model.generate_content(prompt)
+            response = self.model_fast.generate_content(prompt)
             result = response.text.strip()
             
             # Validate that it looks like a URL
@@ -1302,24 +1950,20 @@ Respond ONLY with the JSON array, no additional text.
                 return result
             else:
                 # Fallback to generic train booking
-                import urllib.parse
-                return f"https://www.thetrainline.com/search?from={urllib.parse.quote(from_location)}&to={urllib.parse.quote(destination)}&departure={departure_date}"
+                return f"https://www.thetrainline.com/search?from={_quote_location(from_location)}&to={_quote_location(destination)}&departure={departure_date}"
                 
         except Exception as e:
             # Fallback to generic train booking
-            import urllib.parse
-            return f"https://www.thetrainline.com/search?from={urllib.parse.quote(from_location)}&to={urllib.parse.quote(destination)}&departure={departure_date}"
+            return f"https://www.thetrainline.com/search?from={_quote_location(from_location)}&to={_quote_location(destination)}&departure={departure_date}"
     
     def _create_bus_booking_url(self, suggestion: Dict, destination: str, answers: List[Dict] = None, group_preferences: Dict = None) -> str:
         """Create bus booking URL using EaseMyTrip"""
         try:
-            import urllib.parse
-            
             from_location = group_preferences.get('from_location', '') if group_preferences else ''
             departure_date = self._extract_departure_date(answers, group_preferences)
             
             # Use EaseMyTrip for bus bookings
-            easemytrip_url = f"https://www.easemytrip.com/bus/?from={urllib.parse.quote(from_location)}&to={urllib.parse.quote(destination)}&departure={departure_date}"
+            easemytrip_url = f"https://www.easemytrip.com/bus/?from={_quote_location(from_location)}&to={_quote_location(destination)}&departure={departure_date}"
             return easemytrip_url
             
         except Exception as e:
@@ -1344,7 +1988,7 @@ Respond ONLY with the JSON array, no additional text.
             Use URL encoding for special characters in location names.
             """
             
-            response = self.model.generate_content(prompt)
+            response = self.model_fast.generate_content(prompt)
             result = response.text.strip()
             
             # Validate that it looks like a URL
@@ -1352,13 +1996,11 @@ Respond ONLY with the JSON array, no additional text.
                 return result
             else:
                 # Fallback to generic bus booking
-                import urllib.parse
-                return f"https://www.busbud.com/en/search?from={urllib.parse.quote(from_location)}&to={urllib.parse.quote(destination)}&departure={departure_date}"
+                return f"https://www.busbud.com/en/search?from={_quote_location(from_location)}&to={_quote_location(destination)}&departure={departure_date}"
                 
         except Exception as e:
             # Fallback to generic bus booking
-            import urllib.parse
-            return f"https://www.busbud.com/en/search?from={urllib.parse.quote(from_location)}&to={urllib.parse.quote(destination)}&departure={departure_date}"
+            return f"https://www.busbud.com/en/search?from={_quote_location(from_location)}&to={_quote_location(destination)}&departure={departure_date}"
     
     def _create_car_rental_booking_url(self, suggestion: Dict, destination: str, answers: List[Dict] = None, group_preferences: Dict = None) -> str:
         """Create car rental booking URL using AI to generate appropriate booking site for any location"""
@@ -1394,7 +2036,7 @@ Respond ONLY with the JSON array, no additional text.
             Use URL encoding for special characters in location names.
             """
             
-            response = self.model.generate_content(prompt)
+            response = self.model_fast.generate_content(prompt)
             result = response.text.strip()
             
             # Validate that it looks like a URL
@@ -1402,18 +2044,15 @@ Respond ONLY with the JSON array, no additional text.
                 return result
             else:
                 # Fallback to generic car rental booking
-                import urllib.parse
-                return f"https://www.rentalcars.com/en/city/{urllib.parse.quote(destination.lower())}/?pickupDate={departure_date}&returnDate={return_date}"
+                return f"https://www.rentalcars.com/en/city/{_quote_location(destination.lower())}/?pickupDate={departure_date}&returnDate={return_date}"
                 
         except Exception as e:
             # Fallback to generic car rental booking
-            import urllib.parse
-            return f"https://www.rentalcars.com/en/city/{urllib.parse.quote(destination.lower())}/?pickupDate={departure_date}&returnDate={return_date}"
+            return f"https://www.rentalcars.com/en/city/{_quote_location(destination.lower())}/?pickupDate={departure_date}&returnDate={return_date}"
     
     def _create_maps_url(self, suggestion: Dict, destination: str) -> str:
         """Create a Google Maps search URL"""
         try:
-            import urllib.parse
             # Create a Google Maps search URL for the exact property name
             place_name = suggestion.get('name', '')
             location = suggestion.get('location', '')
@@ -1430,25 +2069,26 @@ Respond ONLY with the JSON array, no additional text.
                 # Fallback to location-based search
                 search_query = f"{location} {destination}" if location else destination
             
-            # URL encode the search query
-            encoded_query = urllib.parse.quote_plus(search_query)
-            
             # Create Google Maps search URL
-            maps_url = f"https://www.google.com/maps/search/?api=1&query={encoded_query}"
-            
-            return maps_url
+            return self._maps_search_url(search_query)
             
         except Exception as e:
             # Fallback to basic destination search
-            import urllib.parse
-            encoded_destination = urllib.parse.quote_plus(destination)
-            return f"https://www.google.com/maps/search/?api=1&query={encoded_destination}"
+            return self._maps_search_url(destination)
+    
+    @staticmethod
+    def _maps_search_url(query: str) -> str:
+        """Google Maps search URL for a free-text query"""
+        return GOOGLE_MAPS_SEARCH_URL + urllib.parse.quote_plus(query)
+    
+    @staticmethod
+    def _search_url(*terms: str) -> str:
+        """Google web search URL joining the non-empty terms with '+'"""
+        return GOOGLE_SEARCH_URL + "+".join(urllib.parse.quote_plus(term) for term in terms if term)
     
     def _generate_transportation_suggestions(self, destination: str, answers: List[Dict], group_preferences: Dict = None) -> List[Dict]:
         """Generate transportation suggestions using real EaseMyTrip data"""
         try:
-            import logging
-            logger = logging.getLogger(__name__)
             
             from_location = group_preferences.get('from_location', '') if group_preferences else ''
             departure_date = self._extract_departure_date(answers, group_preferences)
@@ -1507,10 +2147,13 @@ Respond ONLY with the JSON array, no additional text.
                     )
             elif transport_type_lower == 'flight' or transport_type_lower == 'flights':
                 logger.info("✈️ Generating FLIGHT suggestions ONLY (user selected Flight)...")
-                flight_suggestions = self._generate_ai_flight_suggestions(from_location, destination, departure_date, return_date, passengers=1, class_type="Economy", answers=answers)
+                flight_suggestions, flight_preferences = self._generate_flight_suggestions_and_preferences(
+                    from_location, destination, departure_date, return_date, passengers=1, class_type="Economy",
+                    answers=answers, trip_leg=trip_leg or 'departure'
+                )
                 suggestions = self._enhance_transport_suggestions(
                     flight_suggestions if flight_suggestions else [],
-                    from_location, destination, answers, group_preferences
+                    from_location, destination, answers, group_preferences, preferences=flight_preferences
                 )
             elif transport_type:
                 # User selected something other than bus/train/flight
@@ -1521,10 +2164,13 @@ Respond ONLY with the JSON array, no additional text.
                 logger.warning(f"⚠️ No transport preference selected - defaulting based on route...")
                 if is_international:
                     logger.info(f"⚠️ No preference - INTERNATIONAL travel, defaulting to FLIGHTS...")
-                    flight_suggestions = self._generate_ai_flight_suggestions(from_location, destination, departure_date, return_date, passengers=1, class_type="Economy", answers=answers)
+                    flight_suggestions, flight_preferences = self._generate_flight_suggestions_and_preferences(
+                        from_location, destination, departure_date, return_date, passengers=1, class_type="Economy",
+                        answers=answers, trip_leg=trip_leg or 'departure'
+                    )
                     suggestions = self._enhance_transport_suggestions(
                         flight_suggestions if flight_suggestions else [],
-                        from_location, destination, answers, group_preferences
+                        from_location, destination, answers, group_preferences, preferences=flight_preferences
                     )
                 else:
                     logger.info(f"⚠️ No preference - domestic travel, defaulting to BUS...")
@@ -1564,9 +2210,38 @@ Respond ONLY with the JSON array, no additional text.
     def _extract_transport_preferences_ai(self, answers: List[Dict], trip_leg: str = 'departure') -> Dict:
         """Extract transportation preferences from user's textbox answers using AI.
         Returns structured preferences like bus_type, time_preference, amenities, etc."""
-        if not answers:
+        combined_preferences = self._transport_preference_text(answers, trip_leg)
+        if not combined_preferences:
             return {}
         
+        # Use AI to extract structured preferences
+        try:
+            prompt = f"""Extract transportation preferences from this user text: "{combined_preferences}"
+
+Return a JSON object with these fields (use null if not mentioned):
+{TRANSPORT_PREFERENCES_SCHEMA}
+
+Examples:
+- "AC Sleeper bus, preferably night time" -> {{"bus_type": ["AC Sleeper"], "time_preference": ["night"]}}
+- "I want morning train with WiFi" -> {{"time_preference": ["morning"], "amenities": ["WiFi"]}}
+- "Avoid KSRTC, prefer VRL" -> {{"avoid_operators": ["KSRTC"], "preferred_operators": ["VRL"]}}
+
+Return ONLY valid JSON, no other text."""
+            
+            preferences = self._generate_json_object_with_gemini(prompt)
+            if not isinstance(preferences, dict):
+                raise ValueError("Preference response did not contain a JSON object")
+            return preferences
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to extract preferences with AI: {e}, using fallback")
+            # Fallback to simple keyword matching
+            return self._extract_preferences_fallback(combined_preferences)
+    
+    def _transport_preference_text(self, answers: List[Dict], trip_leg: str = 'departure') -> str:
+        """Combine the free-text preference answers for a trip leg"""
+        if not answers:
+            return ''
+        
         # Find preference text answers for the specific trip leg
         preference_texts = []
         for answer in answers:
@@ -1586,53 +2261,8 @@ Respond ONLY with the JSON array, no additional text.
                 if isinstance(answer_value, str) and len(answer_value.strip()) > 0:
                     preference_texts.append(answer_value.strip())
         
-        if not preference_texts:
-            return {}
-        
         # Combine all preference texts
-        combined_preferences = ' '.join(preference_texts)
-        
-        # Use AI to extract structured preferences
-        try:
-            prompt = f"""Extract transportation preferences from this user text: "{combined_preferences}"
-
-Return a JSON object with these fields (use null if not mentioned):
-{{
-  "bus_type": ["AC Sleeper", "Non-AC", "Sleeper", "Seater", "Semi-Sleeper"] or null,
-  "time_preference": ["morning", "afternoon", "evening", "night", "late night"] or null,
-  "amenities": ["WiFi", "Charging", "Blanket", "Water", "Snacks"] or null,
-  "preferred_operators": [list of operator names] or null,
-  "avoid_operators": [list of operator names to avoid] or null,
-  "seat_preference": ["window", "aisle", "lower", "upper"] or null,
-  "other_requirements": [any other specific requirements] or null
-}}
-
-Examples:
-- "AC Sleeper bus, preferably night time" -> {{"bus_type": ["AC Sleeper"], "time_preference": ["night"]}}
-- "I want morning train with WiFi" -> {{"time_preference": ["morning"], "amenities": ["WiFi"]}}
-- "Avoid KSRTC, prefer VRL" -> {{"avoid_operators": ["KSRTC"], "preferred_operators": ["VRL"]}}
-
-Return ONLY valid JSON, no other text."""
-            
-            response = self.model.generate_content(prompt)
-            response_text = response.text.strip()
-            
-            # Clean up response (remove markdown code blocks if present)
-            if response_text.startswith('```'):
-                response_text = response_text.split('```')[1]
-                if response_text.startswith('json'):
-                    response_text = response_text[4:]
-                response_text = response_text.strip()
-            
-            import json
-            preferences = json.loads(response_text)
-            return preferences
-        except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"⚠️ Failed to extract preferences with AI: {e}, using fallback")
-            # Fallback to simple keyword matching
-            return self._extract_preferences_fallback(combined_preferences)
+        return ' '.join(preference_texts)
     
     def _extract_preferences_fallback(self, text: str) -> Dict:
         """Fallback preference extraction using keyword matching"""
@@ -1641,9 +2271,9 @@ Return ONLY valid JSON, no other text."""
         
         # Bus type detection
         bus_types = []
-        if any(word in text_lower for word in ['ac sleeper', 'air conditioned sleeper', 'ac sleeper']):
+        if AC_SLEEPER_TERMS_RE.search(text_lower):
             bus_types.append('AC Sleeper')
-        if any(word in text_lower for word in ['non-ac', 'non ac', 'non air conditioned']):
+        if NON_AC_TERMS_RE.search(text_lower):
             bus_types.append('Non-AC')
         if 'sleeper' in text_lower and 'ac sleeper' not in text_lower:
             bus_types.append('Sleeper')
@@ -1656,13 +2286,13 @@ Return ONLY valid JSON, no other text."""
         
         # Time preference
         time_prefs = []
-        if any(word in text_lower for word in ['morning', 'early morning', 'am']):
+        if MORNING_TERMS_RE.search(text_lower):
             time_prefs.append('morning')
-        if any(word in text_lower for word in ['afternoon', 'noon']):
+        if AFTERNOON_TERMS_RE.search(text_lower):
             time_prefs.append('afternoon')
-        if any(word in text_lower for word in ['evening', 'evening']):
+        if 'evening' in text_lower:
             time_prefs.append('evening')
-        if any(word in text_lower for word in ['night', 'night time', 'nighttime', 'late night', 'overnight']):
+        if NIGHT_TERMS_RE.search(text_lower):
             time_prefs.append('night')
         if time_prefs:
             preferences['time_preference'] = time_prefs
@@ -1674,6 +2304,12 @@ Return ONLY valid JSON, no other text."""
         if not preferences or not suggestions:
             return suggestions
         
+        # Normalize the preference lists once; they are the same for every suggestion
+        preferred_types = tuple(bt.lower() for bt in preferences.get('bus_type') or ())
+        time_prefs = frozenset(tp.lower() for tp in preferences.get('time_preference') or ())
+        preferred_operators = tuple(op.lower() for op in preferences.get('preferred_operators') or ())
+        avoid_operators = tuple(op.lower() for op in preferences.get('avoid_operators') or ())
+        
         scored = []
         for suggestion in suggestions:
             score = 0
@@ -1681,16 +2317,14 @@ Return ONLY valid JSON, no other text."""
             departure_time = suggestion.get('departure_time', '')
             
             # Check bus type preference
-            if preferences.get('bus_type'):
-                preferred_types = [bt.lower() for bt in preferences['bus_type']]
+            if preferred_types:
                 if any(pt in suggestion_text for pt in preferred_types):
                     score += 10
                 else:
                     score -= 5  # Penalize if doesn't match
             
             # Check time preference
-            if preferences.get('time_preference') and departure_time:
-                time_prefs = [tp.lower() for tp in preferences['time_preference']]
+            if time_prefs and departure_time:
                 hour = self._extract_hour_from_time(departure_time)
                 
                 if 'night' in time_prefs and hour and (hour >= 20 or hour < 6):
@@ -1705,14 +2339,13 @@ Return ONLY valid JSON, no other text."""
                     score -= 3  # Small penalty for not matching time
             
             # Check operator preferences
-            if preferences.get('preferred_operators'):
-                operator_name = suggestion.get('operator', '').lower()
-                if any(op.lower() in operator_name for op in preferences['preferred_operators']):
+            operator_name = suggestion.get('operator', '').lower()
+            if preferred_operators:
+                if any(op in operator_name for op in preferred_operators):
                     score += 5
             
-            if preferences.get('avoid_operators'):
-                operator_name = suggestion.get('operator', '').lower()
-                if any(op.lower() in operator_name for op in preferences['avoid_operators']):
+            if avoid_operators:
+                if any(op in operator_name for op in avoid_operators):
                     score -= 20  # Strong penalty, but don't exclude completely
             
             suggestion['_preference_score'] = score
@@ -1747,18 +2380,19 @@ Return ONLY valid JSON, no other text."""
             pass
         return None
 
-    def _enhance_transport_suggestions(self, suggestions: List[Dict], from_location: str, destination: str, answers: List[Dict] = None, group_preferences: Dict = None) -> List[Dict]:
-        """Enhance transportation suggestions - NO MAPS, ONLY EaseMyTrip booking URLs"""
+    def _enhance_transport_suggestions(self, suggestions: List[Dict], from_location: str, destination: str, answers: List[Dict] = None, group_preferences: Dict = None,
+                                       preferences: Optional[Dict] = None) -> List[Dict]:
+        """Enhance transportation suggestions - NO MAPS, ONLY EaseMyTrip booking URLs
+        (preferences may be precomputed, e.g. by the fused flight call)"""
         import urllib.parse
         
         # Extract preferences using AI
         trip_leg = (group_preferences.get('trip_leg') or 'departure').lower() if group_preferences else 'departure'
-        preferences = self._extract_transport_preferences_ai(answers, trip_leg)
+        if preferences is None:
+            preferences = self._extract_transport_preferences_ai(answers, trip_leg)
         
         # Filter suggestions based on preferences
         if preferences:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.info(f"🎯 Filtering {len(suggestions)} suggestions based on preferences: {preferences}")
             suggestions = self._filter_suggestions_by_preferences(suggestions, preferences)
             logger.info(f"✅ Filtered to {len(suggestions)} matching suggestions")
@@ -1776,6 +2410,9 @@ Return ONLY valid JSON, no other text."""
         if not return_date and group_preferences:
             return_date = group_preferences.get('end_date', '')
         
+        # Route is the same for every suggestion - encode it once
+        route_query = f"from={_quote_location(from_location)}&to={_quote_location(destination)}"
+        
         enhanced = []
         for suggestion in suggestions:
             # CRITICAL: Remove any maps URLs - transportation doesn't need maps
@@ -1806,11 +2443,11 @@ Return ONLY valid JSON, no other text."""
                     pass  # Keep original format if conversion fails
             
             # Create EaseMyTrip URL based on transport type
-            if any(word in combined_text for word in ['bus', 'travels', 'coach', 'ksrtc', 'vrl', 'orange', 'srs', 'kpn', 'neeta']):
-                booking_url = f"https://www.easemytrip.com/bus/?from={urllib.parse.quote(from_location)}&to={urllib.parse.quote(destination)}&departure={suggestion_departure}"
-            elif any(word in combined_text for word in ['train', 'express', 'railway', 'rail']):
-                booking_url = f"https://www.easemytrip.com/railways/?from={urllib.parse.quote(from_location)}&to={urllib.parse.quote(destination)}&departure={suggestion_departure}"
-            elif any(word in combined_text for word in ['flight', 'airline', 'airways', 'air', 'emirates', 'qatar', 'indi', 'jet', 'spice']):
+            if BUS_TERMS_RE.search(combined_text):
+                booking_url = f"https://www.easemytrip.com/bus/?{route_query}&departure={suggestion_departure}"
+            elif TRAIN_TERMS_RE.search(combined_text):
+                booking_url = f"https://www.easemytrip.com/railways/?{route_query}&departure={suggestion_departure}"
+            elif FLIGHT_TERMS_RE.search(combined_text):
                 suggestion_return = suggestion.get('return_date') or return_date
                 # Format return date if needed
                 if suggestion_return and '/' in str(suggestion_return):
@@ -1821,12 +2458,12 @@ Return ONLY valid JSON, no other text."""
                     except:
                         pass
                 if suggestion_return:
-                    booking_url = f"https://www.easemytrip.com/flights/?from={urllib.parse.quote(from_location)}&to={urllib.parse.quote(destination)}&departure={suggestion_departure}&return={suggestion_return}"
+                    booking_url = f"https://www.easemytrip.com/flights/?{route_query}&departure={suggestion_departure}&return={suggestion_return}"
                 else:
-                    booking_url = f"https://www.easemytrip.com/flights/?from={urllib.parse.quote(from_location)}&to={urllib.parse.quote(destination)}&departure={suggestion_departure}"
+                    booking_url = f"https://www.easemytrip.com/flights/?{route_query}&departure={suggestion_departure}"
             else:
                 # Default to bus
-                booking_url = f"https://www.easemytrip.com/bus/?from={urllib.parse.quote(from_location)}&to={urllib.parse.quote(destination)}&departure={suggestion_departure}"
+                booking_url = f"https://www.easemytrip.com/bus/?{route_query}&departure={suggestion_departure}"
             
             # Set booking URLs - ensure EaseMyTrip only
             suggestion['booking_url'] = booking_url
@@ -1888,14 +2525,11 @@ Generate 5-8 realistic flight options.
             
             response = self.model.generate_content(prompt)
             suggestions_text = response.text
-            suggestions_data = json.loads(suggestions_text)
+            suggestions_data = json_loads(suggestions_text)
             suggestions = suggestions_data.get('suggestions', [])
             
             # Enhance with booking URLs
-            enhanced_suggestions = []
-            for suggestion in suggestions:
-                enhanced = self._enhance_with_maps(suggestion, destination, answers, group_preferences)
-                enhanced_suggestions.append(enhanced)
+            enhanced_suggestions = self._enhance_all_with_maps(suggestions, destination, answers, group_preferences)
             
             return enhanced_suggestions
             
@@ -1906,6 +2540,17 @@ Generate 5-8 realistic flight options.
                                        departure_date: str, return_date: str = None, 
                                        passengers: int = 1, class_type: str = "Economy", answers: List[Dict] = None) -> List[Dict]:
         """Generate flight suggestions using AI - fully dynamic, no hardcoding"""
+        suggestions, _ = self._generate_flight_suggestions_and_preferences(
+            origin, destination, departure_date, return_date, passengers, class_type, answers
+        )
+        return suggestions
+    
+    def _generate_flight_suggestions_and_preferences(self, origin: str, destination: str,
+                                                     departure_date: str, return_date: str = None,
+                                                     passengers: int = 1, class_type: str = "Economy", answers: List[Dict] = None,
+                                                     trip_leg: str = 'departure') -> Tuple[List[Dict], Optional[Dict]]:
+        """Generate flight suggestions and extract the leg's transport preferences in one AI call.
+        Preferences are None when they could not be read from the response."""
         try:
             # Get currency dynamically
             from utils import get_currency_from_destination
@@ -1914,6 +2559,19 @@ Generate 5-8 realistic flight options.
             # Build context from user answers
             context = self._build_flight_context_from_answers(answers) if answers else ""
             
+            # Ask for the structured preferences in the same response instead of a second round-trip
+            preference_text = self._transport_preference_text(answers, trip_leg)
+            if preference_text:
+                preference_section = f"""
+USER PREFERENCE TEXT: "{preference_text}"
+Also extract these preferences into "preferences" in the output, with these fields (use null if not mentioned):
+{TRANSPORT_PREFERENCES_SCHEMA}
+"""
+                preference_output = ',\n  "preferences": {...}'
+            else:
+                preference_section = ""
+                preference_output = ""
+            
             # Create AI prompt
             prompt = f"""You are a flight booking expert. Generate realistic flight options.
 
@@ -1927,7 +2585,7 @@ TRIP DETAILS:
 - Currency: {currency}
 
 {context}
-
+{preference_section}
 INSTRUCTIONS:
 1. Analyze the route (distance, popularity, international/domestic)
 2. Select real airlines that operate this route
@@ -1958,7 +2616,7 @@ OUTPUT FORMAT (JSON):
       "name": "Airline Name",
       "description": "Flight description"
     }}
-  ]
+  ]{preference_output}
 }}
 
 Generate realistic, bookable options now."""
@@ -1967,16 +2625,23 @@ Generate realistic, bookable options now."""
             response = self.model.generate_content(prompt)
             
             if response and response.text:
-                # Parse and return
-                return self._parse_flight_response(response.text, origin, destination, departure_date, return_date)
+                # Parse once and split the flights from the extracted preferences
+                parsed = self._extract_json_value(response.text, '{')
+                if not preference_text:
+                    preferences = {}
+                elif isinstance(parsed, dict) and isinstance(parsed.get('preferences'), dict):
+                    preferences = parsed['preferences']
+                else:
+                    preferences = None
+                return self._flight_suggestions_from_parsed(parsed, origin, destination, departure_date, return_date), preferences
             else:
                 # Fallback to AI-generated fallback
-                return self._generate_ai_flight_fallback(origin, destination, departure_date, return_date, currency, class_type)
+                return self._generate_ai_flight_fallback(origin, destination, departure_date, return_date, currency, class_type), None
             
         except Exception as e:
             print(f"Error generating flight suggestions: {e}")
             # Ultimate fallback
-            return []
+            return [], None
     
     def _build_flight_context_from_answers(self, answers: List[Dict]) -> str:
         """Extract relevant context from user answers dynamically"""
@@ -2013,31 +2678,28 @@ Return ONLY valid JSON array:
 [{{"airline":"Name","price":1000,"currency":"{currency}","duration":"2h 30m","departure_time":"08:00","arrival_time":"10:30","rating":4.0,"features":["Meals"]}}]"""
         
         try:
-            import json
-            import re
-            response = self.model.generate_content(fallback_prompt)
+            response = self.model_fast.generate_content(fallback_prompt)
             
             if response and response.text:
-                json_match = re.search(r'\[.*\]', response.text, re.DOTALL)
-                if json_match:
-                    flights = json.loads(json_match.group())
-                    
-                    # Add required fields
-                    for flight in flights:
-                        flight.update({
-                            'origin': origin,
-                            'destination': destination,
-                            'departure_date': departure_date,
-                            'return_date': return_date,
-                            'location': f"{origin} to {destination}",
-                            'name': flight.get('airline', 'Flight'),
-                            'description': f"Flight to {destination}",
-                            'booking_url': f"https://www.google.com/flights?q={origin}+to+{destination}",
-                            'external_url': f"https://www.google.com/flights?q={origin}+to+{destination}",
-                            'link_type': 'booking'
-                        })
-                    
-                    return flights
+                flights = self._extract_json_value(response.text, '[')
+                if flights is not None:
+                    # Add required fields - everything except the name is the same for every flight
+                    flights_url = f"https://www.google.com/flights?q={origin}+to+{destination}"
+                    shared_fields = {
+                        'origin': origin,
+                        'destination': destination,
+                        'departure_date': departure_date,
+                        'return_date': return_date,
+                        'location': f"{origin} to {destination}",
+                        'description': f"Flight to {destination}",
+                        'booking_url': flights_url,
+                        'external_url': flights_url,
+                        'link_type': 'booking'
+                    }
+                    return [
+                        {**flight, **shared_fields, 'name': flight.get('airline', 'Flight')}
+                        for flight in flights
+                    ]
         except Exception as e:
             print(f"Fallback error: {e}")
         
@@ -2047,30 +2709,41 @@ Return ONLY valid JSON array:
                               departure_date: str, return_date: str = None) -> List[Dict]:
         """Parse AI response into structured flight data"""
         try:
-            import json
-            import re
-            
             # Look for JSON in the response
-            json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
-            if json_match:
-                parsed = json.loads(json_match.group())
+            parsed = self._extract_json_value(ai_response, '{')
+        except Exception as e:
+            print(f"Parse error: {e}")
+            return []
+        return self._flight_suggestions_from_parsed(parsed, origin, destination, departure_date, return_date)
+    
+    def _flight_suggestions_from_parsed(self, parsed: Any, origin: str, destination: str,
+                                        departure_date: str, return_date: str = None) -> List[Dict]:
+        """Build structured flight data from an already-decoded AI response"""
+        try:
+            if parsed is not None:
                 suggestions = parsed.get('suggestions', [])
                 
-                # Enrich each suggestion with metadata
-                for suggestion in suggestions:
-                    suggestion.update({
-                        'origin': origin,
-                        'destination': destination,
-                        'departure_date': departure_date,
-                        'return_date': return_date,
-                        'location': f"{origin} to {destination}",
+                # Enrich each suggestion with metadata (route fields are shared by all suggestions)
+                shared_fields = {
+                    'origin': origin,
+                    'destination': destination,
+                    'departure_date': departure_date,
+                    'return_date': return_date,
+                    'location': f"{origin} to {destination}",
+                    'link_type': 'booking'
+                }
+                default_description = f"Flight to {destination}"
+                default_url = f"https://www.google.com/flights?q={origin}+to+{destination}"
+                return [
+                    {
+                        **suggestion,
+                        **shared_fields,
                         'name': suggestion.get('airline', 'Flight'),
-                        'description': suggestion.get('description', f"Flight to {destination}"),
-                        'external_url': suggestion.get('booking_url', f"https://www.google.com/flights?q={origin}+to+{destination}"),
-                        'link_type': 'booking'
-                    })
-                
-                return suggestions
+                        'description': suggestion.get('description', default_description),
+                        'external_url': suggestion.get('booking_url', default_url),
+                    }
+                    for suggestion in suggestions
+                ]
             
             return []
         except Exception as e:
@@ -2080,10 +2753,7 @@ Return ONLY valid JSON array:
     def _generate_accommodation_suggestions_places(self, destination: str, answers: List[Dict], group_preferences: Dict = None, preference_constraints: Dict = None) -> List[Dict]:
         """Generate accommodation suggestions using Google Places API"""
         try:
-            print(f"\n{'='*50}")
-            print(f"GENERATING ACCOMMODATION SUGGESTIONS")
-            print(f"🔍 DESTINATION RECEIVED: '{destination}'")
-            print(f"{'='*50}\n")
+            logger.debug("🔍 Generating accommodation suggestions for %r", destination)
             
             # Extract user preferences and travel data
             context = self._prepare_context('accommodation', destination, answers, group_preferences, None)
@@ -2110,26 +2780,26 @@ Return ONLY valid JSON array:
                     accommodation_preferences.setdefault('amenities', preference_constraints['amenities'])
                 if preference_constraints.get('location'):
                     accommodation_preferences.setdefault('LOCATION_PREFERENCES', preference_constraints['location'])
-            print(f"✓ Extracted preferences: {accommodation_preferences}")
+            logger.debug("✓ Extracted preferences: %s", accommodation_preferences)
             
             # OPTIMIZED: Search Google Places API with EXACT budget range in queries (filters at API level)
             places_results = self._search_google_places(destination, accommodation_preferences, currency)
-            print(f"✓ Google Places returned {len(places_results)} results")
+            logger.debug("✓ Google Places returned %s results", len(places_results))
             
             # Format results based on user preferences
             suggestions = self._format_places_results(places_results, destination, context, currency, start_date, end_date, accommodation_preferences)
-            print(f"✓ Formatted {len(suggestions)} suggestions")
+            logger.debug("✓ Formatted %s suggestions", len(suggestions))
             
             # OPTIMIZED: Since queries already include exact budget range and accommodation types,
             # we can skip expensive AI preference filtering - just do quick validation
-            print(f"Before quick validation: {len(suggestions)} suggestions")
+            logger.debug("Before quick validation: %s suggestions", len(suggestions))
             
             # Only quick budget check to remove obvious outliers (no slow AI)
             suggestions = self._quick_budget_validation(suggestions, accommodation_preferences, currency)
-            print(f"After quick budget validation: {len(suggestions)} suggestions")
+            logger.debug("After quick budget validation: %s suggestions", len(suggestions))
             
             if not suggestions:
-                print("⚠️ No accommodation suggestions found after Places lookup - using AI fallback list")
+                logger.warning("⚠️ No accommodation suggestions found after Places lookup - using AI fallback list")
                 return self._get_fallback_accommodation_suggestions(destination)
             
             # Store suggestions in database for future reference (background, non-blocking)
@@ -2145,7 +2815,7 @@ Return ONLY valid JSON array:
                 print(f"Error starting background storage: {e}")
             
             # Return ALL suggestions (no pagination limit)
-            print(f"✓ Returning all {len(suggestions)} suggestions")
+            logger.debug("✓ Returning all %s suggestions", len(suggestions))
             
             return suggestions
             
@@ -2156,10 +2826,7 @@ Return ONLY valid JSON array:
     def _generate_dining_suggestions_places_vertex(self, destination: str, answers: List[Dict], group_preferences: Dict = None, preference_constraints: Dict = None) -> List[Dict]:
         """Generate dining suggestions using Google Places API + Vertex AI for intelligent filtering"""
         try:
-            print(f"\n{'='*50}")
-            print(f"GENERATING DINING SUGGESTIONS (Places API + Vertex AI)")
-            print(f"🔍 DESTINATION: '{destination}'")
-            print(f"{'='*50}\n")
+            logger.debug("🔍 Generating dining suggestions (Places API + Vertex AI) for %r", destination)
             
             # Extract user preferences
             context = self._prepare_context('dining', destination, answers, group_preferences, None)
@@ -2169,14 +2836,14 @@ Return ONLY valid JSON array:
             
             # Extract dining preferences from answers
             dining_preferences = self._extract_dining_preferences(answers, preference_constraints)
-            print(f"✓ Extracted dining preferences: {dining_preferences}")
+            logger.debug("✓ Extracted dining preferences: %s", dining_preferences)
             
             # Step 1: Get real restaurants from Google Places API
             places_results = self._search_google_places_dining(destination, dining_preferences, currency)
-            print(f"✓ Google Places returned {len(places_results)} restaurant results")
+            logger.debug("✓ Google Places returned %s restaurant results", len(places_results))
             
             if not places_results:
-                print("⚠️ No restaurants found from Places API, falling back to AI-only")
+                logger.warning("⚠️ No restaurants found from Places API, falling back to AI-only")
                 return self._generate_dining_suggestions_ai_fallback(destination, answers, group_preferences, preference_constraints)
             
             # Step 2: Use Vertex AI to intelligently filter, rank, and describe based on user preferences
@@ -2189,7 +2856,7 @@ Return ONLY valid JSON array:
                 currency=currency
             )
             
-            print(f"✓ Vertex AI filtered/ranked to {len(suggestions)} best matches")
+            logger.debug("✓ Vertex AI filtered/ranked to %s best matches", len(suggestions))
             return suggestions
             
         except Exception as e:
@@ -2202,10 +2869,7 @@ Return ONLY valid JSON array:
     def _generate_activities_suggestions_places_vertex(self, destination: str, answers: List[Dict], group_preferences: Dict = None, preference_constraints: Dict = None) -> List[Dict]:
         """Generate activities suggestions using Google Places API + Vertex AI for intelligent filtering"""
         try:
-            print(f"\n{'='*50}")
-            print(f"GENERATING ACTIVITIES SUGGESTIONS (Places API + Vertex AI)")
-            print(f"🔍 DESTINATION: '{destination}'")
-            print(f"{'='*50}\n")
+            logger.debug("🔍 Generating activities suggestions (Places API + Vertex AI) for %r", destination)
             
             # Extract user preferences
             context = self._prepare_context('activities', destination, answers, group_preferences, None)
@@ -2215,14 +2879,14 @@ Return ONLY valid JSON array:
             
             # Extract activity preferences from answers
             activity_preferences = self._extract_activity_preferences(answers, preference_constraints)
-            print(f"✓ Extracted activity preferences: {activity_preferences}")
+            logger.debug("✓ Extracted activity preferences: %s", activity_preferences)
             
             # Step 1: Get real activities/attractions from Google Places API
             places_results = self._search_google_places_activities(destination, activity_preferences, currency)
-            print(f"✓ Google Places returned {len(places_results)} activity results")
+            logger.debug("✓ Google Places returned %s activity results", len(places_results))
             
             if not places_results:
-                print("⚠️ No activities found from Places API, falling back to AI-only")
+                logger.warning("⚠️ No activities found from Places API, falling back to AI-only")
                 return self._generate_activities_suggestions_ai_fallback(destination, answers, group_preferences, preference_constraints)
             
             # Step 2: Use Vertex AI to intelligently filter, rank, and describe based on user preferences
@@ -2235,7 +2899,7 @@ Return ONLY valid JSON array:
                 currency=currency
             )
             
-            print(f"✓ Vertex AI filtered/ranked to {len(suggestions)} best matches")
+            logger.debug("✓ Vertex AI filtered/ranked to %s best matches", len(suggestions))
             return suggestions
             
         except Exception as e:
@@ -2257,16 +2921,17 @@ Return ONLY valid JSON array:
         
         preferences = {}
         
-        for answer in answers:
-            question_text = answer.get('question_text', '')
-            answer_value = answer.get('answer_value')
-            
-            if not answer_value:
-                continue
-            
-            # Use AI to determine the preference key and value dynamically
-            preference_key, processed_value = self._process_user_answer_dynamically(question_text, answer_value)
-            
+        # Use AI to determine the preference key and value dynamically - one independent call per answer,
+        # so they run concurrently and are merged below in answer order
+        answered = [(answer.get('question_text', ''), answer.get('answer_value')) for answer in answers if answer.get('answer_value')]
+        if len(answered) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(len(answered), 8)) as executor:
+                processed = list(executor.map(lambda qa: self._process_user_answer_dynamically(*qa), answered))
+        else:
+            processed = [self._process_user_answer_dynamically(*qa) for qa in answered]
+        
+        for preference_key, processed_value in processed:
             if preference_key and processed_value is not None:
                 # Handle different data types dynamically
                 if isinstance(processed_value, list):
@@ -2308,7 +2973,7 @@ Return ONLY valid JSON array:
             If no valid preference can be extracted, return "NONE|NONE"
             """
             
-            response = self.model.generate_content(prompt)
+            response = self.model_fast.generate_content(prompt)
             result = response.text.strip()
             
             if "|" in result and result != "NONE|NONE":
@@ -2337,7 +3002,7 @@ Return ONLY valid JSON array:
             if value_str.startswith('[') or value_str.startswith('{'):
                 import json
                 try:
-                    return json.loads(value_str)
+                    return json_loads(value_str)
                 except json.JSONDecodeError:
                     # If JSON parsing fails, try to extract meaningful data
                     if value_str.startswith('[') and value_str.endswith(']'):
@@ -2389,16 +3054,16 @@ Return ONLY valid JSON array:
             # Fallback to original value
             return original_value
     
-    def _search_google_places(self, destination: str, preferences: Dict, currency: str = '₹') -> List[Dict]:
+    def _search_google_places(self, destination: str, preferences: Dict, currency: str = '₹', max_results: int = 20) -> List[Dict]:
         """Search Google Places API for accommodations with EXACT budget range in queries"""
         try:
             import urllib.parse
             
-            print(f"🔍 _search_google_places called with destination: '{destination}', currency: '{currency}'")
+            logger.debug("🔍 _search_google_places called with destination: %r, currency: %r", destination, currency)
             
             # Create multiple search queries with EXACT budget range for better coverage
             queries = self._create_multiple_search_queries(destination, preferences, currency)
-            print(f"🔍 Generated {len(queries)} queries with exact budget ranges: {queries}")
+            logger.debug("🔍 Generated %d queries with exact budget ranges: %s", len(queries), queries)
             
             all_results = []
             seen_place_ids = set()
@@ -2412,28 +3077,18 @@ Return ONLY valid JSON array:
             def search_query(query):
                 """Search a single query and put results in queue"""
                 try:
-                    places_url = f"https://maps.googleapis.com/maps/api/place/textsearch/json"
-                    params = {
-                        'query': f"{query}",
-                        'key': self.maps_api_key
-                    }
-                    
-                    response = requests.get(places_url, params=params, timeout=5)
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        if data.get('status') == 'OK':
-                            for place in data.get('results', []):
-                                results_queue.put(place)
-                        else:
-                            print(f"⚠️ Google Places API returned status: {data.get('status')} for query: '{query}'")
-                except Exception as e:
-                    print(f"Error with query '{query}': {e}")
+                    for place in self._places_text_search(query):
+                        results_queue.put(place)
+                except requests.RequestException as e:
+                    # Timeouts/connection errors were already retried by the session adapter
+                    logger.warning("Places request failed for query %r: %s", query, e)
+                except Exception:
+                    logger.exception("Error with query %r", query)
             
             # Start parallel searches
             threads = []
             for query in queries:
-                print(f"🔍 Searching Google Places with query: '{query}'")
+                logger.debug("🔍 Searching Google Places with query: %r", query)
                 thread = threading.Thread(target=search_query, args=(query,), daemon=True)
                 thread.start()
                 threads.append(thread)
@@ -2442,159 +3097,238 @@ Return ONLY valid JSON array:
             for thread in threads:
                 thread.join(timeout=10)
             
-            # Collect all results
-            while not results_queue.empty():
+            # Collect unique results, stopping once we have enough (limit for performance)
+            while len(all_results) < max_results and not results_queue.empty():
                 place = results_queue.get_nowait()
                 place_id = place.get('place_id')
                 if place_id and place_id not in seen_place_ids:
-                    place_name = place.get('name')
-                    place_location = place.get('formatted_address', 'Unknown location')
-                    print(f"✓ Found: {place_name} in {place_location}")
+                    logger.debug("✓ Found: %s in %s", place.get('name'), place.get('formatted_address', 'Unknown location'))
                     all_results.append(place)
                     seen_place_ids.add(place_id)
             
-            # Limit results for performance (enough for hackathon)
-            all_results = all_results[:20]  # Limit to 20 results max
+            logger.debug("Google Places API returned %s results", len(all_results))
+            return all_results
+                
+        except Exception as e:
+            print(f"Error searching Google Places: {e}")
+            return []
+    
+    def _search_google_places_dining(self, destination: str, preferences: Dict, currency: str = '$') -> List[Dict]:
+        """Search Google Places API for restaurants"""
+        try:
+            logger.debug("🔍 Searching Google Places for restaurants in '%s'", destination)
+            
+            unique_queries = self._iter_unique(self._iter_dining_search_queries(destination, preferences))
+            queries = list(islice(unique_queries, 5))  # Limit to 5 queries max
+            
+            # Up to 30 for Vertex AI to filter
+            all_results = self._text_search_places(queries, max_results=30, type='restaurant')
+            
+            logger.debug("✓ Found %s unique restaurants from Places API", len(all_results))
+            return all_results
+            
+        except Exception as e:
+            print(f"Error searching Google Places for dining: {e}")
+            return []
+    
+    def _places_text_search(self, query: str, **params) -> List[Dict]:
+        """Places text search results for one query; identical searches are served from cache for the TTL"""
+        # Text search ignores case and spacing, so "Paris hotels" and "paris  hotels " share one entry
+        cache_key = (' '.join(query.lower().split()), tuple(sorted(params.items())))
+        cached_entry = self._places_cache.get(cache_key)
+        if cached_entry and time.time() - cached_entry[0] < self._cache_ttl:
+            return cached_entry[1]
+        
+        # Coalesce identical concurrent searches: later callers wait on the first caller's request
+        with self._places_cache_lock:
+            # A leader that just finished cached its results before leaving _inflight_places; check again
+            cached_entry = self._places_cache.get(cache_key)
+            if cached_entry and time.time() - cached_entry[0] < self._cache_ttl:
+                return cached_entry[1]
+            pending = self._inflight_places.get(cache_key)
+            if pending is None:
+                pending = self._inflight_places[cache_key] = Future()
+                is_leader = True
+            else:
+                is_leader = False
+        if not is_leader:
+            return pending.result()
+        
+        try:
+            results = self._fetch_places_text_search(query, params, cache_key)
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        else:
+            pending.set_result(results)
+            return results
+        finally:
+            with self._places_cache_lock:
+                self._inflight_places.pop(cache_key, None)
+    
+    def _fetch_places_text_search(self, query: str, params: Dict, cache_key: Tuple) -> List[Dict]:
+        """Cache-miss path of _places_text_search: shared cache, then Google; successful answers are cached"""
+        # Another worker may already have run this search
+        shared_key = PLACES_SHARED_CACHE_PREFIX + hashlib.blake2b(repr(cache_key).encode(), digest_size=16).hexdigest()
+        results = self._shared_cache_get(shared_key)
+        if results is None:
+            data = self._request_places_text_search(query, params)
+            if data is None:
+                return []
+            status = data.get('status')
+            # ZERO_RESULTS is a valid (cacheable) answer; quota errors are transient; bad/denied requests won't fix themselves
+            if status not in ('OK', 'ZERO_RESULTS'):
+                log = logger.error if status in ('INVALID_REQUEST', 'REQUEST_DENIED') else logger.warning
+                log("⚠️ Google Places API returned status: %s for query: '%s'", status, query)
+                return []
             
-            print(f"Google Places API returned {len(all_results)} results")
-            return all_results
-                
+            results = [self._trim_place_result(place) for place in data.get('results', [])]
+            self._shared_cache_set(shared_key, results)
+        
+        with self._places_cache_lock:
+            self._places_cache.pop(cache_key, None)
+            if len(self._places_cache) >= self._places_cache_size:
+                # Evict the oldest entry (dicts keep insertion order)
+                self._places_cache.pop(next(iter(self._places_cache)), None)
+            self._places_cache[cache_key] = (time.time(), results)
+        return results
+    
+    def _request_places_text_search(self, query: str, params: Dict) -> Optional[Dict]:
+        """Throttled Places text search request; OVER_QUERY_LIMIT responses are retried with backoff and jitter"""
+        for attempt in range(PLACES_QUOTA_RETRIES + 1):
+            PLACES_RATE_LIMITER.acquire()
+            response = self._maps_session.get(
+                GOOGLE_PLACES_TEXT_SEARCH_URL,
+                params={'query': query, **params, 'key': self.maps_api_key},
+                timeout=5,
+            )
+            if response.status_code != 200:
+                return None
+            data = json_loads(response.content)
+            if data.get('status') != 'OVER_QUERY_LIMIT':
+                PLACES_RATE_LIMITER.increase_rate()
+                return data
+            PLACES_RATE_LIMITER.decrease_rate()
+            if attempt == PLACES_QUOTA_RETRIES:
+                return data
+            time.sleep(min(PLACES_BACKOFF_CAP, PLACES_BACKOFF_BASE * 2 ** attempt) + random.uniform(0, PLACES_BACKOFF_BASE))
+        return None
+    
+    @staticmethod
+    def _trim_place_result(place: Dict) -> Dict:
+        """Keep only the fields suggestions use (plus the first photo reference) so cached results stay small"""
+        trimmed = {field: place[field] for field in PLACES_RESULT_FIELDS if field in place}
+        photos = place.get('photos')
+        if photos and photos[0].get('photo_reference'):
+            trimmed['photos'] = [{'photo_reference': photos[0]['photo_reference']}]
+        return trimmed
+    
+    def _shared_cache_get(self, key: str) -> Optional[Any]:
+        """Read a JSON value from the shared cache; None when it is disabled, missing or unreachable"""
+        if self._shared_cache is None:
+            return None
+        try:
+            raw = self._shared_cache.get(key)
+            return json_loads(raw) if raw else None
         except Exception as e:
-            print(f"Error searching Google Places: {e}")
-            return []
+            logger.debug("Shared cache read failed for %s: %s", key, e)
+            return None
     
-    def _search_google_places_dining(self, destination: str, preferences: Dict, currency: str = '$') -> List[Dict]:
-        """Search Google Places API for restaurants"""
+    def _shared_cache_set(self, key: str, value: Any) -> None:
+        """Best-effort write to the shared cache with the service TTL"""
+        if self._shared_cache is None:
+            return
         try:
-            print(f"🔍 Searching Google Places for restaurants in '{destination}'")
-            
-            # Build search queries based on preferences
-            queries = []
-            cuisine_types = preferences.get('cuisine_types', [])
-            dining_experiences = preferences.get('dining_experiences', [])
-            
-            # Base query
-            base_query = f"restaurants in {destination}"
-            queries.append(base_query)
-            
-            # Add cuisine-specific queries
-            for cuisine in cuisine_types[:3]:  # Limit to 3 to avoid too many API calls
-                queries.append(f"{cuisine} restaurants in {destination}")
-            
-            # Add experience-specific queries
-            for exp in dining_experiences[:2]:
-                if 'fine dining' in exp.lower() or 'trendy' in exp.lower():
-                    queries.append(f"fine dining restaurants in {destination}")
-                elif 'street food' in exp.lower() or 'hidden gems' in exp.lower():
-                    queries.append(f"street food {destination}")
-                elif 'café' in exp.lower() or 'brunch' in exp.lower():
-                    queries.append(f"cafes brunch {destination}")
-            
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_queries = []
-            for q in queries:
-                if q not in seen:
-                    seen.add(q)
-                    unique_queries.append(q)
-            
-            all_results = []
-            seen_place_ids = set()
-            
-            # Search each query
-            for query in unique_queries[:5]:  # Limit to 5 queries max
-                try:
-                    places_url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
-                    params = {
-                        'query': query,
-                        'type': 'restaurant',
-                        'key': self.maps_api_key
-                    }
-                    
-                    response = requests.get(places_url, params=params, timeout=5)
-                    if response.status_code == 200:
-                        data = response.json()
-                        if data.get('status') == 'OK':
-                            for place in data.get('results', []):
-                                place_id = place.get('place_id')
-                                if place_id and place_id not in seen_place_ids:
-                                    all_results.append(place)
-                                    seen_place_ids.add(place_id)
-                except Exception as e:
-                    print(f"Error with query '{query}': {e}")
-            
-            print(f"✓ Found {len(all_results)} unique restaurants from Places API")
-            return all_results[:30]  # Return up to 30 for Vertex AI to filter
-            
+            self._shared_cache.setex(key, self._cache_ttl, json_dumps_bytes(value))
         except Exception as e:
-            print(f"Error searching Google Places for dining: {e}")
+            logger.debug("Shared cache write failed for %s: %s", key, e)
+    
+    def _text_search_places(self, queries: List[str], max_results: int, **params) -> List[Dict]:
+        """Run Places text searches in small concurrent waves and merge unique results in query order, up to max_results"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        def search(query: str) -> List[Dict]:
+            try:
+                return self._places_text_search(query, **params)
+            except requests.RequestException as e:
+                # Timeouts/connection errors were already retried by the session adapter
+                logger.warning("Places request failed for query %r: %s", query, e)
+            except Exception:
+                logger.exception("Error with query %r", query)
+            return []
+        
+        if not queries:
             return []
+        
+        all_results = []
+        seen_place_ids = set()
+        # Round-trips within a wave overlap; later waves are only sent if earlier ones came up short
+        with ThreadPoolExecutor(max_workers=min(PLACES_QUERY_WAVE_SIZE, len(queries))) as executor:
+            for start in range(0, len(queries), PLACES_QUERY_WAVE_SIZE):
+                for results in executor.map(search, queries[start:start + PLACES_QUERY_WAVE_SIZE]):
+                    for place in results:
+                        place_id = place.get('place_id')
+                        if place_id and place_id not in seen_place_ids:
+                            all_results.append(place)
+                            seen_place_ids.add(place_id)
+                if len(all_results) >= max_results:
+                    break
+        return all_results[:max_results]
+    
+    @staticmethod
+    def _iter_unique(items: Iterable[str]) -> Iterator[str]:
+        """Yield items in order, skipping duplicates"""
+        seen = set()
+        for item in items:
+            if item not in seen:
+                seen.add(item)
+                yield item
+    
+    def _iter_dining_search_queries(self, destination: str, preferences: Dict) -> Iterator[str]:
+        """Yield restaurant search queries based on preferences, most general first"""
+        # Base query
+        yield f"restaurants in {destination}"
+        
+        # Add cuisine-specific queries
+        for cuisine in preferences.get('cuisine_types', [])[:3]:  # Limit to 3 to avoid too many API calls
+            yield f"{cuisine} restaurants in {destination}"
+        
+        # Add experience-specific queries
+        for exp in preferences.get('dining_experiences', [])[:2]:
+            exp_lower = exp.lower()
+            if 'fine dining' in exp_lower or 'trendy' in exp_lower:
+                yield f"fine dining restaurants in {destination}"
+            elif 'street food' in exp_lower or 'hidden gems' in exp_lower:
+                yield f"street food {destination}"
+            elif 'café' in exp_lower or 'brunch' in exp_lower:
+                yield f"cafes brunch {destination}"
+    
+    def _iter_activity_search_queries(self, destination: str, preferences: Dict) -> Iterator[str]:
+        """Yield activity search queries: general categories first, then preference-specific ones"""
+        base_queries = (
+            f"{category} in {destination}"
+            for category in ("tourist attractions", "things to do", "activities")
+        )
+        type_queries = (
+            f"{keyword} in {destination}"
+            for activity_type in preferences.get('activity_types', [])
+            for keyword in ACTIVITY_TYPE_QUERY_KEYWORDS.get(activity_type.lower(), [])[:2]
+        )
+        return chain(base_queries, type_queries)
     
     def _search_google_places_activities(self, destination: str, preferences: Dict, currency: str = '$') -> List[Dict]:
         """Search Google Places API for activities/attractions"""
         try:
-            print(f"🔍 Searching Google Places for activities in '{destination}'")
-            
-            # Build search queries based on preferences
-            queries = []
-            activity_types = preferences.get('activity_types', [])
-            
-            # Base queries for different activity categories
-            base_queries = [
-                f"tourist attractions in {destination}",
-                f"things to do in {destination}",
-                f"activities in {destination}"
-            ]
-            queries.extend(base_queries)
-            
-            # Add type-specific queries
-            type_mapping = {
-                'cultural': ['museums', 'historical sites', 'temples', 'churches'],
-                'adventure': ['hiking', 'adventure sports', 'outdoor activities'],
-                'nature': ['parks', 'nature reserves', 'beaches', 'mountains'],
-                'nightlife': ['bars', 'clubs', 'nightlife'],
-                'relaxation': ['spas', 'wellness centers', 'beaches']
-            }
-            
-            for activity_type in activity_types:
-                if activity_type.lower() in type_mapping:
-                    for keyword in type_mapping[activity_type.lower()][:2]:
-                        queries.append(f"{keyword} in {destination}")
-            
-            # Remove duplicates
-            seen = set()
-            unique_queries = []
-            for q in queries:
-                if q not in seen:
-                    seen.add(q)
-                    unique_queries.append(q)
+            logger.debug("🔍 Searching Google Places for activities in '%s'", destination)
             
-            all_results = []
-            seen_place_ids = set()
+            unique_queries = self._iter_unique(self._iter_activity_search_queries(destination, preferences))
+            queries = list(islice(unique_queries, 6))  # Limit to 6 queries max
             
-            # Search each query
-            for query in unique_queries[:6]:  # Limit to 6 queries max
-                try:
-                    places_url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
-                    params = {
-                        'query': query,
-                        'key': self.maps_api_key
-                    }
-                    
-                    response = requests.get(places_url, params=params, timeout=5)
-                    if response.status_code == 200:
-                        data = response.json()
-                        if data.get('status') == 'OK':
-                            for place in data.get('results', []):
-                                place_id = place.get('place_id')
-                                if place_id and place_id not in seen_place_ids:
-                                    all_results.append(place)
-                                    seen_place_ids.add(place_id)
-                except Exception as e:
-                    print(f"Error with query '{query}': {e}")
+            # Up to 30 for Vertex AI to filter
+            all_results = self._text_search_places(queries, max_results=30)
             
-            print(f"✓ Found {len(all_results)} unique activities from Places API")
-            return all_results[:30]  # Return up to 30 for Vertex AI to filter
+            logger.debug("✓ Found %s unique activities from Places API", len(all_results))
+            return all_results
             
         except Exception as e:
             print(f"Error searching Google Places for activities: {e}")
@@ -2605,9 +3339,10 @@ Return ONLY valid JSON array:
                                          activity_preferences: Dict = None, currency: str = '$') -> List[Dict]:
         """Use Vertex AI to intelligently filter, rank, and describe Places API results"""
         try:
-            print(f"🤖 Using Vertex AI to filter and rank {len(places_results)} {room_type} results")
+            logger.debug("🤖 Using Vertex AI to filter and rank %s %s results", len(places_results), room_type)
             
-            # Prepare Places data for AI
+            # Prepare Places data for AI - only fields the model reasons about (results are matched
+            # back by name, so opaque place_ids and missing price levels would just cost input tokens)
             places_data = []
             for place in places_results:
                 place_info = {
@@ -2615,108 +3350,26 @@ Return ONLY valid JSON array:
                     'address': place.get('formatted_address', ''),
                     'rating': place.get('rating', 0),
                     'user_ratings_total': place.get('user_ratings_total', 0),
-                    'price_level': place.get('price_level', None),
                     'types': place.get('types', []),
-                    'place_id': place.get('place_id', '')
                 }
+                if place.get('price_level') is not None:
+                    place_info['price_level'] = place['price_level']
                 places_data.append(place_info)
             
+            # Serialize the candidates once; only the selected room-type prompt embeds it
+            places_json = json_dumps(places_data)
+            
             # Build prompt for Vertex AI
             if room_type == 'dining':
                 preferences_text = self._format_dining_preferences_for_ai(dining_preferences)
-                prompt = f"""You are an expert travel advisor. Analyze these restaurants from Google Places API and select the BEST 15-20 that match the user's preferences.
-
-DESTINATION: {destination}
-USER PREFERENCES:
-{preferences_text}
-
-RESTAURANTS FROM GOOGLE PLACES API:
-{json.dumps(places_data, indent=2)}
-
-TASK:
-1. Filter restaurants that match user preferences (cuisine, dining experience, dietary needs)
-2. Rank them by relevance to preferences (NOT just by rating - preferences are primary, rating is tie-breaker)
-3. For each selected restaurant, provide:
-   - name (exact from Places API)
-   - description (2-3 sentences explaining why it matches user preferences)
-   - price_range (CRITICAL: Generate realistic per-person cost estimate in {currency} based on:
-     * Destination cost of living (e.g., Udupi/Karnataka = budget-friendly, Mumbai/Delhi = moderate, Dubai/Singapore = expensive)
-     * Restaurant name and type (e.g., "Fish Hotel" = budget, "Fine Dining" = expensive)
-     * Price level from Places API (if available)
-     * Typical meal cost for this type of restaurant in this destination
-     Format: "{currency}XX-{currency}YY" per person, e.g., "₹150-₹300" for mid-range in Udupi, "₹50-₹100" for budget, "₹500-₹1000" for fine dining)
-   - rating (from Places API)
-   - location (address from Places API)
-   - why_recommended (specific reason matching user preferences)
-
-CRITICAL:
-- Return EXACTLY 15-20 restaurants (prioritize variety and preference matching)
-- Use ratings ONLY as tie-breaker, NOT primary criteria
-- Match user's cuisine preferences, dining experiences, and dietary needs
-- Ensure diverse options (mix of different cuisines/experiences if user selected multiple)
-- NO duplicates
-
-Return JSON array format:
-[
-  {{
-    "name": "Restaurant Name",
-    "description": "Why this restaurant matches preferences...",
-    "price_range": "{currency}150-{currency}300",
-    "rating": 4.5,
-    "location": "Full address",
-    "why_recommended": "Specific reason matching user preferences"
-  }}
-]
-
-IMPORTANT: price_range must be realistic for {destination} - use destination-appropriate pricing (e.g., ₹50-₹200 for budget in Udupi, ₹200-₹500 for mid-range in Mumbai, $30-$80 for moderate in Dubai)."""
+                prompt = VERTEX_DINING_RANK_TEMPLATE.substitute(
+                    destination=destination, preferences_text=preferences_text, places_json=places_json, currency=currency
+                )
             else:  # activities
                 preferences_text = self._format_activity_preferences_for_ai(activity_preferences)
-                prompt = f"""You are an expert travel advisor. Analyze these activities/attractions from Google Places API and select the BEST 15-20 that match the user's preferences.
-
-DESTINATION: {destination}
-USER PREFERENCES:
-{preferences_text}
-
-ACTIVITIES FROM GOOGLE PLACES API:
-{json.dumps(places_data, indent=2)}
-
-TASK:
-1. Filter activities that match user preferences (activity types, specific interests)
-2. Rank them by relevance to preferences (NOT just by rating - preferences are primary, rating is tie-breaker)
-3. For each selected activity, provide:
-   - name (exact from Places API)
-   - description (2-3 sentences explaining why it matches user preferences)
-   - price_range (CRITICAL: Generate realistic cost estimate in {currency} based on:
-     * Destination cost of living (e.g., Udupi/Karnataka = budget-friendly, Mumbai/Delhi = moderate, Dubai/Singapore = expensive)
-     * Activity type (e.g., "Temple" = often free/low, "Museum" = moderate, "Adventure Sports" = expensive)
-     * Activity name and characteristics
-     * Price level from Places API (if available)
-     Format: "{currency}XX-{currency}YY" per person, or "Free" if no cost, or "Varies" if cost depends on options
-     Examples: "Free" for temples/parks, "₹50-₹200" for museums in Udupi, "₹500-₹2000" for adventure activities)
-   - rating (from Places API)
-   - location (address from Places API)
-   - why_recommended (specific reason matching user preferences)
-
-CRITICAL:
-- Return EXACTLY 15-20 activities (prioritize variety and preference matching)
-- Use ratings ONLY as tie-breaker, NOT primary criteria
-- Match user's activity type preferences and specific interests
-- Ensure diverse options (mix of different activity types if user selected multiple)
-- NO duplicates
-
-Return JSON array format:
-[
-  {{
-    "name": "Activity Name",
-    "description": "Why this activity matches preferences...",
-    "price_range": "{currency}100-{currency}300",
-    "rating": 4.5,
-    "location": "Full address",
-    "why_recommended": "Specific reason matching user preferences"
-  }}
-]
-
-IMPORTANT: price_range must be realistic for {destination} - use "Free" for free activities, or destination-appropriate pricing (e.g., ₹50-₹200 for museums in Udupi, ₹500-₹2000 for adventure activities, "Free" for temples/parks)."""
+                prompt = VERTEX_ACTIVITIES_RANK_TEMPLATE.substitute(
+                    destination=destination, preferences_text=preferences_text, places_json=places_json, currency=currency
+                )
             
             # Use Vertex AI to generate filtered/ranked suggestions
             use_vertex = True
@@ -2728,66 +3381,47 @@ IMPORTANT: price_range must be realistic for {destination} - use "Free" for free
                         temperature=0.4,
                         max_output_tokens=8192
                     )
-                    print("✓ Vertex AI successfully filtered and ranked suggestions")
+                    logger.debug("✓ Vertex AI successfully filtered and ranked suggestions")
                 else:
                     use_vertex = False
                     raise ValueError("Vertex AI client not available")
             except Exception as vertex_err:
-                print(f"⚠️ Vertex AI failed ({type(vertex_err).__name__}: {vertex_err}), falling back to Gemini API")
+                logger.warning("⚠️ Vertex AI failed (%s: %s), falling back to Gemini API", type(vertex_err).__name__, vertex_err)
                 use_vertex = False
                 response_text = self._generate_with_gemini(prompt)
             
             # Parse AI response
             response_text = self._clean_json_response(response_text)
-            suggestions = json.loads(response_text)
+            suggestions = json_loads(response_text)
             
             if not isinstance(suggestions, list):
                 suggestions = []
             
-            # Enrich with Places API data (photos, coordinates, etc.)
+            # Enrich with Places API data (photos, coordinates, etc.); index the candidates by name once
+            # instead of rescanning them for every selected suggestion (first candidate with a name wins)
+            places_by_name = {}
+            for place in places_results:
+                places_by_name.setdefault(place.get('name', '').lower(), place)
+            
             enriched_suggestions = []
             for suggestion in suggestions[:20]:  # Limit to 20
                 name = suggestion.get('name', '')
-                # Find matching place from Places API
-                matching_place = None
-                for place in places_results:
-                    if place.get('name', '').lower() == name.lower():
-                        matching_place = place
-                        break
-                
-                # Create maps URLs similar to accommodation
-                maps_url = ''
-                maps_embed_url = ''
-                if matching_place:
-                    place_id = matching_place.get('place_id', '')
-                    name = suggestion.get('name', '')
-                    location = suggestion.get('location', '')
-                    # Create maps URLs using the same methods as accommodation
-                    maps_url = self._create_maps_url({'name': name, 'location': location}, destination)
-                    maps_embed_url = self._create_maps_embed_url({'place_id': place_id, 'name': name, 'location': location}, destination)
+                matching_place = places_by_name.get(name.lower())
                 
-                enriched = {
-                    'name': suggestion.get('name', ''),
-                    'description': suggestion.get('description', ''),
-                    'price_range': suggestion.get('price_range', 'Varies'),
-                    'rating': suggestion.get('rating', 0),
-                    'location': suggestion.get('location', ''),
-                    'why_recommended': suggestion.get('why_recommended', ''),
-                    'maps_url': maps_url,
-                    'maps_embed_url': maps_embed_url,
-                    'external_url': maps_url or f"https://www.google.com/maps/place/?q=place_id:{matching_place.get('place_id', '')}" if matching_place else '',
-                    'link_type': 'maps' if matching_place else 'none'
-                }
-                
-                # Add photos if available
-                if matching_place and 'photos' in matching_place and matching_place['photos']:
-                    photo_ref = matching_place['photos'][0].get('photo_reference', '')
-                    if photo_ref:
-                        enriched['image_url'] = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=400&photoreference={photo_ref}&key={self.maps_api_key}"
+                enriched = self._build_place_suggestion(
+                    matching_place,
+                    name=suggestion.get('name', ''),
+                    description=suggestion.get('description', ''),
+                    price_range=suggestion.get('price_range', 'Varies'),
+                    rating=suggestion.get('rating', 0),
+                    location=suggestion.get('location', ''),
+                    why_recommended=suggestion.get('why_recommended', ''),
+                    destination=destination,
+                )
                 
                 enriched_suggestions.append(enriched)
             
-            print(f"✓ Returning {len(enriched_suggestions)} {room_type} suggestions (Places API + Vertex AI)")
+            logger.debug("✓ Returning %s %s suggestions (Places API + Vertex AI)", len(enriched_suggestions), room_type)
             return enriched_suggestions
             
         except Exception as e:
@@ -2875,46 +3509,149 @@ IMPORTANT: price_range must be realistic for {destination} - use "Free" for free
             parts.append(f"Specific Interests: {preferences['specific_interests']}")
         return "\n".join(parts) if parts else "No specific preferences"
     
+    def _build_place_suggestion(self, place: Optional[Dict], name: str, description: str, price_range: str, rating: Any, location: str, why_recommended: str, destination: str = '') -> Dict:
+        """Single constructor for Places-backed suggestions: core fields plus maps links and photo when a place matched"""
+        suggestion = {
+            'name': name,
+            'description': description,
+            'price_range': price_range,
+            'rating': rating,
+            'location': location,
+            'why_recommended': why_recommended,
+            'maps_url': '',
+            'maps_embed_url': '',
+            'external_url': '',
+            'link_type': 'none'
+        }
+        if not place:
+            return suggestion
+        
+        # Create maps URLs similar to accommodation
+        place_id = place.get('place_id') or ''
+        maps_url = self._create_maps_url({'name': name, 'location': location}, destination)
+        suggestion['maps_url'] = maps_url
+        suggestion['maps_embed_url'] = self._create_maps_embed_url({'place_id': place_id, 'name': name, 'location': location}, destination)
+        suggestion['external_url'] = maps_url or GOOGLE_MAPS_PLACE_URL + place_id
+        suggestion['link_type'] = 'maps'
+        
+        # Add photo if available
+        photos = place.get('photos')
+        if photos:
+            photo_ref = photos[0].get('photo_reference', '')
+            if photo_ref:
+                suggestion['image_url'] = self._place_photo_prefix + urllib.parse.quote_plus(photo_ref)
+        
+        return suggestion
+    
     def _format_places_results_basic(self, places_results: List[Dict], room_type: str, currency: str) -> List[Dict]:
         """Basic formatting of Places API results (fallback) - uses AI for price estimation"""
         suggestions = []
-        for place in places_results[:15]:
+        places = places_results[:15]
+        
+        # Estimate realistic prices for every place in one AI call
+        price_map = self._batch_estimate_place_prices(places, room_type, currency)
+        # room_type/currency are fixed for the whole batch, so resolve the fallback table once
+        fallback_price = self._fallback_price_estimator(room_type, currency)
+        why_recommended = f"Highly rated {room_type} option"
+        
+        for index, place in enumerate(places):
             name = place.get('name', 'Unknown')
             address = place.get('formatted_address', '')
             rating = place.get('rating', 0)
             price_level = place.get('price_level', None)
             
-            # Use AI to estimate realistic price based on destination, place name, and type
-            price_range = self._estimate_price_with_ai(name, address, room_type, price_level, currency)
-            
-            # Create maps URLs similar to accommodation
-            place_id = place.get('place_id', '')
-            maps_url = self._create_maps_url({'name': name, 'location': address}, '')
-            maps_embed_url = self._create_maps_embed_url({'place_id': place_id, 'name': name, 'location': address}, '')
-            
-            suggestion = {
-                'name': name,
-                'description': f"Located in {address}",
-                'price_range': price_range,
-                'rating': rating,
-                'location': address,
-                'why_recommended': f"Highly rated {room_type} option",
-                'maps_url': maps_url,
-                'maps_embed_url': maps_embed_url,
-                'external_url': maps_url or f"https://www.google.com/maps/place/?q=place_id:{place_id}",
-                'link_type': 'maps'
-            }
-            
-            # Add photo if available
-            if 'photos' in place and place['photos']:
-                photo_ref = place['photos'][0].get('photo_reference', '')
-                if photo_ref:
-                    suggestion['image_url'] = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=400&photoreference={photo_ref}&key={self.maps_api_key}"
+            if price_map is None:
+                # Batch call failed - estimate this place individually
+                price_range = self._estimate_price_with_ai(name, address, room_type, price_level, currency)
+            else:
+                price_range = price_map.get(index) or fallback_price(price_level)
+            
+            suggestion = self._build_place_suggestion(
+                place,
+                name=name,
+                description=f"Located in {address}",
+                price_range=price_range,
+                rating=rating,
+                location=address,
+                why_recommended=why_recommended,
+            )
             
             suggestions.append(suggestion)
         
         return suggestions
     
+    def _batch_estimate_place_prices(self, places: List[Dict], room_type: str, currency: str) -> Optional[Dict[int, str]]:
+        """Estimate per-person prices for a list of dining/activity places in one AI call.
+        Returns index -> price range for valid estimates, or None if the batch call failed."""
+        if not places:
+            return {}
+        
+        try:
+            places_text = '\n'.join(
+                f"{i+1}. {place.get('name', 'Unknown')} | Location: {place.get('formatted_address', '')} | "
+                f"Price Level (1-4): {place.get('price_level') or 'Not specified'}"
+                for i, place in enumerate(places)
+            )
+            
+            if room_type == 'dining':
+                task = f"""Estimate the realistic per-person meal cost in {currency} for each restaurant below.
+
+Consider:
+- Destination cost of living (e.g., Udupi/Karnataka = budget-friendly ₹50-₹200, Mumbai/Delhi = moderate ₹200-₹500, Dubai/Singapore = expensive $30-$100)
+- Restaurant type from name (e.g., "Fish Hotel" = budget, "Fine Dining" = expensive, "Cafe" = moderate)
+- Price level indicator (1=budget, 2=moderate, 3=expensive, 4=very expensive)
+
+Each value must be "{currency}XX-{currency}YY" per person. If unsure, use moderate pricing for the destination."""
+            else:  # activities
+                task = f"""Estimate the realistic per-person cost in {currency} for each activity below.
+
+Consider:
+- Destination cost of living
+- Activity type (e.g., "Temple" = often free/low, "Museum" = moderate, "Adventure Sports" = expensive)
+- Activity name and characteristics
+
+Each value must be "Free" if no cost, "{currency}XX-{currency}YY" per person if there's a cost, or "Varies" if cost depends on options."""
+            
+            prompt = f"""{task}
+
+PLACES:
+{places_text}
+
+Return ONLY a JSON object mapping each place number to its price range, e.g. {{"1": "{currency}150-{currency}300", "2": "Free"}}"""
+            
+            price_data = self._generate_json_object_with_gemini(prompt)
+            if not isinstance(price_data, dict):
+                raise ValueError("Batch price response did not contain a JSON object")
+            
+            price_map = {}
+            for key, value in price_data.items():
+                try:
+                    index = int(str(key).strip().rstrip('.')) - 1
+                except ValueError:
+                    continue
+                price_range = self._validate_price_estimate(str(value), currency)
+                if 0 <= index < len(places) and price_range:
+                    price_map[index] = price_range
+            
+            print(f"✓ Batch estimated {room_type} prices for {len(price_map)}/{len(places)} places")
+            return price_map
+            
+        except Exception as e:
+            print(f"Error batch estimating {room_type} prices: {e}")
+            return None
+    
+    def _validate_price_estimate(self, price_estimate: str, currency: str) -> Optional[str]:
+        """Clean an AI price estimate; returns None if it isn't Free/Varies or a currency range"""
+        # Clean up the response (remove quotes, extra text)
+        price_estimate = price_estimate.replace('"', '').replace("'", '').strip()
+        
+        # Validate format
+        if price_estimate.lower() in ['free', 'varies']:
+            return price_estimate
+        if currency in price_estimate and ('-' in price_estimate or price_estimate.replace(currency, '').replace('-', '').isdigit()):
+            return price_estimate
+        return None
+    
     def _estimate_price_with_ai(self, name: str, address: str, room_type: str, price_level: int, currency: str) -> str:
         """Use AI to estimate realistic price for a place based on name, location, and type"""
         try:
@@ -2958,20 +3695,11 @@ Respond with ONLY:
 
 Examples: "Free" for temples/parks, "₹50-₹200" for museums in Udupi, "₹500-₹2000" for adventure activities"""
             
-            response = self.model.generate_content(prompt)
-            price_estimate = response.text.strip()
-            
-            # Clean up the response (remove quotes, extra text)
-            price_estimate = price_estimate.replace('"', '').replace("'", '').strip()
+            response = self.model_fast.generate_content(prompt)
+            price_estimate = self._validate_price_estimate(response.text.strip(), currency)
             
-            # Validate format
-            if price_estimate.lower() in ['free', 'varies']:
-                return price_estimate
-            elif currency in price_estimate and ('-' in price_estimate or price_estimate.replace(currency, '').replace('-', '').isdigit()):
-                return price_estimate
-            else:
-                # Fallback to basic estimation
-                return self._fallback_price_estimate(price_level, currency, room_type)
+            # Fallback to basic estimation if the format is unusable
+            return price_estimate or self._fallback_price_estimate(price_level, currency, room_type)
                 
         except Exception as e:
             print(f"Error estimating price with AI for {name}: {e}")
@@ -2980,28 +3708,20 @@ Examples: "Free" for temples/parks, "₹50-₹200" for museums in Udupi, "₹500
     
     def _fallback_price_estimate(self, price_level: int, currency: str, room_type: str) -> str:
         """Fallback price estimation when AI fails"""
-        if room_type == 'dining':
-            if price_level:
-                price_ranges = {
-                    1: f"{currency}50-{currency}150",
-                    2: f"{currency}150-{currency}300",
-                    3: f"{currency}300-{currency}600",
-                    4: f"{currency}600+"
-                }
-                return price_ranges.get(price_level, "Varies")
-            else:
-                return f"{currency}150-{currency}300"  # Default moderate
-        else:  # activities
-            if price_level:
-                price_ranges = {
-                    1: "Free",
-                    2: f"{currency}50-{currency}200",
-                    3: f"{currency}200-{currency}500",
-                    4: f"{currency}500+"
-                }
-                return price_ranges.get(price_level, "Varies")
-            else:
-                return f"{currency}100-{currency}300"  # Default moderate
+        return self._fallback_price_estimator(room_type, currency)(price_level)
+    
+    @staticmethod
+    def _fallback_price_estimator(room_type: str, currency: str):
+        """Return a price_level -> price range function with the room type's templates already selected"""
+        templates = FALLBACK_PRICE_TEMPLATES['dining' if room_type == 'dining' else 'activities']
+        default = templates['default'].format(currency=currency)
+        
+        def estimate(price_level: Optional[int]) -> str:
+            if not price_level:
+                return default
+            return templates.get(price_level, "Varies").format(currency=currency)
+        
+        return estimate
     
     def _generate_dining_suggestions_ai_fallback(self, destination: str, answers: List[Dict], group_preferences: Dict = None, preference_constraints: Dict = None) -> List[Dict]:
         """Fallback to AI-only generation if Places API fails"""
@@ -3024,11 +3744,7 @@ Examples: "Free" for temples/parks, "₹50-₹200" for museums in Udupi, "₹500
                 response_text = self._generate_with_gemini(prompt)
             
             suggestions_data = self._parse_ai_response(response_text, 'dining')
-            enhanced_suggestions = []
-            for suggestion in suggestions_data:
-                enhanced_suggestion = self._enhance_with_maps(suggestion, destination, answers, group_preferences)
-                enhanced_suggestions.append(enhanced_suggestion)
-            return enhanced_suggestions
+            return self._enhance_all_with_maps(suggestions_data, destination, answers, group_preferences)
         except Exception as e:
             print(f"Error in AI fallback for dining: {e}")
             return self._get_fallback_suggestions('dining', destination)
@@ -3054,11 +3770,7 @@ Examples: "Free" for temples/parks, "₹50-₹200" for museums in Udupi, "₹500
                 response_text = self._generate_with_gemini(prompt)
             
             suggestions_data = self._parse_ai_response(response_text, 'activities')
-            enhanced_suggestions = []
-            for suggestion in suggestions_data:
-                enhanced_suggestion = self._enhance_with_maps(suggestion, destination, answers, group_preferences)
-                enhanced_suggestions.append(enhanced_suggestion)
-            return enhanced_suggestions
+            return self._enhance_all_with_maps(suggestions_data, destination, answers, group_preferences)
         except Exception as e:
             print(f"Error in AI fallback for activities: {e}")
             return self._get_fallback_suggestions('activities', destination)
@@ -3082,7 +3794,7 @@ Be conservative - if unsure, respond "MODERATE".
 """
 
         try:
-            response = self.model.generate_content(prompt)
+            response = self.model_fast.generate_content(prompt)
             cost_level = response.text.strip().upper()
         except Exception as e:
             print(f"Error in AI cost level determination: {e}")
@@ -3140,16 +3852,21 @@ Be conservative - if unsure, respond "MODERATE".
     def _create_multiple_search_queries(self, destination: str, preferences: Dict, currency: str = '₹') -> List[str]:
         """Create multiple targeted search queries - one per accommodation type with EXACT budget range"""
         try:
-            queries = []
             accommodation_types = preferences.get('accommodation_types', ['Hotel'])  # Default to 'Hotel' if none provided
             
             # Get unique accommodation types to avoid duplicate queries
             unique_types = list(dict.fromkeys(accommodation_types))[:3]  # Limit to 3 types max for speed
             
-            # Generate one query per accommodation type with exact budget range
-            for acc_type in unique_types:
-                query = self._create_ai_optimized_search_query(destination, preferences, acc_type, currency)
-                queries.append(query)
+            # Generate one query per accommodation type with exact budget range (each may need an AI rewrite, so run them concurrently)
+            if len(unique_types) > 1:
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=len(unique_types)) as executor:
+                    queries = list(executor.map(
+                        lambda acc_type: self._create_ai_optimized_search_query(destination, preferences, acc_type, currency),
+                        unique_types,
+                    ))
+            else:
+                queries = [self._create_ai_optimized_search_query(destination, preferences, acc_type, currency) for acc_type in unique_types]
             
             # Remove duplicates and limit to max 3 queries for speed (fewer API calls)
             unique_queries = list(dict.fromkeys(queries))[:3]
@@ -3255,22 +3972,18 @@ Be conservative - if unsure, respond "MODERATE".
                 "link_type": "booking"
             }}
             """
-            response = self.model.generate_content(prompt)
-            suggestion = json.loads(response.text.strip())
+            response = self.model_fast.generate_content(prompt)
+            suggestion = json_loads(response.text.strip())
             return [suggestion]
         except Exception as e:
             print(f"Error generating fallback transportation: {e}")
+            search_url = self._search_url("transportation", "to", destination)
             return [{
-                "name": "General Transport Search",
-                "description": "Search for transportation options",
-                "price_range": "Varies",
-                "rating": 0,
-                "features": ["Multiple options"],
+                **FALLBACK_TRANSPORT_SEARCH_FIELDS,
+                "features": list(FALLBACK_TRANSPORT_SEARCH_FIELDS["features"]),
                 "location": f"To {destination}",
-                "why_recommended": "Generic transport search",
-                "booking_url": f"https://www.google.com/search?q=transportation+to+{destination.replace(' ', '+')}",
-                "external_url": f"https://www.google.com/search?q=transportation+to+{destination.replace(' ', '+')}",
-                "link_type": "search"
+                "booking_url": search_url,
+                "external_url": search_url,
             }]
     
     def _calculate_currency_based_pricing(self, currency: str, destination: str = None, preferences: Dict = None) -> Dict:
@@ -3284,9 +3997,9 @@ Be conservative - if unsure, respond "MODERATE".
                 prompt = f"""
                 Adjust the following base pricing for accommodations in {destination} based on user preferences.
                 
-                BASE PRICES: {json.dumps(base_prices)}
+                BASE PRICES: {json_dumps(base_prices)}
                 CURRENCY: {currency}
-                PREFERENCES: {json.dumps(preferences, default=str)}
+                PREFERENCES: {json_dumps(preferences)}
                 
                 Consider:
                 - Destination's economic context (e.g., luxury vs budget destination)
@@ -3297,8 +4010,8 @@ Be conservative - if unsure, respond "MODERATE".
                 {{"budget_min": number, "budget_low": number, "budget_mid": number, "budget_high": number, "budget_luxury": number}}
                 """
                 try:
-                    response = self.model.generate_content(prompt)
-                    adjusted_prices = json.loads(response.text.strip())
+                    response = self.model_fast.generate_content(prompt)
+                    adjusted_prices = json_loads(response.text.strip())
                     return adjusted_prices
                 except Exception as e:
                     print(f"Error in AI pricing adjustment: {e}")
@@ -3326,8 +4039,8 @@ Be conservative - if unsure, respond "MODERATE".
             Example response format:
             ["Hotel", "Hostel", "Airbnb", "Resort", "Guesthouse", "Boutique Hotel", "Villa", "Eco Lodge"]
             """
-            response = self.model.generate_content(prompt)
-            enhanced_types = json.loads(response.text.strip())
+            # Identical destination prompts are served from the response cache for the TTL
+            enhanced_types = json_loads(self._clean_json_response(self._generate_with_gemini(prompt)))
             
             # Ensure base types are included
             all_types = list(set(base_types + enhanced_types))
@@ -3363,8 +4076,7 @@ Be conservative - if unsure, respond "MODERATE".
                 ["Option 1", "Option 2", "Option 3", "No preference"]
                 """
                 try:
-                    response = self.model.generate_content(prompt)
-                    return json.loads(response.text.strip())
+                    return json_loads(self._clean_json_response(self._generate_with_gemini(prompt)))
                 except json.JSONDecodeError as e:
                     print(f"Error parsing AI response for dynamic options: {e}")
                     return []
@@ -3465,7 +4177,7 @@ Be conservative - if unsure, respond "MODERATE".
                 
                 Return ONLY the optimized query, nothing else.
                 """
-                response = self.model.generate_content(prompt)
+                response = self.model_fast.generate_content(prompt)
                 optimized_query = response.text.strip()
                 
                 # Validate that destination is still in the optimized query
@@ -3482,22 +4194,13 @@ Be conservative - if unsure, respond "MODERATE".
     def _needs_ai_optimization(self, location: str, accommodation_type: str) -> bool:
         """Determine if AI optimization is needed based on complexity of location or accommodation type"""
         try:
-            # Check for complex location names that might need rephrasing
-            complex_location_keywords = ['lake', 'mountain', 'beach', 'downtown', 'airport', 'station', 'center', 'plaza', 'square']
-            location_lower = location.lower()
-            
-            # Check for complex accommodation types
-            complex_accommodation_types = ['boutique', 'luxury', 'eco', 'heritage', 'vintage']
-            accommodation_lower = accommodation_type.lower()
-            
-            # Use AI if location contains complex keywords or accommodation type is complex
-            needs_optimization = (
-                any(keyword in location_lower for keyword in complex_location_keywords) or
-                any(keyword in accommodation_lower for keyword in complex_accommodation_types)
+            # Use AI if location contains complex keywords or accommodation type is complex;
+            # each check is a single scan of the string regardless of keyword count
+            return bool(
+                COMPLEX_LOCATION_RE.search(location.lower()) or
+                COMPLEX_ACCOMMODATION_RE.search(accommodation_type.lower())
             )
             
-            return needs_optimization
-            
         except Exception as e:
             print(f"Error checking if AI optimization needed: {e}")
             return False
@@ -3531,6 +4234,14 @@ Be conservative - if unsure, respond "MODERATE".
         # OPTIMIZED: Batch price estimation for all places in one AI call (much faster!)
         # Pass preferences to include budget context for better price estimation
         price_map = self._batch_estimate_accommodation_prices(places_results, destination, currency, preferences)
+        # Suggestions still waiting on an individual AI price estimate: (suggestion, place, preferred_budget)
+        pending_prices = []
+        
+        # The destination is the same for every place - resolve its match keywords once
+        destination_lower = destination.lower()
+        # Extract the base city name from destination (handle multi-word destinations)
+        destination_keywords = [kw for kw in destination_lower.split() if len(kw) > 2]
+        primary_destination = destination_keywords[0] if destination_keywords else destination_lower
         
         for place in places_results:  # Process ALL results, not just first 12
             try:
@@ -3541,17 +4252,12 @@ Be conservative - if unsure, respond "MODERATE".
                 vicinity = place.get('vicinity', destination)
                 
                 # CRITICAL: Filter out properties from different cities - DYNAMIC approach
-                destination_lower = destination.lower()
                 vicinity_lower = vicinity.lower() if vicinity else ''
                 name_lower = name.lower()
                 
-                # Extract the base city name from destination (handle multi-word destinations)
-                destination_keywords = [kw for kw in destination_lower.split() if len(kw) > 2]
-                primary_destination = destination_keywords[0] if destination_keywords else destination_lower
-                
                 # Check if destination appears in vicinity or name
                 has_destination_match = (
-                    any(keyword in vicinity_lower or keyword in name_lower for keyword in destination_keywords if len(keyword) > 2) or
+                    any(keyword in vicinity_lower or keyword in name_lower for keyword in destination_keywords) or
                     destination_lower in vicinity_lower or 
                     destination_lower in name_lower
                 )
@@ -3572,7 +4278,7 @@ Be conservative - if unsure, respond "MODERATE".
                         
                         # If clearly different and no destination match, likely wrong city
                         if not is_similar_location and not has_destination_match:
-                            print(f"✗ Skipping property from different city: {name} in {vicinity} (destination: {destination})")
+                            logger.debug("✗ Skipping property from different city: %s in %s (destination: %s)", name, vicinity, destination)
                             continue
                 
                 # OPTIMIZED: Skip expensive AI check - be lenient and include property if we're unsure
@@ -3585,15 +4291,21 @@ Be conservative - if unsure, respond "MODERATE".
                 
                 # OPTIMIZED: Skip expensive place details API call - use basic info from search results
                 # This saves one API call per result (much faster!)
-                place_details = {}  # Use empty dict - we have enough info from search results
-                
                 # Build features list from basic place data (no extra API call)
-                features = self._extract_dynamic_features(place_details, place)
+                features = self._extract_dynamic_features(place)
                 
                 preferred_budget = preferences.get('budget_range') or preferences.get('BUDGET_RANGE')
-                # Use batch-estimated price if available, otherwise fallback to individual estimation
+                # Use batch-estimated price if available; places Google already priced and rated get the
+                # lookup-table estimate, and only thin results pay for an individual AI estimate
                 place_id = place.get('place_id') or place.get('name', '')
-                price_indicator = price_map.get(place_id) or self._get_accommodation_price_indicator(place, currency, preferred_budget)
+                price_indicator = price_map.get(place_id)
+                needs_ai_price = False
+                if not price_indicator:
+                    if self._is_rich_enough(place):
+                        price_indicator = self._get_quick_price_estimate(place, currency, preferred_budget)
+                    else:
+                        # Estimated concurrently with the other thin results once the loop is done
+                        needs_ai_price = True
                 
                 # OPTIMIZED: Use simple description from rating/vicinity (no AI call)
                 real_description = self._get_quick_description(place, name)
@@ -3601,9 +4313,8 @@ Be conservative - if unsure, respond "MODERATE".
                 # Calculate relevance score
                 relevance_score = self._calculate_relevance_score(place, preferences or {})
                 
-                # Create booking URLs for actual price lookup
-                website = place.get('website', '')
-                maps_url = f"https://www.google.com/maps/search/?api=1&query={name.replace(' ', '+')}"
+                # Use place name + location for Google Maps URL (more reliable than place_id)
+                maps_url = self._create_maps_url({'name': name, 'location': vicinity}, destination)
                 
                 # Create suggestion with booking links
                 suggestion = {
@@ -3615,25 +4326,43 @@ Be conservative - if unsure, respond "MODERATE".
                     'location': vicinity,
                     'why_recommended': f"Found via Google Places API. Rated {rating}/5 stars. {price_indicator}.",
                     'place_id': place.get('place_id'),
-                    # Use place name + location for Google Maps URL (more reliable than place_id)
-                    'maps_url': self._create_maps_url({'name': name, 'location': vicinity}, destination),
+                    'maps_url': maps_url,
                     'maps_embed_url': self._create_maps_embed_url({'place_id': place.get('place_id'), 'name': name, 'location': vicinity}, destination),
-                    'external_url': self._create_maps_url({'name': name, 'location': vicinity}, destination),
+                    'external_url': maps_url,
                     'link_type': 'maps',
                     'relevance_score': relevance_score
                 }
                 
                 suggestions.append(suggestion)
+                if needs_ai_price:
+                    pending_prices.append((suggestion, place, preferred_budget))
                 
             except Exception as e:
                 print(f"Error formatting place result: {e}")
                 continue
         
+        if pending_prices:
+            self._fill_accommodation_prices(pending_prices, currency)
+        
         # Sort by relevance score (highest first)
         suggestions.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
         
         return suggestions
 
+    def _fill_accommodation_prices(self, pending: List[Tuple[Dict, Dict, Optional[Dict]]], currency: str) -> None:
+        """Run the individual AI price estimates in parallel and write them into their suggestions"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        def estimate(item: Tuple[Dict, Dict, Optional[Dict]]) -> str:
+            _, place, preferred_budget = item
+            return self._get_accommodation_price_indicator(place, currency, preferred_budget)
+        
+        # Each estimate is an independent model round-trip, so wall time is the slowest one rather than the sum
+        with ThreadPoolExecutor(max_workers=min(len(pending), 8)) as executor:
+            for (suggestion, _, _), price_indicator in zip(pending, executor.map(estimate, pending)):
+                suggestion['price_range'] = price_indicator
+                suggestion['why_recommended'] = f"Found via Google Places API. Rated {suggestion['rating']}/5 stars. {price_indicator}."
+    
     def _batch_estimate_accommodation_prices(self, places_results: List[Dict], destination: str, currency: str, preferences: Dict = None) -> Dict[str, str]:
         """Batch estimate prices for all accommodations in one AI call (much faster than individual calls)"""
         if not places_results or len(places_results) == 0:
@@ -3716,7 +4445,7 @@ Be specific to each property's name, location, and characteristics. Estimate acc
             response_text = response_text.replace('```json', '').replace('```', '').strip()
             
             try:
-                price_data = json.loads(response_text)
+                price_data = json_loads(response_text)
                 # Create map: place_id -> price_range
                 price_map = {}
                 for place_data in places_data:
@@ -3792,7 +4521,7 @@ Examples:
 
 Be specific to the property name and location. If unsure, use moderate pricing for the destination."""
 
-            response = self.model.generate_content(prompt)
+            response = self.model_fast.generate_content(prompt)
             price_estimate = response.text.strip()
             
             # Clean up the response (remove quotes, extra text)
@@ -4003,23 +4732,20 @@ Rules:
             place_id = suggestion.get('place_id', '')
             if place_id:
                 # Use Embed API for direct map display
-                return f"https://www.google.com/maps/embed/v1/place?key={self.maps_api_key}&q=place_id:{place_id}"
+                return self._maps_embed_place_prefix + place_id
             
             # Fallback to search URL
             place_name = suggestion.get('name', '')
             location = suggestion.get('location', '')
             search_query = f'"{place_name}" {location} {destination}' if place_name else f"{location} {destination}"
-            import urllib.parse
-            encoded_query = urllib.parse.quote_plus(search_query)
-            return f"https://www.google.com/maps/embed/v1/search?key={self.maps_api_key}&q={encoded_query}"
+            return self._maps_embed_search_prefix + urllib.parse.quote_plus(search_query)
             
         except Exception as e:
             print(f"Error creating maps embed URL: {e}")
-            import urllib.parse
-            return f"https://www.google.com/maps/embed/v1/search?key={self.maps_api_key}&q={urllib.parse.quote_plus(destination)}"
+            return self._maps_embed_search_prefix + urllib.parse.quote_plus(destination)
     
-    def _extract_dynamic_features(self, place_details: Dict, place: Dict) -> List[str]:
-        """Extract features dynamically from Google Places data"""
+    def _extract_dynamic_features(self, place: Dict, place_details: Optional[Dict] = None) -> List[str]:
+        """Extract features dynamically from Google Places data (place_details only when a Details response is already in hand)"""
         features = []
         
         try:
@@ -4088,25 +4814,9 @@ Rules:
             if not text or len(text) < 5:
                 return []
             
-            feature_keywords = {
-                'wifi': 'Free WiFi',
-                'pool': 'Swimming Pool',
-                'parking': 'Free Parking',
-                'breakfast': 'Breakfast Included',
-                'gym': 'Fitness Center',
-                'spa': 'Spa',
-                'restaurant': 'On-site Restaurant',
-                'beach': 'Beachfront',
-                'pet': 'Pet Friendly',
-                'air conditioning': 'Air Conditioning',
-                'balcony': 'Balcony',
-                'kitchen': 'Kitchen Access',
-                'bar': 'In-house Bar'
-            }
-            
             text_lower = text.lower()
             features = []
-            for keyword, label in feature_keywords.items():
+            for keyword, label in ACCOMMODATION_FEATURE_KEYWORDS:
                 if keyword in text_lower:
                     features.append(label)
                 if len(features) >= 3:
@@ -4213,7 +4923,9 @@ Rules:
                     if (midpoint_in_budget or ranges_overlap) and not clearly_below_budget and not property_max_below_min:
                         filtered.append(suggestion)
                     else:
-                        print(f"✗ Filtered out '{suggestion.get('name', 'Unknown')}': {price_range} (midpoint: {currency}{price_midpoint:.0f}, max: {currency}{price_max:.0f}, budget: {currency}{user_min}-{currency}{max_val})")
+                        logger.debug("✗ Filtered out %r: %s (midpoint: %s%.0f, max: %s%.0f, budget: %s%s-%s%s)",
+                                     suggestion.get('name', 'Unknown'), price_range, currency, price_midpoint,
+                                     currency, price_max, currency, user_min, currency, max_val)
                 # Else: doesn't meet budget criteria, skip it
             
             if not filtered:
@@ -4311,16 +5023,19 @@ Rules:
             print(f"Error getting currency from destination: {e}")
             # Fallback based on common destinations
             destination_lower = destination.lower()
-            if any(country in destination_lower for country in ['india', 'chennai', 'mumbai', 'delhi', 'bangalore', 'kodaikanal', 'goa']):
-                return "INR"
-            elif any(country in destination_lower for country in ['usa', 'united states', 'new york', 'california']):
-                return "USD"
-            elif any(country in destination_lower for country in ['uk', 'united kingdom', 'london']):
-                return "GBP"
-            elif any(country in destination_lower for country in ['japan', 'tokyo']):
-                return "JPY"
-            else:
-                return "USD"  # Default fallback
+            for keywords, currency in DESTINATION_CURRENCY_HINTS:
+                if any(keyword in destination_lower for keyword in keywords):
+                    return currency
+            return "USD"  # Default fallback
+    
+    @staticmethod
+    def _is_rich_enough(place: Dict) -> bool:
+        """True when Places already returned a price level and an established rating for this place"""
+        return (
+            place.get('price_level') is not None
+            and bool(place.get('rating'))
+            and (place.get('user_ratings_total') or 0) >= 10
+        )
     
     def _get_quick_price_estimate(self, place: Dict, currency: str, preferred_budget: Dict = None) -> str:
         """Fast price estimation using lookup tables instead of AI"""
@@ -4343,14 +5058,7 @@ Rules:
             elif rating >= 4.0:
                 multiplier *= 1.05
             
-            tiers = [
-                ('budget_min', 'budget_low'),
-                ('budget_low', 'budget_mid'),
-                ('budget_mid', 'budget_high'),
-                ('budget_high', 'budget_luxury'),
-                ('budget_luxury', 'budget_luxury')
-            ]
-            min_tier, max_tier = tiers[min(price_level, 4)]
+            min_tier, max_tier = PRICE_LEVEL_TIERS[min(price_level, 4)]
             
             base_min = base_prices.get(min_tier, 1000)
             base_max = base_prices.get(max_tier, 5000)
@@ -4397,7 +5105,17 @@ Rules:
             return f"{currency}{int(base_min)}-{currency}{int(base_max)}"
     
     def _get_dynamic_base_prices(self, currency: str) -> Dict:
-        """Get dynamic base prices for any currency - SCALABLE"""
+        """Get dynamic base prices for any currency - SCALABLE (memoized per currency)"""
+        cached = self._base_prices_cache.get(currency)
+        if cached is not None:
+            return cached
+        # Read-only view so callers can't mutate the shared cached entry
+        base_prices = MappingProxyType(self._compute_dynamic_base_prices(currency))
+        self._base_prices_cache[currency] = base_prices
+        return base_prices
+    
+    def _compute_dynamic_base_prices(self, currency: str) -> Dict:
+        """Resolve base prices for a currency from pricing config or USD multipliers"""
         try:
             # Try to load from pricing config first (from pricing_ranges.json)
             if hasattr(self, 'pricing_config') and self.pricing_config:
@@ -4406,12 +5124,7 @@ Rules:
                 currency_data = currencies.get(currency, {})
                 if not currency_data:
                     # Try common currency code mappings
-                    currency_code_map = {
-                        '₹': 'INR', '$': 'USD', '€': 'EUR', '£': 'GBP', '¥': 'JPY',
-                        '₩': 'KRW', '₱': 'PHP', '₫': 'VND', '฿': 'THB',
-                        '₺': 'TRY', '₪': 'ILS', '₦': 'NGN'
-                    }
-                    currency_code = currency_code_map.get(currency, currency.upper())
+                    currency_code = CURRENCY_SYMBOL_CODES.get(currency, currency.upper())
                     currency_data = currencies.get(currency_code, {})
                 
                 if currency_data:
@@ -4431,61 +5144,8 @@ Rules:
             # Use approximate exchange rate multipliers relative to USD
             # This makes it scalable for ANY currency without hardcoding
             
-            # Base prices in USD (reference)
-            usd_base = {
-                'budget_min': 30,
-                'budget_low': 80,
-                'budget_mid': 150,
-                'budget_high': 300,
-                'budget_luxury': 500
-            }
-            
-            # Approximate currency multipliers (relative to USD)
-            # These are rough estimates - in production, use real-time exchange rates
-            currency_multipliers = {
-                # Major currencies
-                '$': 1.0, 'USD': 1.0,
-                '€': 0.92, 'EUR': 0.92,
-                '£': 0.79, 'GBP': 0.79,
-                '¥': 150.0, 'JPY': 150.0,
-                'CHF': 0.88,
-                'C$': 1.35, 'CAD': 1.35,
-                'A$': 1.52, 'AUD': 1.52,
-                'NZ$': 1.68, 'NZD': 1.68,
-                
-                # Asian currencies
-                '₹': 83.0, 'INR': 83.0,
-                '₩': 1300.0, 'KRW': 1300.0,
-                'S$': 1.34, 'SGD': 1.34,
-                'HK$': 7.8, 'HKD': 7.8,
-                'RM': 4.7, 'MYR': 4.7,
-                'Rp': 15700.0, 'IDR': 15700.0,
-                '₱': 56.0, 'PHP': 56.0,
-                '₫': 24500.0, 'VND': 24500.0,
-                '฿': 36.0, 'THB': 36.0,
-                'NT$': 32.0, 'TWD': 32.0,
-                
-                # Middle Eastern
-                'AED': 3.67, 'SAR': 3.75, 'QAR': 3.64,
-                
-                # African
-                'R': 18.5, 'ZAR': 18.5,
-                '₦': 1600.0, 'NGN': 1600.0,
-                'KSh': 130.0, 'KES': 130.0,
-                'EGP': 31.0,
-                
-                # European (non-EUR)
-                'NOK': 10.7, 'SEK': 10.9, 'DKK': 6.9,
-                'CZK': 23.0, 'PLN': 4.0, 'HUF': 360.0,
-                '₺': 32.0, 'TRY': 32.0,
-                
-                # Americas
-                'R$': 5.0, 'BRL': 5.0,
-                'S/': 3.7, 'PEN': 3.7,
-            }
-            
             # Get multiplier for currency (default to 1.0 if unknown)
-            multiplier = currency_multipliers.get(currency, 1.0)
+            multiplier = USD_CURRENCY_MULTIPLIERS.get(currency, 1.0)
             
             # If currency not in map, try to estimate from common patterns
             if multiplier == 1.0 and currency not in ['$', 'USD']:
@@ -4495,7 +5155,7 @@ Rules:
                 if len(currency) == 1:
                     # Single char currencies are often high-value (like €, £, ¥)
                     if currency in ['€', '£', '¥']:
-                        multiplier = currency_multipliers.get(currency, 1.0)
+                        multiplier = USD_CURRENCY_MULTIPLIERS.get(currency, 1.0)
                     else:
                         # Unknown single char - assume similar to USD
                         multiplier = 1.0
@@ -4509,11 +5169,11 @@ Rules:
             
             # Calculate dynamic base prices
             return {
-                'budget_min': usd_base['budget_min'] * multiplier,
-                'budget_low': usd_base['budget_low'] * multiplier,
-                'budget_mid': usd_base['budget_mid'] * multiplier,
-                'budget_high': usd_base['budget_high'] * multiplier,
-                'budget_luxury': usd_base['budget_luxury'] * multiplier
+                'budget_min': USD_BASE_PRICES['budget_min'] * multiplier,
+                'budget_low': USD_BASE_PRICES['budget_low'] * multiplier,
+                'budget_mid': USD_BASE_PRICES['budget_mid'] * multiplier,
+                'budget_high': USD_BASE_PRICES['budget_high'] * multiplier,
+                'budget_luxury': USD_BASE_PRICES['budget_luxury'] * multiplier
             }
             
         except Exception as e:
@@ -4597,19 +5257,13 @@ Rules:
     def _calculate_currency_based_pricing(self, currency: str) -> Dict:
         """Calculate pricing based on currency and economic factors"""
         # Dynamic pricing based on currency strength and typical accommodation costs
-        currency_multipliers = {
-            '$': {'budget_min': 30, 'budget_low': 80, 'budget_mid': 150, 'budget_high': 300, 'budget_luxury': 500},
-            '₹': {'budget_min': 2000, 'budget_low': 5000, 'budget_mid': 10000, 'budget_high': 20000, 'budget_luxury': 35000},
-            '€': {'budget_min': 25, 'budget_low': 70, 'budget_mid': 130, 'budget_high': 250, 'budget_luxury': 400},
-            '£': {'budget_min': 20, 'budget_low': 60, 'budget_mid': 120, 'budget_high': 220, 'budget_luxury': 350},
-            '¥': {'budget_min': 3000, 'budget_low': 8000, 'budget_mid': 15000, 'budget_high': 30000, 'budget_luxury': 50000}
-        }
-        
-        return currency_multipliers.get(currency, currency_multipliers['$'])
+        return CURRENCY_BASE_PRICES.get(currency, CURRENCY_BASE_PRICES['$'])
     
-    def _calculate_dynamic_price_range(self, price_level: int, currency: str) -> str:
-        """Calculate dynamic price range when database data is unavailable"""
-        base_prices = self._calculate_currency_based_pricing(currency)
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _calculate_dynamic_price_range(price_level: int, currency: str) -> str:
+        """Calculate dynamic price range when database data is unavailable (pure in its inputs, so memoized)"""
+        base_prices = CURRENCY_BASE_PRICES.get(currency, CURRENCY_BASE_PRICES['$'])
         
         if price_level == 0:
             return f"{currency}{base_prices['budget_min']}-{currency}{base_prices['budget_low']}"
@@ -4626,59 +5280,33 @@ Rules:
     
     def _get_fallback_accommodation_suggestions(self, destination: str) -> List[Dict]:
         """Fallback accommodation suggestions when Google Places API fails"""
-        try:
-            import urllib.parse
-            
-            # Create Google Maps search URL for accommodations
-            search_query = f"hotels accommodations {destination}"
-            encoded_query = urllib.parse.quote_plus(search_query)
-            maps_url = f"https://www.google.com/maps/search/?api=1&query={encoded_query}"
-            
-            return [
-                {
-                    "name": f"Accommodations in {destination}",
-                    "description": f"Search for hotels and accommodations in {destination} using Google Maps",
-                    "price_range": "Varies",
-                    "rating": "N/A - Search results",
-                    "features": ["Real-time availability", "User reviews", "Direct booking"],
-                    "location": destination,
-                    "why_recommended": "Direct access to Google Maps accommodation search",
-                    "maps_url": maps_url,
-                    "external_url": maps_url,
-                    "link_type": "maps"
-                }
-            ]
-        except Exception as e:
-            return [
-                {
-                    "name": "Google Maps Accommodation Search",
-                    "description": f"Search for accommodations in {destination}",
-                    "price_range": "Varies",
-                    "rating": "N/A - Search results",
-                    "features": ["Real-time availability", "User reviews"],
-                    "location": destination,
-                    "why_recommended": "Direct access to real accommodation options",
-                    "external_url": "https://www.google.com/maps/",
-                    "link_type": "maps"
-                }
-            ]
+        # Copy the memoized suggestions, features list included, so callers can annotate them without touching the cache
+        return [
+            {**suggestion, "features": list(suggestion["features"])}
+            for suggestion in self._cached_fallback_accommodation_suggestions(destination)
+        ]
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _cached_fallback_accommodation_suggestions(destination: str) -> Tuple[MappingProxyType, ...]:
+        """Build the read-only fallback accommodation suggestions once per destination"""
+        # Create Google Maps search URL for accommodations
+        maps_url = AIService._maps_search_url(f"hotels accommodations {destination}")
+        
+        return (
+            MappingProxyType({
+                **FALLBACK_ACCOMMODATION_MAPS_FIELDS,
+                "name": f"Accommodations in {destination}",
+                "description": f"Search for hotels and accommodations in {destination} using Google Maps",
+                "location": destination,
+                "maps_url": maps_url,
+                "external_url": maps_url,
+            }),
+        )
 
     def _get_fallback_transportation_suggestions(self, destination: str, answers: List[Dict]) -> List[Dict]:
         """Fallback transportation suggestions when real data fails"""
-        return [
-            {
-                "name": "RedBus",
-                "description": "Online bus booking platform",
-                "price_range": "₹500-₹1500",
-                "rating": 4.2,
-                "features": ["Online Booking", "Multiple Operators", "Easy Cancellation"],
-                "location": f"To {destination}",
-                "why_recommended": "Reliable bus booking service",
-                "booking_url": "https://www.easemytrip.com/bus/",
-                "external_url": "https://www.easemytrip.com/bus/",
-                "link_type": "booking"
-            }
-        ]
+        return [{**FALLBACK_BUS_FIELDS, "features": list(FALLBACK_BUS_FIELDS["features"]), "location": f"To {destination}"}]
     
     def _get_fallback_suggestions(self, room_type: str, destination: str) -> List[Dict]:
         """No fallback - AI service must work"""
@@ -4747,7 +5375,7 @@ WEATHER FORECAST:
 {weather_text}
 
 EXISTING ACTIVITIES (use ONLY these, do NOT make up new ones):
-{json.dumps(activity_names, indent=2)}
+{json_dumps(activity_names)}
 
 TASK:
 For EACH day, assign 1-2 activities that are BEST for that day's weather. Each day should have its own analysis and activities.
@@ -4790,12 +5418,9 @@ Format as JSON:
             # Parse response
             try:
                 # Try to extract JSON from response
-                import re
-                json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-                if json_match:
-                    result = json.loads(json_match.group())
-                else:
-                    result = json.loads(response_text)
+                result = self._extract_json_value(response_text, '{')
+                if result is None:
+                    result = json_loads(response_text)
                 
                 # Ensure all required fields
                 if 'daily_plans' not in result:
@@ -1,13 +1,15 @@
 from flask import Flask, request, jsonify, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import os
 from dotenv import load_dotenv
 import uuid
 from datetime import datetime, UTC, timedelta
 import json
+import logging
 import threading
 from pathlib import Path
-from utils import get_currency_from_destination, get_travel_type, get_transportation_options
+from utils import get_currency_from_destination, get_travel_type, get_transportation_options, build_http_session
 from firebase_service import firebase_service
 from booking_service import booking_service
 from bigquery_service import bigquery_service
@@ -20,6 +22,11 @@ from services import (
 )
 from weather_service import WeatherService
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; Flask's stdlib-json provider is used without it
+    orjson = None
+
 # Load environment variables - explicitly from backend/.env to avoid conflicts with root .env
 backend_dir = Path(__file__).parent
 env_path = backend_dir / '.env'
@@ -38,6 +45,29 @@ else:
 
 app = Flask(__name__, static_folder='../dist', static_url_path='')
 
+# Service debug logging is off unless LOG_LEVEL=DEBUG is set
+logging.basicConfig(level=os.getenv('LOG_LEVEL', 'WARNING').upper())
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes API responses with orjson (C-accelerated)"""
+
+    def dumps(self, obj, **kwargs):
+        # Datetimes go through Flask's default hook so the wire format stays the same
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
 # Configure CORS - Allow all origins for API endpoints
 # Using a more permissive configuration that works with Vercel and local development
 CORS(app, resources={
@@ -94,6 +124,11 @@ except Exception as e:
     import traceback
     print(f"   Traceback: {traceback.format_exc()}")
 
+# Rooms every new group gets, in creation order (fixed, so built once rather than per request)
+ROOM_TYPES = ('accommodation', 'transportation', 'activities', 'dining')
+# Fields shared by every new room; create_rooms_for_group only adds group_id and room_type
+ROOM_TEMPLATE = {'status': 'active', 'is_completed': False}
+
 room_service_registry = {
     'accommodation': AccommodationService(ai_service=ai_service),
     'transportation': TransportationService(ai_service=ai_service),
@@ -102,6 +137,8 @@ room_service_registry = {
 }
 
 weather_service = WeatherService()
+# Keep-alive pool for the per-keystroke Places autocomplete proxy
+places_http = build_http_session()
 
 
 def get_room_service_by_type(room_type: str):
@@ -254,9 +291,6 @@ def get_group_members(group_id):
 def get_places_autocomplete():
     """Get place autocomplete suggestions from Google Places API"""
     try:
-        import os
-        import requests
-        
         query = request.args.get('input', '')
         if not query or len(query) < 2:
             return jsonify({'predictions': []})
@@ -273,10 +307,10 @@ def get_places_autocomplete():
             'types': '(cities)'  # Focus on cities/locations
         }
         
-        response = requests.get(autocomplete_url, params=params, timeout=5)
+        response = places_http.get(autocomplete_url, params=params, timeout=5)
         
         if response.status_code == 200:
-            data = response.json()
+            data = app.json.loads(response.content)
             if data.get('status') == 'OK':
                 predictions = []
                 for prediction in data.get('predictions', []):
@@ -686,17 +720,10 @@ def create_rooms_for_group(group_id):
         if not group:
             return jsonify({'error': 'Group not found'}), 404
         
-        # Define room types
-        room_types = ['accommodation', 'transportation', 'activities', 'dining']
         created_rooms = []
         
-        for room_type in room_types:
-            room_data = {
-                'group_id': group_id,
-                'room_type': room_type,
-                'status': 'active',
-                'is_completed': False
-            }
+        for room_type in ROOM_TYPES:
+            room_data = {**ROOM_TEMPLATE, 'group_id': group_id, 'room_type': room_type}
             
             room = firebase_service.create_room(room_data)
             created_rooms.append(room)
@@ -1201,9 +1228,8 @@ Return ONLY a JSON array of facts, no additional text:
                     response_text = response_text[4:]
                 response_text = response_text.strip()
             
-            # Parse JSON response
-            import json
-            facts = json.loads(response_text)
+            # Parse JSON response (orjson-backed when available)
+            facts = app.json.loads(response_text)
             
             if isinstance(facts, list) and len(facts) > 0:
                 return jsonify({
@@ -1752,7 +1778,7 @@ def consolidate_group_preferences(group_id):
         # Use AI to find common preferences
         if ai_service and ai_service.model:
             # Prepare data for AI analysis
-            prompt = f"""You are an expert travel planner analyzing group preferences to find the BEST consolidated options that work for everyone.
+            prompt_parts = [f"""You are an expert travel planner analyzing group preferences to find the BEST consolidated options that work for everyone.
 
 GROUP CONTEXT:
 - Destination: {destination}
@@ -1761,7 +1787,7 @@ GROUP CONTEXT:
 
 MEMBER SELECTIONS BY CATEGORY:
 
-"""
+"""]
             
             # Add selections for each category with full details
             # CRITICAL: If room_type_filter is provided, only process that room type
@@ -1782,17 +1808,17 @@ MEMBER SELECTIONS BY CATEGORY:
                     user_list = ', '.join(completed_by_users) if completed_by_users else 'Group members'
                     user_preferences = data.get('user_preferences', {})
                     
-                    prompt += f"""
+                    prompt_parts.append(f"""
 {room_type.upper()} - MEMBER PREFERENCES AND SELECTIONS:
 
 Members who completed: {user_list}
 
 ACTUAL USER PREFERENCES (from their form answers - THIS IS THE PRIMARY BASIS FOR CONSOLIDATION):
-"""
+""")
                     # Add actual preferences from user answers
                     for user_name, answers in user_preferences.items():
                         if answers and isinstance(answers, list) and len(answers) > 0:
-                            prompt += f"\n{user_name}'s Preferences:\n"
+                            prompt_parts.append(f"\n{user_name}'s Preferences:\n")
                             for answer in answers:
                                 question_text = answer.get('question_text', answer.get('question_id', 'Unknown'))
                                 answer_value = answer.get('answer_value', 'N/A')
@@ -1803,14 +1829,14 @@ ACTUAL USER PREFERENCES (from their form answers - THIS IS THE PRIMARY BASIS FOR
                                         answer_value = str(answer_value)
                                 elif isinstance(answer_value, list):
                                     answer_value = ', '.join(str(v) for v in answer_value)
-                                prompt += f"  - {question_text}: {answer_value}\n"
+                                prompt_parts.append(f"  - {question_text}: {answer_value}\n")
                         else:
-                            prompt += f"\n{user_name}: No explicit preferences recorded\n"
+                            prompt_parts.append(f"\n{user_name}: No explicit preferences recorded\n")
                     
-                    prompt += f"""
+                    prompt_parts.append(f"""
 SELECTIONS MADE BY MEMBERS ({len(selections)} total, select {optimal_count} consolidated options based on preferences above):
 NOTE: You should select {optimal_count} options that best match the group's preferences. Consider top preferences and consensus, but provide a good variety of {optimal_count} options that reflect the exact property types, amenities, and locations members requested (e.g., cottages, beach-front, private villas). Ratings should only be used when two options meet *all* preference criteria equally.
-                    """
+                    """)
                     for i, selection in enumerate(selections, 1):
                         name = selection.get('name') or selection.get('title') or 'N/A'
                         desc = selection.get('description', 'N/A')
@@ -1819,16 +1845,16 @@ NOTE: You should select {optimal_count} options that best match the group's pref
                         features = selection.get('features', [])
                         highlights = selection.get('highlights', [])
                         
-                        prompt += f"""
+                        prompt_parts.append(f"""
   Selection {i}: {name}
     Description: {desc[:150] if len(desc) > 150 else desc}
     Price: {price}
     Rating: {rating}/5 (NOTE: Rating is SECONDARY - preferences are PRIMARY)
     Features: {', '.join(features) if features else 'N/A'}
     Highlights: {', '.join(highlights) if highlights else 'N/A'}
-"""
+""")
             
-            prompt += f"""
+            prompt_parts.append(f"""
 
 CRITICAL TASK - INTELLIGENT CONSOLIDATION BASED ON USER PREFERENCES:
 
@@ -1859,18 +1885,18 @@ CRITICAL TASK - INTELLIGENT CONSOLIDATION BASED ON USER PREFERENCES:
      c) Prioritize options with highest consensus/vote counts AND preference alignment
    
 4. **Select Optimal Options**: Choose exactly the number specified per category:
-"""
+""")
             for room_type, count in room_type_counts.items():
-                prompt += f"   - {room_type}: {count} options (IMPORTANT: Show {count} options, not fewer)\n"
+                prompt_parts.append(f"   - {room_type}: {count} options (IMPORTANT: Show {count} options, not fewer)\n")
             
             # If filtering by room type, emphasize that only that room type should be returned
             if room_type_filter:
-                prompt += f"""
+                prompt_parts.append(f"""
 CRITICAL: You are ONLY consolidating {room_type_filter}. Return consolidated_selections ONLY for {room_type_filter}, and analysis_details ONLY for {room_type_filter}. 
 Do NOT include other room types in your response.
-"""
+""")
             
-            prompt += """
+            prompt_parts.append("""
 5. **Selection Criteria (IN ORDER OF PRIORITY)**:
    a) **FIRST**: Match user preferences (budget, location, type, amenities) - THIS IS MOST IMPORTANT
    b) **SECOND**: Represent group consensus (selected by multiple users)
@@ -1940,87 +1966,84 @@ Return ONLY valid JSON (no markdown, no code blocks):
 
 IMPORTANT: For each room type in analysis_details, include the actual user names from the selections above. Explain clearly which user's preferences influenced each consolidated choice and why.
 {f'CRITICAL: You are ONLY consolidating {room_type_filter.upper()}. In your JSON response, ONLY include consolidated_selections and analysis_details for {room_type_filter}. Set other room types to empty arrays [] or omit them entirely.' if room_type_filter else ''}
-Generate the consolidated recommendations now. Be specific and practical."""
+Generate the consolidated recommendations now. Be specific and practical.""")
 
-            response = ai_service.model.generate_content(prompt)
+            prompt = ''.join(prompt_parts)
+            import json
+            
+            # Stream the response and stop reading once the JSON object is complete, ignoring any trailing prose.
+            # Consolidation reflects live member selections, so it always goes to the model instead of the response cache
+            try:
+                consolidated_data = ai_service._generate_json_object_with_gemini(prompt, use_cache=False)
+            except json.JSONDecodeError as e:
+                print(f"JSON parse error: {e}")
+                consolidated_data = None
             
-            if response and response.text:
-                # Parse AI response
-                import json
-                import re
+            if isinstance(consolidated_data, dict):
+                # Add metadata with user information
+                consolidated_data['ai_analyzed'] = True
+                consolidated_data['total_members'] = total_members
+                consolidated_data['destination'] = destination
                 
-                # Try to extract JSON from response
-                json_match = re.search(r'\{.*\}', response.text, re.DOTALL)
-                if json_match:
-                    try:
-                        consolidated_data = json.loads(json_match.group())
-                        # Add metadata with user information
-                        consolidated_data['ai_analyzed'] = True
-                        consolidated_data['total_members'] = total_members
-                        consolidated_data['destination'] = destination
-                        
-                        # Log which room types were processed
-                        processed_room_types = list(all_selections_by_room.keys())
-                        print(f"✅ AI consolidation completed for room types: {processed_room_types}")
-                        if room_type_filter:
-                            print(f"   (Filtered to: {room_type_filter})")
-                        print(f"   Consolidated selections keys: {list(consolidated_data.get('consolidated_selections', {}).keys())}")
-                        print(f"   Analysis details keys: {list(consolidated_data.get('analysis_details', {}).keys())}")
-                        
-                        # Filter consolidated_selections and analysis_details to only include requested room types
-                        if room_type_filter:
-                            # Only keep the filtered room type
-                            if 'consolidated_selections' in consolidated_data:
-                                filtered_selections = {}
-                                if room_type_filter in consolidated_data['consolidated_selections']:
-                                    filtered_selections[room_type_filter] = consolidated_data['consolidated_selections'][room_type_filter]
-                                consolidated_data['consolidated_selections'] = filtered_selections
-                            
-                            if 'analysis_details' in consolidated_data:
-                                filtered_analysis = {}
-                                if room_type_filter in consolidated_data['analysis_details']:
-                                    filtered_analysis[room_type_filter] = consolidated_data['analysis_details'][room_type_filter]
-                                consolidated_data['analysis_details'] = filtered_analysis
-                            
-                            # Ensure ai_status_by_room is set for the filtered room type
-                            if 'ai_status_by_room' not in consolidated_data:
-                                consolidated_data['ai_status_by_room'] = {}
-                            consolidated_data['ai_status_by_room'][room_type_filter] = True
+                # Log which room types were processed
+                processed_room_types = list(all_selections_by_room.keys())
+                print(f"✅ AI consolidation completed for room types: {processed_room_types}")
+                if room_type_filter:
+                    print(f"   (Filtered to: {room_type_filter})")
+                print(f"   Consolidated selections keys: {list(consolidated_data.get('consolidated_selections', {}).keys())}")
+                print(f"   Analysis details keys: {list(consolidated_data.get('analysis_details', {}).keys())}")
+                
+                # Filter consolidated_selections and analysis_details to only include requested room types
+                if room_type_filter:
+                    # Only keep the filtered room type
+                    if 'consolidated_selections' in consolidated_data:
+                        filtered_selections = {}
+                        if room_type_filter in consolidated_data['consolidated_selections']:
+                            filtered_selections[room_type_filter] = consolidated_data['consolidated_selections'][room_type_filter]
+                        consolidated_data['consolidated_selections'] = filtered_selections
+                    
+                    if 'analysis_details' in consolidated_data:
+                        filtered_analysis = {}
+                        if room_type_filter in consolidated_data['analysis_details']:
+                            filtered_analysis[room_type_filter] = consolidated_data['analysis_details'][room_type_filter]
+                        consolidated_data['analysis_details'] = filtered_analysis
+                    
+                    # Ensure ai_status_by_room is set for the filtered room type
+                    if 'ai_status_by_room' not in consolidated_data:
+                        consolidated_data['ai_status_by_room'] = {}
+                    consolidated_data['ai_status_by_room'][room_type_filter] = True
+                
+                # Add user information for each room type (only for processed room types)
+                consolidated_data['users_by_room'] = {
+                    room_type: data.get('completed_by_users', [])
+                    for room_type, data in all_selections_by_room.items()
+                    if not room_type_filter or room_type == room_type_filter
+                }
+                
+                # Ensure analysis_details exists
+                if 'analysis_details' not in consolidated_data:
+                    consolidated_data['analysis_details'] = {}
+                
+                # Add user names to analysis_details if not present, or ensure they're always included
+                # Only process room types that were actually consolidated
+                for room_type, data in all_selections_by_room.items():
+                    # Skip if filtering and this isn't the filtered room type
+                    if room_type_filter and room_type != room_type_filter:
+                        continue
                         
-                        # Add user information for each room type (only for processed room types)
-                        consolidated_data['users_by_room'] = {
-                            room_type: data.get('completed_by_users', [])
-                            for room_type, data in all_selections_by_room.items()
-                            if not room_type_filter or room_type == room_type_filter
+                    if room_type not in consolidated_data.get('analysis_details', {}):
+                        consolidated_data.setdefault('analysis_details', {})[room_type] = {
+                            'users_analyzed': data.get('completed_by_users', []),
+                            'user_count': data.get('user_count', 0)
                         }
-                        
-                        # Ensure analysis_details exists
-                        if 'analysis_details' not in consolidated_data:
-                            consolidated_data['analysis_details'] = {}
-                        
-                        # Add user names to analysis_details if not present, or ensure they're always included
-                        # Only process room types that were actually consolidated
-                        for room_type, data in all_selections_by_room.items():
-                            # Skip if filtering and this isn't the filtered room type
-                            if room_type_filter and room_type != room_type_filter:
-                                continue
-                                
-                            if room_type not in consolidated_data.get('analysis_details', {}):
-                                consolidated_data.setdefault('analysis_details', {})[room_type] = {
-                                    'users_analyzed': data.get('completed_by_users', []),
-                                    'user_count': data.get('user_count', 0)
-                                }
-                            else:
-                                # Ensure users_analyzed is always present even if AI returned analysis_details
-                                if 'users_analyzed' not in consolidated_data['analysis_details'][room_type]:
-                                    consolidated_data['analysis_details'][room_type]['users_analyzed'] = data.get('completed_by_users', [])
-                                if 'user_count' not in consolidated_data['analysis_details'][room_type]:
-                                    consolidated_data['analysis_details'][room_type]['user_count'] = data.get('user_count', 0)
-                        
-                        return jsonify(consolidated_data), 200
-                    except json.JSONDecodeError as e:
-                        print(f"JSON parse error: {e}")
-                        print(f"Response text: {response.text[:500]}")
+                    else:
+                        # Ensure users_analyzed is always present even if AI returned analysis_details
+                        if 'users_analyzed' not in consolidated_data['analysis_details'][room_type]:
+                            consolidated_data['analysis_details'][room_type]['users_analyzed'] = data.get('completed_by_users', [])
+                        if 'user_count' not in consolidated_data['analysis_details'][room_type]:
+                            consolidated_data['analysis_details'][room_type]['user_count'] = data.get('user_count', 0)
+                
+                return jsonify(consolidated_data), 200
         
         # Fallback: return existing selections without AI consolidation
         fallback_data = {
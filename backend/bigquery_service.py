@@ -1,8 +1,6 @@
 from google.cloud import bigquery
 from google.cloud.exceptions import NotFound
-import os
 from datetime import datetime
-import json
 
 class BigQueryService:
     def __init__(self):
@@ -1,11 +1,14 @@
 import random
 import urllib.parse
 import os
+import time
 from datetime import datetime
 from typing import Dict, List, Optional
 
 import requests
 
+from utils import build_http_session
+
 # Lazy import for AI (only if needed)
 try:
     import google.generativeai as genai
@@ -23,6 +26,10 @@ class EaseMyTripService:
     TRAIN_BASE = "https://railways.easemytrip.com"
     TRAIN_AUTOSUGGEST_BASE = "https://solr.easemytrip.com/api/auto/GetTrainAutoSuggest"
     USER_AGENT = "Mozilla/5.0 (WanderlyHackathon/1.0)"
+    TRAIN_DESCRIPTION_TTL = 3600  # seconds
+    TRAIN_DESCRIPTION_CACHE_MAX = 256  # routes kept; oldest evicted first
+    # Display symbols for ISO codes in EaseMyTrip responses; other codes are shown as given
+    CURRENCY_SYMBOLS = {"INR": "₹"}
 
     # City name normalization dictionary
     # Using hardcoded synonyms instead of AI for better:
@@ -52,13 +59,40 @@ class EaseMyTripService:
         "ncr": "Delhi",
     }
 
+    # Train API uses different names than the bus API (e.g. "Bengaluru" not "Bangalore")
+    TRAIN_STATION_SYNONYMS = {
+        "bangalore": "Bengaluru",
+        "bengaluru": "Bengaluru",
+        "bombay": "Mumbai",
+        "mumbai": "Mumbai",
+        "madras": "Chennai",
+        "chennai": "Chennai",
+    }
+
+    # Fallback tables as (name, base price) / (name, number) pairs, built once
+    FALLBACK_BUS_TYPES = ("Semi-Sleeper", "Sleeper", "AC Sleeper", "Non-AC", "AC Seater")
+    FALLBACK_BUS_OPERATORS = (
+        ("KSRTC", 400),
+        ("VRL Travels", 800),
+        ("Orange Tours", 700),
+        ("Neeta Travels", 900),
+        ("SRS Travels", 750),
+    )
+    FALLBACK_TRAINS = (
+        ("Grand Trunk Express", "12615"),
+        ("Shatabdi Express", "12007"),
+        ("Rajdhani Express", "12951"),
+    )
+
     def __init__(self):
-        self.bus_session = requests.Session()
-        self.train_session = requests.Session()
+        # Separate cookie jars per site section; both keep pooled keep-alive connections and retry transient GET failures
+        self.bus_session = build_http_session()
+        self.train_session = build_http_session()
         self.bus_session.headers.update({"User-Agent": self.USER_AGENT})
         self.train_session.headers.update({"User-Agent": self.USER_AGENT})
         self._bus_city_cache: Dict[str, Dict] = {}
         self._train_station_cache: Dict[str, Dict] = {}
+        self._train_description_cache: Dict[tuple, tuple] = {}  # route -> (timestamp, description)
         self._rng = random.Random()
         
         # Initialize AI model for generating realistic descriptions (lazy)
@@ -222,6 +256,7 @@ class EaseMyTripService:
 
         bd_points = trip.get("bdPoints") or []
         dp_points = trip.get("dpPoints") or []
+        route_label = self._route_strings(source, destination, travel_date)[0]
 
         return {
             "name": f"{trip.get('Travels', '').strip()} ({trip.get('busType', '').strip()})".strip(),
@@ -241,7 +276,7 @@ class EaseMyTripService:
             "rating": None,
             "origin": source["name"],
             "destination": destination["name"],
-            "location": f"{source['name']} to {destination['name']}",
+            "location": route_label,
             "departure_date": travel_date,
             "why_recommended": self._build_bus_reason(trip, available_seats),
             "booking_url": booking_url,
@@ -429,15 +464,14 @@ class EaseMyTripService:
             availability = fare["avlDayList"][0].get("availablityStatusNew") or ""
 
         booking_class = fare["enqClass"] if fare else "SL"
-        slug_from = self._slugify(source["name"])
-        slug_to = self._slugify(destination["name"])
+        route_label, route_slug, date_slug = self._route_strings(source, destination, travel_date)
         booking_url = (
             f"{self.TRAIN_BASE}/TrainInfo/"
-            f"{slug_from}-to-{slug_to}/"
+            f"{route_slug}/"
             f"{booking_class}/"
             f"{train.get('trainNumber')}/"
             f"{train.get('fromStnCode')}/{train.get('toStnCode')}/"
-            f"{travel_date.replace('/', '-')}"
+            f"{date_slug}"
         )
 
         features = [
@@ -467,7 +501,7 @@ class EaseMyTripService:
             "rating": None,
             "origin": source["name"],
             "destination": destination["name"],
-            "location": f"{source['name']} to {destination['name']}",
+            "location": route_label,
             "departure_date": travel_date,
             "why_recommended": self._build_train_reason(availability, train),
             "booking_url": booking_url,
@@ -599,9 +633,17 @@ class EaseMyTripService:
     def _format_price(self, currency: str, amount: Optional[float]) -> Optional[str]:
         if amount is None:
             return None
-        symbol = "₹" if currency.upper() == "INR" else currency
+        symbol = self.CURRENCY_SYMBOLS.get(currency.upper(), currency)
         return f"{symbol}{int(amount):,}"
 
+    def _route_strings(self, source: Dict, destination: Dict, travel_date: str) -> tuple:
+        """(location label, booking URL slug, date slug) for a route."""
+        return (
+            f"{source['name']} to {destination['name']}",
+            f"{self._slugify(source['name'])}-to-{self._slugify(destination['name'])}",
+            travel_date.replace("/", "-"),
+        )
+
     def _slugify(self, value: str) -> str:
         cleaned = (value or "").strip().lower().replace(" ", "-")
         return urllib.parse.quote(cleaned)
@@ -646,57 +688,42 @@ class EaseMyTripService:
         if "(" in cleaned:
             cleaned = cleaned.split("(", 1)[0]
         cleaned = " ".join(cleaned.split())
-        
-        # Train-specific mappings (EaseMyTrip train API uses different names)
-        train_synonyms = {
-            "bangalore": "Bengaluru",  # Train API expects "Bengaluru"
-            "bengaluru": "Bengaluru",
-            "bombay": "Mumbai",
-            "mumbai": "Mumbai",
-            "madras": "Chennai",
-            "chennai": "Chennai",
-        }
-        
-        return train_synonyms.get(cleaned.lower(), cleaned)
+        return self.TRAIN_STATION_SYNONYMS.get(cleaned.lower(), cleaned)
 
     def _generate_bus_fallback(self, from_location: str, destination: str, departure_date: str) -> List[Dict]:
-        bus_types = ["Semi-Sleeper", "Sleeper", "AC Sleeper", "Non-AC", "AC Seater"]
-        operators = [
-            {"name": "KSRTC", "base_price": 400},
-            {"name": "VRL Travels", "base_price": 800},
-            {"name": "Orange Tours", "base_price": 700},
-            {"name": "Neeta Travels", "base_price": 900},
-            {"name": "SRS Travels", "base_price": 750},
-        ]
+        # Route fields are the same for every fallback trip
+        shared_fields = {
+            "type": "bus",
+            "departure_time": "22:00",
+            "arrival_time": "06:00",
+            "duration": "8h",
+            "currency": "INR",
+            "origin": from_location,
+            "destination": destination,
+            "location": f"{from_location} to {destination}",
+            "departure_date": departure_date,
+            "why_recommended": "Temporary fallback suggestion",
+            "booking_url": "https://www.easemytrip.com/",
+            "external_url": "https://www.easemytrip.com/",
+            "link_type": "booking",
+        }
         suggestions = []
         for _ in range(4):
-            operator = self._rng.choice(operators)
-            bus_type = self._rng.choice(bus_types)
-            price = operator["base_price"] + self._rng.randint(50, 350)
+            operator, base_price = self._rng.choice(self.FALLBACK_BUS_OPERATORS)
+            bus_type = self._rng.choice(self.FALLBACK_BUS_TYPES)
+            price = base_price + self._rng.randint(50, 350)
             suggestions.append(
                 {
-                    "name": f"{operator['name']} {bus_type}",
-                    "type": "bus",
-                    "operator": operator["name"],
+                    **shared_fields,
+                    "name": f"{operator} {bus_type}",
+                    "operator": operator,
                     "bus_type": bus_type,
                     "description": f"Comfortable {bus_type.lower()} service",
-                    "departure_time": "22:00",
-                    "arrival_time": "06:00",
-                    "duration": "8h",
                     "price": price,
                     "price_range": f"₹{price}",
-                    "currency": "INR",
                     "seats_available": self._rng.randint(5, 20),
                     "amenities": ["Water Bottle", "Blanket"],
                     "features": ["Fallback data"],
-                    "origin": from_location,
-                    "destination": destination,
-                    "location": f"{from_location} to {destination}",
-                    "departure_date": departure_date,
-                    "why_recommended": "Temporary fallback suggestion",
-                    "booking_url": "https://www.easemytrip.com/",
-                    "external_url": "https://www.easemytrip.com/",
-                    "link_type": "booking",
                 }
             )
         return suggestions
@@ -718,8 +745,8 @@ class EaseMyTripService:
             return False
         
         try:
-            genai.configure(api_key=gemini_api_key)
-            self._ai_model = genai.GenerativeModel('gemini-2.0-flash')
+            from utils import get_fast_gemini_model
+            self._ai_model = get_fast_gemini_model(gemini_api_key)
             print("[EaseMyTripService] AI model initialized for train descriptions")
             return True
         except Exception as e:
@@ -790,44 +817,54 @@ Generate the description now:"""
             # Last resort: use location names without codes
             return f"Runs daily • From {from_location} • To {destination}"
 
-    def _generate_train_fallback(self, from_location: str, destination: str, departure_date: str) -> List[Dict]:
-        train_names = [
-            ("Grand Trunk Express", "12615"),
-            ("Shatabdi Express", "12007"),
-            ("Rajdhani Express", "12951"),
-        ]
-        
-        # Generate realistic description using AI
+    def _get_train_description(self, from_location: str, destination: str) -> str:
+        """Fallback train description for a route, reused for TTL seconds instead of re-asking the AI."""
+        key = (from_location.strip().lower(), destination.strip().lower())
+        cached = self._train_description_cache.get(key)
+        if cached:
+            if time.time() - cached[0] < self.TRAIN_DESCRIPTION_TTL:
+                return cached[1]
+            self._train_description_cache.pop(key, None)
         description = self._generate_realistic_train_description_ai(from_location, destination)
+        while len(self._train_description_cache) >= self.TRAIN_DESCRIPTION_CACHE_MAX:
+            self._train_description_cache.pop(next(iter(self._train_description_cache)), None)
+        self._train_description_cache[key] = (time.time(), description)
+        return description
+
+    def _generate_train_fallback(self, from_location: str, destination: str, departure_date: str) -> List[Dict]:
+        # Generate realistic description using AI; route fields are the same for every fallback train
+        shared_fields = {
+            "type": "train",
+            "class": "Sleeper",
+            "class_code": "SL",
+            "description": self._get_train_description(from_location, destination),
+            "departure_time": "21:30",
+            "arrival_time": "05:45",
+            "duration": "8h 15m",
+            "currency": "INR",
+            "seats_available": "WL",
+            "origin": from_location,
+            "destination": destination,
+            "location": f"{from_location} to {destination}",
+            "departure_date": departure_date,
+            "why_recommended": "Available train service on this route",
+            "booking_url": "https://www.easemytrip.com/railways/",
+            "external_url": "https://www.easemytrip.com/railways/",
+            "link_type": "booking",
+        }
         
         suggestions = []
-        for name, number in train_names:
+        for name, number in self.FALLBACK_TRAINS:
             price = self._rng.randint(500, 2000)
             suggestions.append(
                 {
+                    **shared_fields,
                     "name": f"{name} ({number})",
-                    "type": "train",
                     "train_number": number,
                     "train_name": name,
-                    "class": "Sleeper",
-                    "class_code": "SL",
-                    "description": description,  # Use AI-generated realistic description
-                    "departure_time": "21:30",
-                    "arrival_time": "05:45",
-                    "duration": "8h 15m",
                     "price": price,
                     "price_range": f"₹{price}",
-                    "currency": "INR",
-                    "seats_available": "WL",
                     "features": ["Daily service"],
-                    "origin": from_location,
-                    "destination": destination,
-                    "location": f"{from_location} to {destination}",
-                    "departure_date": departure_date,
-                    "why_recommended": "Available train service on this route",
-                    "booking_url": "https://www.easemytrip.com/railways/",
-                    "external_url": "https://www.easemytrip.com/railways/",
-                    "link_type": "booking",
                 }
             )
         return suggestions
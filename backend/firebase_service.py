@@ -1,8 +1,6 @@
 import firebase_admin
 from firebase_admin import credentials, firestore, storage
-import os
 from datetime import datetime
-import json
 
 class FirebaseService:
     def __init__(self):
@@ -78,8 +76,9 @@ class FirebaseService:
         """Create a new room"""
         doc_ref = self.db.collection('rooms').document()
         room_data['id'] = doc_ref.id
-        room_data['created_at'] = datetime.utcnow().isoformat()
-        room_data['updated_at'] = datetime.utcnow().isoformat()
+        now = datetime.utcnow().isoformat()
+        room_data['created_at'] = now
+        room_data['updated_at'] = now
         doc_ref.set(room_data)
         return room_data
     
@@ -213,6 +213,23 @@ class BaseRoomService(ABC):
     # --------------------------------------------------------------------- #
     # Internal helpers
     # --------------------------------------------------------------------- #
+    def _ai_suggestion_request(self, room_id: str) -> Dict[str, Any]:
+        """room_type/destination/group_preferences arguments for AIService.generate_suggestions"""
+        room, group = self.validate_room_and_group(room_id)
+        if not self.ai_service:
+            raise RuntimeError("AI service unavailable")
+
+        return {
+            "room_type": room.get("room_type", self.room_type),
+            "destination": group.get("destination", "Unknown"),
+            "group_preferences": {
+                "start_date": group.get("start_date"),
+                "end_date": group.get("end_date"),
+                "group_size": group.get("group_size"),
+                "from_location": group.get("from_location", ""),
+            },
+        }
+
     def _resolve_currency(self, group: Dict) -> str:
         from_location = group.get("from_location", "")
         if not from_location:
@@ -53,23 +53,4 @@ class DiningService(BaseRoomService):
         ]
 
     def generate_suggestions(self, room_id: str, answers: List[Dict]) -> List[Dict]:
-        room, group = self.validate_room_and_group(room_id)
-        if not self.ai_service:
-            raise RuntimeError("AI service unavailable")
-
-        destination = group.get("destination", "Unknown")
-        group_preferences = {
-            "start_date": group.get("start_date"),
-            "end_date": group.get("end_date"),
-            "group_size": group.get("group_size"),
-            "from_location": group.get("from_location", ""),
-        }
-
-        return self.ai_service.generate_suggestions(
-            room_type=room.get("room_type", "dining"),
-            destination=destination,
-            answers=answers,
-            group_preferences=group_preferences,
-        )
-
-
+        return self.ai_service.generate_suggestions(answers=answers, **self._ai_suggestion_request(room_id))
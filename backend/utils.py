@@ -1,64 +1,150 @@
+import threading
+import time
+from functools import lru_cache
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; the ordered substring scan is used without it
+    ahocorasick = None
+
+# Currency mapping based on common destinations
+CURRENCY_MAP = {
+    # Europe
+    'paris': '€', 'france': '€', 'london': '£', 'uk': '£', 'england': '£',
+    'rome': '€', 'italy': '€', 'madrid': '€', 'spain': '€', 'berlin': '€',
+    'germany': '€', 'amsterdam': '€', 'netherlands': '€', 'vienna': '€',
+    'austria': '€', 'zurich': 'CHF', 'switzerland': 'CHF', 'stockholm': 'SEK',
+    'sweden': 'SEK', 'oslo': 'NOK', 'norway': 'NOK', 'copenhagen': 'DKK',
+    'denmark': 'DKK', 'prague': 'CZK', 'czech': 'CZK', 'budapest': 'HUF',
+    'hungary': 'HUF', 'warsaw': 'PLN', 'poland': 'PLN',
+    
+    # Asia
+    'tokyo': '¥', 'japan': '¥', 'seoul': '₩', 'korea': '₩', 'south korea': '₩', 'republic of korea': '₩',
+    'singapore': 'S$', 'hong kong': 'HK$', 'bangkok': '฿', 'thailand': '฿',
+    'mumbai': '₹', 'delhi': '₹', 'india': '₹', 'bangalore': '₹', 'kolkata': '₹',
+    'chennai': '₹', 'hyderabad': '₹', 'pune': '₹', 'jaipur': '₹', 'goa': '₹',
+    'ooty': '₹', 'mysore': '₹', 'coimbatore': '₹', 'kochi': '₹', 'agra': '₹',
+    'varanasi': '₹', 'udaipur': '₹', 'jodhpur': '₹', 'amritsar': '₹', 'shimla': '₹',
+    'kuala lumpur': 'RM', 'malaysia': 'RM', 'jakarta': 'Rp', 'indonesia': 'Rp',
+    'manila': '₱', 'philippines': '₱', 'ho chi minh': '₫', 'vietnam': '₫',
+    'hanoi': '₫', 'taipei': 'NT$', 'taiwan': 'NT$',
+    
+    # Americas
+    'new york': '$', 'usa': '$', 'united states': '$', 'america': '$',
+    'los angeles': '$', 'chicago': '$', 'miami': '$', 'san francisco': '$',
+    'toronto': 'C$', 'canada': 'C$', 'vancouver': 'C$', 'montreal': 'C$',
+    'mexico city': '$', 'mexico': '$', 'buenos aires': '$', 'argentina': '$',
+    'sao paulo': 'R$', 'brazil': 'R$', 'rio de janeiro': 'R$', 'lima': 'S/',
+    'peru': 'S/', 'bogota': '$', 'colombia': '$', 'santiago': '$', 'chile': '$',
+    
+    # Middle East & Africa
+    'dubai': 'AED', 'uae': 'AED', 'abu dhabi': 'AED', 'doha': 'QAR',
+    'qatar': 'QAR', 'riyadh': 'SAR', 'saudi arabia': 'SAR', 'cairo': 'EGP',
+    'egypt': 'EGP', 'istanbul': '₺', 'turkey': '₺', 'tel aviv': '₪',
+    'israel': '₪', 'johannesburg': 'R', 'south africa': 'R', 'cape town': 'R',
+    'nairobi': 'KSh', 'kenya': 'KSh', 'lagos': '₦', 'nigeria': '₦',
+    
+    # Oceania
+    'sydney': 'A$', 'australia': 'A$', 'melbourne': 'A$', 'perth': 'A$',
+    'auckland': 'NZ$', 'new zealand': 'NZ$', 'wellington': 'NZ$'
+}
+
+# Matched in this order (first substring hit wins)
+CURRENCY_MAP_ITEMS = tuple(CURRENCY_MAP.items())
+
+# Substring-pass keys: a key containing an earlier-listed key can never be the first hit, so it is not scanned
+CURRENCY_SCAN_ITEMS = tuple(
+    (key, currency) for index, (key, currency) in enumerate(CURRENCY_MAP_ITEMS)
+    if not any(earlier in key for earlier, _ in CURRENCY_MAP_ITEMS[:index])
+)
+
+def _build_currency_automaton():
+    """Aho-Corasick automaton over the substring-pass keys; values carry map order so the first-listed key still wins"""
+    automaton = ahocorasick.Automaton()
+    for index, (key, currency) in enumerate(CURRENCY_SCAN_ITEMS):
+        automaton.add_word(key, (index, currency))
+    automaton.make_automaton()
+    return automaton
+
+CURRENCY_AUTOMATON = _build_currency_automaton() if ahocorasick is not None else None
+
+# Every two-character window of every CURRENCY_MAP key; text sharing none of them cannot match any key
+CURRENCY_KEY_BIGRAMS = frozenset(key[i:i + 2] for key in CURRENCY_MAP for i in range(len(key) - 1))
+
+def _could_match_currency_key(text):
+    """Cheap prefilter: False only when neither matching pass below can hit (one bigram walk, no table scan)"""
+    if any(len(word) == 1 for word in text.split()):
+        return True  # a lone character can still be a partial match of some key
+    return any(text[i:i + 2] in CURRENCY_KEY_BIGRAMS for i in range(len(text) - 1))
+
+@lru_cache(maxsize=4096)
 def get_currency_from_destination(destination):
-    """Determine currency based on destination"""
+    """Determine currency based on destination (memoized - the same origins/destinations repeat across requests)"""
     destination_lower = destination.lower()
     
-    # Currency mapping based on common destinations
-    currency_map = {
-        # Europe
-        'paris': '€', 'france': '€', 'london': '£', 'uk': '£', 'england': '£',
-        'rome': '€', 'italy': '€', 'madrid': '€', 'spain': '€', 'berlin': '€',
-        'germany': '€', 'amsterdam': '€', 'netherlands': '€', 'vienna': '€',
-        'austria': '€', 'zurich': 'CHF', 'switzerland': 'CHF', 'stockholm': 'SEK',
-        'sweden': 'SEK', 'oslo': 'NOK', 'norway': 'NOK', 'copenhagen': 'DKK',
-        'denmark': 'DKK', 'prague': 'CZK', 'czech': 'CZK', 'budapest': 'HUF',
-        'hungary': 'HUF', 'warsaw': 'PLN', 'poland': 'PLN',
-        
-        # Asia
-        'tokyo': '¥', 'japan': '¥', 'seoul': '₩', 'korea': '₩', 'south korea': '₩', 'republic of korea': '₩',
-        'singapore': 'S$', 'hong kong': 'HK$', 'bangkok': '฿', 'thailand': '฿',
-        'mumbai': '₹', 'delhi': '₹', 'india': '₹', 'bangalore': '₹', 'kolkata': '₹',
-        'chennai': '₹', 'hyderabad': '₹', 'pune': '₹', 'jaipur': '₹', 'goa': '₹',
-        'ooty': '₹', 'mysore': '₹', 'coimbatore': '₹', 'kochi': '₹', 'agra': '₹',
-        'varanasi': '₹', 'udaipur': '₹', 'jodhpur': '₹', 'amritsar': '₹', 'shimla': '₹',
-        'kuala lumpur': 'RM', 'malaysia': 'RM', 'jakarta': 'Rp', 'indonesia': 'Rp',
-        'manila': '₱', 'philippines': '₱', 'ho chi minh': '₫', 'vietnam': '₫',
-        'hanoi': '₫', 'taipei': 'NT$', 'taiwan': 'NT$',
-        
-        # Americas
-        'new york': '$', 'usa': '$', 'united states': '$', 'america': '$',
-        'los angeles': '$', 'chicago': '$', 'miami': '$', 'san francisco': '$',
-        'toronto': 'C$', 'canada': 'C$', 'vancouver': 'C$', 'montreal': 'C$',
-        'mexico city': '$', 'mexico': '$', 'buenos aires': '$', 'argentina': '$',
-        'sao paulo': 'R$', 'brazil': 'R$', 'rio de janeiro': 'R$', 'lima': 'S/',
-        'peru': 'S/', 'bogota': '$', 'colombia': '$', 'santiago': '$', 'chile': '$',
-        
-        # Middle East & Africa
-        'dubai': 'AED', 'uae': 'AED', 'abu dhabi': 'AED', 'doha': 'QAR',
-        'qatar': 'QAR', 'riyadh': 'SAR', 'saudi arabia': 'SAR', 'cairo': 'EGP',
-        'egypt': 'EGP', 'istanbul': '₺', 'turkey': '₺', 'tel aviv': '₪',
-        'israel': '₪', 'johannesburg': 'R', 'south africa': 'R', 'cape town': 'R',
-        'nairobi': 'KSh', 'kenya': 'KSh', 'lagos': '₦', 'nigeria': '₦',
-        
-        # Oceania
-        'sydney': 'A$', 'australia': 'A$', 'melbourne': 'A$', 'perth': 'A$',
-        'auckland': 'NZ$', 'new zealand': 'NZ$', 'wellington': 'NZ$'
-    }
+    # Fast path: a bare city/country name is a single dict probe
+    currency = CURRENCY_MAP.get(destination_lower.strip())
+    if currency:
+        return currency
+    
+    # Unknown places (no bigram in common with any key) skip both table scans
+    if not _could_match_currency_key(destination_lower):
+        return '$'
     
     # Check for exact matches first
-    for key, currency in currency_map.items():
-        if key in destination_lower:
-            return currency
+    if CURRENCY_AUTOMATON is not None:
+        # One pass over the text finds every key; the lowest map index is what the ordered scan returns
+        first_hit = min((value for _, value in CURRENCY_AUTOMATON.iter(destination_lower)), default=None)
+        if first_hit is not None:
+            return first_hit[1]
+    else:
+        for key, currency in CURRENCY_SCAN_ITEMS:
+            if key in destination_lower:
+                return currency
     
     # Check for partial matches (more flexible)
     destination_words = destination_lower.split()
     for word in destination_words:
-        for key, currency in currency_map.items():
+        for key, currency in CURRENCY_MAP_ITEMS:
             if word in key or key in word:
                 return currency
     
     # Default to USD if no match found
     return '$'
 
+def build_http_session(pool_maxsize=10, retries=2):
+    """requests.Session with a keep-alive connection pool and a small GET-only retry on connection errors and 5xx"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=retries, backoff_factor=0.2, status_forcelist=(500, 502, 503, 504), allowed_methods=frozenset(['GET'])),
+    ))
+    return session
+
+@lru_cache(maxsize=4)
+def _configure_genai(api_key):
+    """Configure genai once per API key, however many models are built on it"""
+    import google.generativeai as genai
+    
+    genai.configure(api_key=api_key)
+    return genai
+
+@lru_cache(maxsize=4)
+def get_gemini_model(api_key, model_name='gemini-2.0-flash'):
+    """Shared Gemini model per (key, model); the genai client is configured once per key and shared across models"""
+    return _configure_genai(api_key).GenerativeModel(model_name)
+
+def get_fast_gemini_model(api_key):
+    """Shared smaller-tier Gemini model (GEMINI_FAST_MODEL) for short classification/generation prompts"""
+    import os
+    
+    return get_gemini_model(api_key, os.getenv('GEMINI_FAST_MODEL', 'gemini-2.0-flash-lite'))
+
 def get_travel_type(from_location, destination):
     """Determine if travel is domestic or international using AI"""
     if not from_location or not destination:
@@ -67,15 +153,13 @@ def get_travel_type(from_location, destination):
     # Use AI to determine if travel is domestic or international
     try:
         import os
-        import google.generativeai as genai
         
         # Configure Gemini AI
         gemini_api_key = os.getenv('GEMINI_API_KEY')
         if not gemini_api_key:
             return 'international'
         
-        genai.configure(api_key=gemini_api_key)
-        model = genai.GenerativeModel('gemini-2.0-flash')
+        model = get_fast_gemini_model(gemini_api_key)
         
         # AI prompt to determine travel type
         prompt = f"""
@@ -108,3 +192,52 @@ def get_transportation_options(travel_type):
         return ['Flight', 'Train', 'Bus', 'Car rental', 'Public transport', 'Mixed']
     else:  # international
         return ['Flight', 'Mixed']
+
+class TokenBucket:
+    """Thread-safe token bucket: acquire() blocks until a token is free, so bursts are smoothed to `rate` per second"""
+
+    def __init__(self, capacity, rate):
+        self.capacity = capacity
+        self.rate = rate
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def acquire(self):
+        """Take one token, sleeping (outside the lock) until one is available"""
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class AdaptiveTokenBucket(TokenBucket):
+    """Token bucket that tunes its own rate from server feedback: additive increase on success,
+    multiplicative decrease (and an emptied bucket) when the server reports it is over quota"""
+
+    def __init__(self, capacity, rate, min_rate, max_rate, increase_step=1.0, decrease_factor=0.5):
+        super().__init__(capacity, rate)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+
+    def increase_rate(self):
+        with self._lock:
+            # Credit tokens earned at the old rate before the new one takes effect
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def decrease_rate(self):
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self._tokens = 0.0
@@ -1,8 +1,47 @@
 import os
+import time
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple, List
 
-import requests
+from utils import build_http_session
+
+# Google Weather API type codes -> human-readable descriptions
+WEATHER_TYPE_DESCRIPTIONS = {
+    "CLEAR": "Clear",
+    "CLOUDY": "Cloudy",
+    "PARTLY_CLOUDY": "Partly Cloudy",
+    "RAIN": "Rainy",
+    "SHOWERS": "Showers",
+    "THUNDERSTORMS": "Thunderstorms",
+    "SNOW": "Snowy",
+    "FOG": "Foggy",
+    "HAIL": "Hail",
+    "SLEET": "Sleet",
+    "WINDY": "Windy",
+    "EXTREME": "Extreme Weather",
+    "UNKNOWN": "Unknown",
+}
+
+# Geocode cache bounds; coordinates for a place name practically never change
+GEOCODE_CACHE_SIZE = 1024
+GEOCODE_CACHE_TTL = 86400  # seconds
+
+# Longest horizon the Weather API forecast lookup accepts
+FORECAST_MAX_DAYS = 10
+
+# Fields shared by every fallback forecast; only location/date/description vary per call
+FALLBACK_WEATHER_FIELDS = {
+    "temperature": 25,
+    "temperature_unit": "C",
+    "high_temperature": 26,
+    "low_temperature": 22,
+    "condition": "Data Unavailable",
+    "precipitation_probability": 0,
+    "humidity": 0,
+    "wind_speed": 0,
+    "icon": "",
+    "is_fallback": True,
+}
 
 
 class WeatherService:
@@ -10,7 +49,9 @@ class WeatherService:
 
     def __init__(self) -> None:
         self.api_key = os.getenv("GOOGLE_MAPS_API_KEY")
-        self._geocode_cache: Dict[str, Tuple[float, float]] = {}
+        self._geocode_cache: Dict[str, Tuple[float, Tuple[float, float]]] = {}  # location -> (timestamp, coords)
+        # Geocoding and forecast calls reuse pooled keep-alive connections to Google
+        self._session = build_http_session()
 
         if not self.api_key:
             # Don't raise error - just log warning and allow service to exist but fail gracefully
@@ -25,9 +66,10 @@ class WeatherService:
         if not location:
             return None
 
-        cached = self._geocode_cache.get(location.lower())
-        if cached:
-            return cached
+        cache_key = location.strip().lower()
+        cached = self._geocode_cache.get(cache_key)
+        if cached and time.time() - cached[0] < GEOCODE_CACHE_TTL:
+            return cached[1]
 
         if not self.api_key:
             return None
@@ -35,19 +77,35 @@ class WeatherService:
         try:
             geocode_url = "https://maps.googleapis.com/maps/api/geocode/json"
             params = {"address": location, "key": self.api_key}
-            response = requests.get(geocode_url, params=params, timeout=5)
+            response = self._session.get(geocode_url, params=params, timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 if data.get("status") == "OK" and data.get("results"):
                     location_data = data["results"][0]["geometry"]["location"]
                     coords = (location_data["lat"], location_data["lng"])
-                    self._geocode_cache[location.lower()] = coords
+                    self._geocode_cache.pop(cache_key, None)
+                    if len(self._geocode_cache) >= GEOCODE_CACHE_SIZE:
+                        # Evict the oldest entry (dicts keep insertion order)
+                        self._geocode_cache.pop(next(iter(self._geocode_cache)), None)
+                    self._geocode_cache[cache_key] = (time.time(), coords)
                     return coords
             return None
         except Exception as exc:  # pylint: disable=broad-except
             print(f"Error geocoding location '{location}': {exc}")
             return None
 
+    @staticmethod
+    def _forecast_days_needed(last_date: Optional[str]) -> int:
+        """How many forecast days (from today) to request so `last_date` is covered; the API allows at most 10"""
+        if not last_date:
+            return 1
+        try:
+            target = datetime.strptime(last_date, "%Y-%m-%d").date()
+        except ValueError:
+            return 1
+        # +2: one day because the range is inclusive, one for the location's day possibly being ahead of ours
+        return max(1, min(FORECAST_MAX_DAYS, (target - datetime.now().date()).days + 2))
+
     def get_weather_for_location(self, location: str, date: Optional[str] = None) -> Dict:
         """Get weather data for a location and optional date."""
         try:
@@ -66,10 +124,12 @@ class WeatherService:
                 "location.latitude": lat,
                 "location.longitude": lng,
                 "languageCode": "en-US",
+                # Only the days up to the requested date (smaller response)
+                "days": self._forecast_days_needed(date),
                 "key": self.api_key,
             }
 
-            response = requests.get(url, params=params, timeout=10)
+            response = self._session.get(url, params=params, timeout=10)
 
             if response.status_code == 200:
                 data = response.json()
@@ -240,22 +300,7 @@ class WeatherService:
     @staticmethod
     def _map_weather_type_to_description(weather_type: str) -> str:
         """Map Google Weather API type codes to human-readable descriptions."""
-        type_mapping = {
-            "CLEAR": "Clear",
-            "CLOUDY": "Cloudy",
-            "PARTLY_CLOUDY": "Partly Cloudy",
-            "RAIN": "Rainy",
-            "SHOWERS": "Showers",
-            "THUNDERSTORMS": "Thunderstorms",
-            "SNOW": "Snowy",
-            "FOG": "Foggy",
-            "HAIL": "Hail",
-            "SLEET": "Sleet",
-            "WINDY": "Windy",
-            "EXTREME": "Extreme Weather",
-            "UNKNOWN": "Unknown",
-        }
-        return type_mapping.get(weather_type, weather_type.replace("_", " ").title())
+        return WEATHER_TYPE_DESCRIPTIONS.get(weather_type, weather_type.replace("_", " ").title())
 
     def _get_fallback_weather(self, location: str, target_date: Optional[str] = None) -> Dict:
         """Fallback weather data if API fails."""
@@ -268,19 +313,10 @@ class WeatherService:
             description = "Weather data unavailable"
         
         fallback = {
+            **FALLBACK_WEATHER_FIELDS,
             "location": location,
             "date": date_str,
-            "temperature": 25,
-            "temperature_unit": "C",
-            "high_temperature": 26,
-            "low_temperature": 22,
-            "condition": "Data Unavailable",
             "description": description,
-            "precipitation_probability": 0,
-            "humidity": 0,
-            "wind_speed": 0,
-            "icon": "",
-            "is_fallback": True,
         }
         fallback["is_bad_weather"] = self.is_bad_weather(fallback)
         return fallback
@@ -338,10 +374,12 @@ class WeatherService:
                 "location.latitude": lat,
                 "location.longitude": lng,
                 "languageCode": "en-US",
+                # Only the days up to the end of the trip (smaller response)
+                "days": self._forecast_days_needed(end_date),
                 "key": self.api_key,
             }
 
-            response = requests.get(url, params=params, timeout=10)
+            response = self._session.get(url, params=params, timeout=10)
 
             if response.status_code == 200:
                 data = response.json()